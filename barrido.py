@@ -0,0 +1,128 @@
+"""Barrido de parámetros del planificador en paralelo (quantum x umbral x CPUs)
+
+Con un costo de cambio de contexto los quantums chicos dejan de ser gratis:
+--ordenar throughput da el quantum que más procesos completa por segundo.
+
+Ejemplos:
+    python barrido.py carga.csv --quantum 0.25 0.5 1 2 --umbral 3 5 7 --cpus 2 4 8
+    python barrido.py carga.csv --quantum 0.01 0.05 0.1 0.5 1 --cambio-contexto 0.005 --ordenar throughput
+"""
+import argparse
+import csv
+import itertools
+import sys
+from multiprocessing import Pool
+
+from motor import AsignadorUmbral
+from cargas import leer_carga
+from simular import crear_cpus, ejecutar_carga
+
+
+COLUMNAS = ('cpus', 'quantum', 'umbral', 'completados', 'throughput',
+            'waiting_media', 'waiting_p99', 'turnaround_media', 'turnaround_p99', 'sobrecarga')
+
+ORDENES = {
+    'espera': lambda f: (f['waiting_media'], f['waiting_p99']),
+    'throughput': lambda f: (-f['throughput'], f['turnaround_media']),
+}
+
+_tabla = None  # carga compartida por cada proceso trabajador
+
+
+def _iniciar(tabla):
+    global _tabla
+    _tabla = tabla
+
+
+def _ejecutar(parametros):
+    cantidad, quantum, umbral, algoritmos, cambio_contexto, costo_migracion = parametros
+    _tabla.reiniciar()
+    cpus = crear_cpus(cantidad, algoritmos, quantum)
+    asignador = AsignadorUmbral(umbral, quantum) if umbral is not None else None
+    resumen = ejecutar_carga(_tabla, cpus, asignador, None, cambio_contexto, costo_migracion)
+    return {
+        'cpus': cantidad,
+        'quantum': quantum,
+        'umbral': umbral,
+        'completados': resumen['completados'],
+        'throughput': resumen['throughput'],
+        'waiting_media': resumen['waiting']['media'],
+        'waiting_p99': resumen['waiting']['p99'],
+        'turnaround_media': resumen['turnaround']['media'],
+        'turnaround_p99': resumen['turnaround']['p99'],
+        'sobrecarga': resumen['sobrecarga'],
+    }
+
+
+def barrer(tabla, cpus=(4,), quantums=(1.0,), umbrales=(None,), algoritmos=("rr",), procesos=None,
+           cambio_contexto=0.0, costo_migracion=0.0, ordenar='espera'):
+    """Simular cada combinación de parámetros en un pool de procesos
+
+    Devuelve una fila por combinación, ordenadas por espera media o, con
+    ordenar='throughput', de mayor a menor throughput.
+    """
+    combinaciones = [(c, q, u, list(algoritmos), cambio_contexto, costo_migracion)
+                     for c, q, u in itertools.product(cpus, quantums, umbrales)]
+    with Pool(processes=procesos, initializer=_iniciar, initargs=(tabla,)) as pool:
+        filas = list(pool.imap_unordered(_ejecutar, combinaciones))
+    filas.sort(key=ORDENES[ordenar])
+    return filas
+
+
+def quantum_optimo(filas):
+    """cpus -> fila de mayor throughput (a igual throughput, menor turnaround medio)"""
+    mejores = {}
+    for f in sorted(filas, key=ORDENES['throughput']):
+        mejores.setdefault(f['cpus'], f)
+    return mejores
+
+
+def imprimir(filas, formato, salida):
+    if formato == 'csv':
+        writer = csv.DictWriter(salida, fieldnames=COLUMNAS)
+        writer.writeheader()
+        writer.writerows(filas)
+        return
+    salida.write(f"{'cpus':>5} {'quantum':>8} {'umbral':>7} {'espera media':>13} "
+                 f"{'espera p99':>11} {'throughput':>11} {'sobrecarga':>11}\n")
+    for f in filas:
+        umbral = '-' if f['umbral'] is None else f['umbral']
+        salida.write(f"{f['cpus']:>5} {f['quantum']:>8g} {umbral:>7} {f['waiting_media']:>12.3f}s "
+                     f"{f['waiting_p99']:>10.3f}s {f['throughput']:>11.4f} {f['sobrecarga']:>11.1%}\n")
+    if len({f['quantum'] for f in filas}) > 1:
+        for cantidad, f in sorted(quantum_optimo(filas).items()):
+            salida.write(f"Quantum de mayor throughput con {cantidad} CPUs: {f['quantum']:g}\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Barrido de parámetros del planificador en paralelo")
+    parser.add_argument('carga', help="archivo CSV de carga, traza .trz, carga binaria .carga o - para stdin")
+    parser.add_argument('--cpus', type=int, nargs='+', default=[4], help="cantidades de CPUs a probar")
+    parser.add_argument('--quantum', type=float, nargs='+', default=[1.0], help="quantums a probar")
+    parser.add_argument('--umbral', type=int, nargs='+', default=None,
+                        help="umbrales de prioridad a probar (sin esto no hay reparto multinivel)")
+    parser.add_argument('-a', '--algoritmo', action='append', default=[],
+                        help="algoritmo por CPU como en simular.py (rr por defecto)")
+    parser.add_argument('--cambio-contexto', type=float, default=0.0,
+                        help="segundos que pierde una CPU al pasar a otro proceso")
+    parser.add_argument('--costo-migracion', type=float, default=0.0,
+                        help="segundos extra al retomar un proceso en otra CPU")
+    parser.add_argument('--ordenar', choices=list(ORDENES), default='espera',
+                        help="espera media (por defecto) o throughput")
+    parser.add_argument('-j', '--procesos', type=int, default=None, help="procesos del pool (todos los núcleos)")
+    parser.add_argument('--formato', choices=('texto', 'csv'), default='texto')
+    args = parser.parse_args(argv)
+
+    try:
+        tabla = leer_carga(args.carga)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    filas = barrer(tabla, args.cpus, args.quantum, args.umbral or [None],
+                   args.algoritmo or ["rr"], args.procesos, args.cambio_contexto,
+                   args.costo_migracion, args.ordenar)
+    imprimir(filas, args.formato, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
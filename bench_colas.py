@@ -0,0 +1,68 @@
+"""Benchmark: colas de listos con list (sort + pop(0)) contra heap / deque
+
+Uso: python bench_colas.py [tamaño ...]
+"""
+import sys
+import time
+from random import Random
+
+from proceso import Proceso
+from colas import ColaFIFO, ColaHeap, clave_sjf
+
+DESPACHOS = 2000
+
+
+def _procesos(n, rng):
+    return [Proceso(i, f"P{i}", t, 0.0, t, None) for i, t in ((i, rng.uniform(0.1, 10.0)) for i in range(n))]
+
+
+def sjf_lista(procesos, rng):
+    # Lo que hacía _simulation_loop: ordenar la lista entera en cada tick
+    cola = list(procesos)
+    for _ in range(DESPACHOS):
+        cola.sort(key=lambda p: p.remaining_time)
+        p = cola.pop(0)
+        p.remaining_time = rng.uniform(0.1, 10.0)
+        cola.append(p)
+
+
+def sjf_heap(procesos, rng):
+    cola = ColaHeap(clave_sjf, procesos)
+    for _ in range(DESPACHOS):
+        p = cola.siguiente()
+        p.remaining_time = rng.uniform(0.1, 10.0)
+        cola.agregar(p)
+
+
+def rr_lista(procesos, rng):
+    cola = list(procesos)
+    for _ in range(DESPACHOS):
+        cola.append(cola.pop(0))
+
+
+def rr_deque(procesos, rng):
+    cola = ColaFIFO(procesos)
+    for _ in range(DESPACHOS):
+        cola.agregar(cola.siguiente())
+
+
+def medir(funcion, n):
+    rng = Random(42)
+    procesos = _procesos(n, rng)
+    inicio = time.perf_counter()
+    funcion(procesos, rng)
+    return time.perf_counter() - inicio
+
+
+def main(tamanos):
+    print(f"{DESPACHOS} despachos por caso")
+    print(f"{'cola':>8} | {'SJF list':>10} | {'SJF heap':>10} | {'x':>7} | {'RR list':>10} | {'RR deque':>10} | {'x':>7}")
+    for n in tamanos:
+        t_sl, t_sh = medir(sjf_lista, n), medir(sjf_heap, n)
+        t_rl, t_rd = medir(rr_lista, n), medir(rr_deque, n)
+        print(f"{n:>8} | {t_sl * 1e3:>8.2f}ms | {t_sh * 1e3:>8.2f}ms | {t_sl / t_sh:>6.1f}x"
+              f" | {t_rl * 1e3:>8.2f}ms | {t_rd * 1e3:>8.2f}ms | {t_rl / t_rd:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100, 1000, 10000])
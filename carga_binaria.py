@@ -0,0 +1,190 @@
+"""Formato binario de carga de ancho fijo, leído con mmap
+
+    cabecera (32 bytes)  b'CRG1', versión (uint16), tamaño de registro (uint16), n (uint64)
+    registro (32 bytes)  pid int64, cpu_time float64, arrival_time float64, cpu_id int32, priority int8
+
+Los registros van ordenados por arrival_time, así que el motor los lee en
+secuencia sin cargar el archivo: el sistema pagina el mmap y varios procesos
+que abren el mismo archivo comparten esas páginas (barrido.py en paralelo).
+No se guardan nombres (cada proceso se llama "Proceso_<pid>") ni ráfagas de
+E/S: una carga con nombres propios o con ráfagas tiene que quedarse en CSV.
+"""
+import mmap
+import os
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se empaqueta con struct
+    np = None
+
+from proceso import Proceso
+
+
+MAGIA = b'CRG1'
+VERSION = 1
+EXTENSION = '.carga'
+_CABECERA = struct.Struct('<4sHHQ16x')
+_REGISTRO = struct.Struct('<qddib3x')
+SIN_CPU = -1
+
+if np is not None:
+    DTYPE = np.dtype({
+        'names': ['pid', 'cpu_time', 'arrival_time', 'cpu_id', 'priority'],
+        'formats': ['<i8', '<f8', '<f8', '<i4', 'i1'],
+        'offsets': [0, 8, 16, 24, 28],
+        'itemsize': _REGISTRO.size,
+    })
+
+
+def escribir_binaria(ruta, lotes):
+    """Escribir lotes de columnas (pid, cpu_time, arrival_time, priority) ordenados por llegada
+
+    Sirve tal cual para Generador.lotes(); devuelve la cantidad de registros.
+    """
+    n = 0
+    ultima = float('-inf')
+    with open(ruta, 'wb') as f:
+        f.write(_CABECERA.pack(MAGIA, VERSION, _REGISTRO.size, 0))
+        for pid, cpu_time, arrival_time, priority in lotes:
+            k = len(pid)
+            if not k:
+                continue
+            if arrival_time[0] < ultima:
+                raise ValueError("los lotes deben venir ordenados por arrival_time")
+            if np is not None:
+                registros = np.zeros(k, dtype=DTYPE)
+                registros['pid'] = pid
+                registros['cpu_time'] = cpu_time
+                registros['arrival_time'] = arrival_time
+                registros['cpu_id'] = SIN_CPU
+                registros['priority'] = priority
+                if k > 1 and np.any(np.diff(registros['arrival_time']) < 0):
+                    raise ValueError("los lotes deben venir ordenados por arrival_time")
+                f.write(registros.tobytes())
+            else:
+                previa = ultima
+                for i in range(k):
+                    if arrival_time[i] < previa:
+                        raise ValueError("los lotes deben venir ordenados por arrival_time")
+                    previa = arrival_time[i]
+                    f.write(_REGISTRO.pack(pid[i], cpu_time[i], arrival_time[i], SIN_CPU, priority[i]))
+            ultima = arrival_time[k - 1]
+            n += k
+        f.seek(0)
+        f.write(_CABECERA.pack(MAGIA, VERSION, _REGISTRO.size, n))
+    return n
+
+
+def escribir_tabla(ruta, tabla):
+    """Volcar una TablaProcesos en formato binario, en orden de llegada"""
+    if tabla.rafagas:
+        raise ValueError("el formato binario no guarda ráfagas de E/S; usar CSV")
+    if tabla.nombres:
+        raise ValueError("el formato binario no guarda los nombres de los procesos; usar CSV")
+    orden = tabla.orden_llegada()
+    if np is not None:
+        columnas = tuple(tabla.columna(c)[orden] for c in ('pid', 'cpu_time', 'arrival_time', 'priority'))
+    else:
+        columnas = tuple([getattr(tabla, c)[i] for i in orden] for c in ('pid', 'cpu_time', 'arrival_time', 'priority'))
+    return escribir_binaria(ruta, [columnas])
+
+
+class CargaMapeada:
+    """Carga binaria abierta con mmap; misma interfaz que TablaProcesos para el motor
+
+    alimentar() entrega los procesos en orden de llegada leyendo el archivo por
+    bloques y metricas() usa los agregados en línea del motor, así que la
+    memoria no crece con la cantidad de procesos. Al serializarse (pickle) solo
+    viaja la ruta: cada trabajador del barrido vuelve a mapear el archivo.
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self._abrir()
+
+    def _abrir(self):
+        with open(self.ruta, 'rb') as f:
+            self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magia, version, tamano, self._n = _CABECERA.unpack_from(self._mapa, 0)
+        if magia != MAGIA or version != VERSION or tamano != _REGISTRO.size:
+            self._mapa.close()
+            raise ValueError(f"{self.ruta}: no es una carga binaria {MAGIA!r} v{VERSION}")
+        if len(self._mapa) < _CABECERA.size + self._n * _REGISTRO.size:
+            self._mapa.close()
+            raise ValueError(f"{self.ruta}: archivo truncado")
+        self._metricas = None
+
+    def __getstate__(self):
+        # Ruta absoluta: un punto de control puede reanudarse desde otro directorio
+        return {'ruta': os.path.abspath(self.ruta)}
+
+    def __setstate__(self, estado):
+        self.ruta = estado['ruta']
+        self._abrir()
+
+    def __len__(self):
+        return self._n
+
+    def proceso(self, i):
+        pid, cpu_time, arrival, cpu_id, priority = _REGISTRO.unpack_from(self._mapa, _CABECERA.size + i * _REGISTRO.size)
+        return Proceso(pid, f"Proceso_{pid}", cpu_time, arrival, cpu_time,
+                       None if cpu_id == SIN_CPU else cpu_id, priority)
+
+    def por_llegada(self, bloque=8192):
+        """Procesos en orden de llegada, desempaquetando `bloque` registros por vez"""
+        return _CursorMapeado(self, bloque)
+
+    # Interfaz de carga usada por simular.ejecutar_carga y barrido
+    def alimentar(self, motor):
+        self._metricas = motor.metricas
+        motor.agregar_fuente(self.por_llegada())
+
+    def reconectar(self, motor):
+        """Tomar las métricas de un motor restaurado de un punto de control"""
+        self._metricas = motor.metricas
+
+    def metricas(self):
+        return self._metricas.resumen()
+
+    def reiniciar(self):
+        self._metricas = None
+
+    def cerrar(self):
+        self._mapa.close()
+
+
+class _CursorMapeado:
+    """Iterador de CargaMapeada.por_llegada; al serializarse solo guarda la posición"""
+
+    def __init__(self, carga, bloque=8192, posicion=0):
+        self.carga = carga
+        self.bloque = bloque
+        self.posicion = posicion  # índice del próximo registro a entregar
+        self._pendientes = iter(())
+
+    def __getstate__(self):
+        return {'carga': self.carga, 'bloque': self.bloque, 'posicion': self.posicion}
+
+    def __setstate__(self, estado):
+        self.__init__(estado['carga'], estado['bloque'], estado['posicion'])
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        registro = next(self._pendientes, None)
+        if registro is None:
+            desde = self.posicion
+            if desde >= len(self.carga):
+                raise StopIteration
+            hasta = min(desde + self.bloque, len(self.carga))
+            with memoryview(self.carga._mapa) as vista:
+                bloque = vista[_CABECERA.size + desde * _REGISTRO.size:_CABECERA.size + hasta * _REGISTRO.size]
+                self._pendientes = iter(list(_REGISTRO.iter_unpack(bloque)))
+                bloque.release()
+            registro = next(self._pendientes)
+        self.posicion += 1
+        pid, cpu_time, arrival, cpu_id, priority = registro
+        return Proceso(pid, f"Proceso_{pid}", cpu_time, arrival, cpu_time,
+                       None if cpu_id == SIN_CPU else cpu_id, priority)
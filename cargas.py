@@ -0,0 +1,125 @@
+"""Lectura y escritura de cargas de procesos (CSV, trazas .trz y binarias .carga)
+
+Ejemplos (pasar una traza del host a CSV para editarla a mano, o un CSV a
+binaria para abrirlo con mmap en barridos grandes):
+    python cargas.py host.trz host.csv
+    python cargas.py carga.csv carga.carga
+"""
+import argparse
+import csv
+import sys
+from contextlib import contextmanager
+
+from tabla_procesos import TablaProcesos
+
+
+# Columnas de un archivo de carga CSV; solo pid y cpu_time son obligatorias
+CAMPOS_CARGA = ('pid', 'nombre', 'cpu_time', 'arrival_time', 'priority')
+# Columna opcional con ráfagas CPU/E/S separadas por ';', p. ej. "3;disco:2;1.5;red:0.4;2"
+# (las de E/S son [dispositivo:]segundos); si está, cpu_time puede faltar
+CAMPO_RAFAGAS = 'rafagas'
+
+
+def parsear_rafagas(texto):
+    """'3;disco:2;1.5;0.4;2' -> (3.0, ('disco', 2.0), 1.5, 0.4, 2.0)"""
+    rafagas = []
+    for i, parte in enumerate(texto.split(';')):
+        dispositivo, _, duracion = parte.strip().rpartition(':')
+        if i % 2 == 0 and dispositivo:
+            raise ValueError(f"la ráfaga {i + 1} es de CPU y no lleva dispositivo: {parte}")
+        duracion = float(duracion)
+        if duracion < 0:
+            raise ValueError(f"ráfaga negativa: {parte}")
+        rafagas.append((dispositivo, duracion) if dispositivo else duracion)
+    return tuple(rafagas)
+
+
+def formatear_rafagas(rafagas):
+    """Inversa de parsear_rafagas"""
+    return ';'.join(f"{r[0]}:{r[1]}" if isinstance(r, tuple) else str(r) for r in rafagas)
+
+
+@contextmanager
+def abrir(archivo, modo):
+    """Aceptar una ruta, '-' (stdin/stdout) o un archivo ya abierto"""
+    if archivo == '-':
+        yield sys.stdin if 'r' in modo else sys.stdout
+    elif isinstance(archivo, str):
+        with open(archivo, modo, newline='', encoding='utf-8') as f:
+            yield f
+    else:
+        yield archivo
+
+
+def leer_carga(archivo):
+    """Leer una carga CSV (o una traza .trz del host) en una TablaProcesos
+
+    Una carga binaria .carga no se lee: se abre con mmap (CargaMapeada).
+    """
+    if isinstance(archivo, str) and archivo.endswith('.trz'):
+        from trazas import cargar_traza  # solo las trazas necesitan psutil
+        return cargar_traza(archivo)
+    if isinstance(archivo, str) and archivo.endswith('.carga'):
+        from carga_binaria import CargaMapeada
+        return CargaMapeada(archivo)
+    tabla = TablaProcesos()
+    with abrir(archivo, 'r') as f:
+        reader = csv.DictReader(f)
+        campos = set(reader.fieldnames or ())
+        if 'pid' not in campos or not campos & {'cpu_time', CAMPO_RAFAGAS}:
+            raise ValueError("la carga debe tener al menos las columnas pid y cpu_time (o rafagas)")
+        for linea, fila in enumerate(reader, start=2):
+            try:
+                pid = int(fila['pid'])
+                rafagas = fila.get(CAMPO_RAFAGAS)
+                tabla.agregar(
+                    pid,
+                    float(fila.get('cpu_time')) if not rafagas else None,
+                    float(fila.get('arrival_time') or 0.0),
+                    int(fila.get('priority') or 5),
+                    nombre=fila.get('nombre') or None,
+                    rafagas=parsear_rafagas(rafagas) if rafagas else None,
+                )
+            except (TypeError, ValueError):
+                raise ValueError(f"línea {linea}: valores inválidos {fila}") from None
+    return tabla
+
+
+def escribir_carga(archivo, procesos):
+    """Escribir procesos (cualquier iterable de Proceso) como carga CSV"""
+    with abrir(archivo, 'w') as f:
+        writer = csv.writer(f)
+        writer.writerow(CAMPOS_CARGA + (CAMPO_RAFAGAS,))
+        for p in procesos:
+            rafagas = formatear_rafagas(p.rafagas.rafagas) if p.rafagas is not None else ''
+            writer.writerow((p.pid, p.nombre, p.cpu_time, p.arrival_time, p.priority, rafagas))
+
+
+def convertir(origen, destino):
+    """Leer la carga `origen` (CSV, .trz o .carga) y escribirla en `destino`
+
+    El destino es binario si termina en .carga y CSV en cualquier otro caso.
+    """
+    carga = leer_carga(origen)
+    if isinstance(destino, str) and destino.endswith('.carga'):
+        from carga_binaria import escribir_tabla
+        if not isinstance(carga, TablaProcesos):
+            carga = TablaProcesos.desde_procesos(carga.por_llegada())
+        return escribir_tabla(destino, carga)
+    escribir_carga(destino, carga.por_llegada())
+    return len(carga)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convertir una carga de procesos entre CSV y binaria .carga")
+    parser.add_argument('origen', help="carga CSV, traza .trz o carga binaria .carga (- para stdin)")
+    parser.add_argument('destino', nargs='?', default='-', help="CSV de salida (- para stdout) o binaria .carga")
+    args = parser.parse_args(argv)
+    try:
+        convertir(args.origen, args.destino)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+import heapq
+import itertools
+from collections import deque
+
+from metricas import Acumulador
+
+
+# Multinivel con retroalimentación: quantum de cada nivel (0 es el más prioritario)
+QUANTA_MULTINIVEL = (0.5, 1.0, 2.0, 4.0)
+BOOST_MULTINIVEL = 20.0  # cada cuánto vuelven todos al nivel 0 (None: nunca)
+
+# Algoritmos en los que una llegada puede desalojar al proceso en ejecución
+EXPROPIATIVOS = ("SRTF", "Prioridad Expropiativa")
+
+
+class ColaFIFO:
+    """Cola de listos FIFO (FCFS / Round Robin) sobre un deque: O(1) por despacho"""
+
+    def __init__(self, procesos=()):
+        self._cola = deque(procesos)
+
+    def agregar(self, proceso, ahora=0.0):
+        self._cola.append(proceso)
+
+    def reencolar(self, proceso, ahora=0.0):
+        """Vuelve tras agotar su quantum"""
+        self._cola.append(proceso)
+
+    def siguiente(self, ahora=0.0):
+        return self._cola.popleft()
+
+    def quitar_ultimo(self):
+        return self._cola.pop()
+
+    def eliminar(self, proceso):
+        self._cola.remove(proceso)
+
+    def limpiar(self):
+        self._cola.clear()
+
+    def __len__(self):
+        return len(self._cola)
+
+    def __iter__(self):
+        return iter(self._cola)
+
+    def __contains__(self, proceso):
+        return proceso in self._cola
+
+
+class ColaHeap:
+    """Cola de listos ordenada por una clave (SJF, prioridad...): O(log n) por despacho
+
+    A igual clave se respeta el orden de llegada a la cola.
+    """
+
+    def __init__(self, clave, procesos=()):
+        self.clave = clave
+        self._seq = itertools.count()
+        self._heap = [(clave(p), next(self._seq), p) for p in procesos]
+        heapq.heapify(self._heap)
+
+    def agregar(self, proceso, ahora=0.0):
+        heapq.heappush(self._heap, (self.clave(proceso), next(self._seq), proceso))
+
+    def reencolar(self, proceso, ahora=0.0):
+        self.agregar(proceso)
+
+    def __getstate__(self):
+        # itertools.count no se puede serializar: se guarda el próximo valor
+        estado = self.__dict__.copy()
+        estado['_seq'] = next(self._seq)
+        return estado
+
+    def __setstate__(self, estado):
+        estado['_seq'] = itertools.count(estado['_seq'])
+        self.__dict__.update(estado)
+
+    def siguiente(self, ahora=0.0):
+        return heapq.heappop(self._heap)[2]
+
+    def primero(self):
+        return self._heap[0][2]
+
+    def quitar_ultimo(self):
+        # El "último" es el de peor clave; se busca entre las hojas del heap
+        hojas = range(len(self._heap) // 2, len(self._heap))
+        idx = max(hojas, key=lambda i: self._heap[i][:2])
+        entrada = self._heap[idx]
+        ultimo = self._heap.pop()
+        if idx < len(self._heap):
+            self._heap[idx] = ultimo
+            heapq.heapify(self._heap)
+        return entrada[2]
+
+    def eliminar(self, proceso):
+        # Poco frecuente (solo desde la GUI): O(n)
+        for idx, entrada in enumerate(self._heap):
+            if entrada[2] is proceso:
+                ultimo = self._heap.pop()
+                if idx < len(self._heap):
+                    self._heap[idx] = ultimo
+                    heapq.heapify(self._heap)
+                return
+        raise ValueError("el proceso no está en la cola")
+
+    def limpiar(self):
+        self._heap.clear()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        # En orden de despacho (solo para mostrar)
+        return (entrada[2] for entrada in sorted(self._heap))
+
+    def __contains__(self, proceso):
+        return any(entrada[2] is proceso for entrada in self._heap)
+
+
+class ColaMultinivel:
+    """Cola multinivel con retroalimentación (MLFQ)
+
+    Un deque por nivel y un mapa de bits de niveles no vacíos: el nivel a
+    despachar es el bit más bajo encendido, O(1) sin recorrer niveles. Los que
+    llegan entran al nivel 0; quien agota el quantum de su nivel baja uno y
+    quien lo deja para hacer E/S vuelve al mismo nivel.
+    Contra la inanición: quien espera más de `envejecimiento` segundos en un
+    nivel sube uno, y cada `boost` segundos todos vuelven al nivel 0.
+    `espera_por_nivel` acumula cuánto esperó cada despacho en su nivel.
+
+    Cada entrada es [proceso, encolado, en_nivel]; `ahora` es el tiempo simulado.
+    La cola no recuerda el nivel de los procesos en ejecución: siguiente()
+    deja (nivel, ahora) en `ultimo` y la CPU lo devuelve al reencolar, así
+    varias CPUs pueden compartir la cola.
+    """
+
+    def __init__(self, procesos=(), quanta=QUANTA_MULTINIVEL, boost=BOOST_MULTINIVEL, envejecimiento=None):
+        self.quanta = tuple(quanta)
+        self.boost = boost
+        self.envejecimiento = envejecimiento
+        self.espera_por_nivel = [Acumulador() for _ in self.quanta]
+        self._niveles = [deque() for _ in self.quanta]
+        self._mapa = 0  # bit i encendido <=> nivel i no vacío
+        self._ultimo_boost = 0.0
+        self.ultimo = None  # (nivel, tiempo) del último despacho
+        for proceso in procesos:
+            self.agregar(proceso)
+
+    def _poner(self, nivel, entrada):
+        self._niveles[nivel].append(entrada)
+        self._mapa |= 1 << nivel
+
+    def agregar(self, proceso, ahora=0.0):
+        self._poner(0, [proceso, ahora, ahora])
+
+    def reencolar(self, proceso, ahora=0.0, despacho=None):
+        """Agotó el quantum: baja un nivel (el último nivel es Round Robin)
+
+        `despacho` es el `ultimo` de cuando se lo despachó; si hubo un boost
+        mientras corría, vuelve al nivel 0.
+        """
+        nivel = 0
+        if despacho is not None and despacho[1] >= self._ultimo_boost:
+            nivel = min(despacho[0] + 1, len(self.quanta) - 1)
+        self._poner(nivel, [proceso, ahora, ahora])
+
+    def retomar(self, proceso, ahora=0.0, despacho=None):
+        """Vuelve de una E/S sin haber agotado el quantum: queda en su nivel
+
+        `despacho` es el `ultimo` de su último despacho (nivel 0 si no se sabe
+        o si hubo un boost desde entonces).
+        """
+        nivel = 0
+        if despacho is not None and despacho[1] >= self._ultimo_boost:
+            nivel = min(despacho[0], len(self.quanta) - 1)
+        self._poner(nivel, [proceso, ahora, ahora])
+
+    def siguiente(self, ahora=0.0):
+        if self.boost is not None and ahora - self._ultimo_boost >= self.boost:
+            self._subir_todos(ahora)
+        if self.envejecimiento is not None:
+            self._envejecer(ahora)
+        mapa = self._mapa
+        nivel = (mapa & -mapa).bit_length() - 1
+        cola = self._niveles[nivel]
+        proceso, encolado, _ = cola.popleft()
+        if not cola:
+            self._mapa &= ~(1 << nivel)
+        self.espera_por_nivel[nivel].agregar(ahora - encolado)
+        self.ultimo = (nivel, ahora)
+        return proceso
+
+    def _subir_todos(self, ahora):
+        self._ultimo_boost = ahora
+        primero = self._niveles[0]
+        for cola in self._niveles[1:]:
+            for entrada in cola:
+                entrada[2] = ahora
+            primero.extend(cola)
+            cola.clear()
+        self._mapa = 1 if primero else 0
+
+    def _envejecer(self, ahora):
+        # Las cabezas son las que más esperan en su nivel: O(niveles + promovidos)
+        limite = ahora - self.envejecimiento
+        for nivel in range(1, len(self._niveles)):
+            cola = self._niveles[nivel]
+            while cola and cola[0][2] <= limite:
+                entrada = cola.popleft()
+                entrada[2] = ahora
+                self._poner(nivel - 1, entrada)
+            if not cola:
+                self._mapa &= ~(1 << nivel)
+
+    def quitar_ultimo(self):
+        # El último del nivel más bajo ocupado
+        nivel = self._mapa.bit_length() - 1
+        cola = self._niveles[nivel]
+        proceso = cola.pop()[0]
+        if not cola:
+            self._mapa &= ~(1 << nivel)
+        return proceso
+
+    def eliminar(self, proceso):
+        for nivel, cola in enumerate(self._niveles):
+            for entrada in cola:
+                if entrada[0] is proceso:
+                    cola.remove(entrada)
+                    if not cola:
+                        self._mapa &= ~(1 << nivel)
+                    return
+        raise ValueError("el proceso no está en la cola")
+
+    def limpiar(self):
+        for cola in self._niveles:
+            cola.clear()
+        self._mapa = 0
+
+    def __len__(self):
+        return sum(len(cola) for cola in self._niveles)
+
+    def __iter__(self):
+        # En orden de despacho: nivel 0 primero
+        return (entrada[0] for cola in self._niveles for entrada in cola)
+
+    def __contains__(self, proceso):
+        return any(entrada[0] is proceso for cola in self._niveles for entrada in cola)
+
+
+def clave_sjf(proceso):
+    return proceso.remaining_time
+
+
+def clave_prioridad(proceso):
+    return -proceso.priority  # mayor número => mayor prioridad
+
+
+def crear_cola(algorithm, procesos=()):
+    """Estructura de cola adecuada para cada algoritmo"""
+    if algorithm in ("SJF", "SRTF"):
+        return ColaHeap(clave_sjf, procesos)
+    if algorithm in ("Prioridad", "Prioridad Expropiativa"):
+        return ColaHeap(clave_prioridad, procesos)
+    if algorithm == "Multinivel":
+        return ColaMultinivel(procesos)
+    return ColaFIFO(procesos)
@@ -1,41 +1,115 @@
+import os
 import time
+from collections import deque
 
 from proceso import Proceso
+from colas import crear_cola, ColaMultinivel
 
 
 
 class CPU:
     def __init__(self, id):
         self.id = id
-        self.procesos = []  # Cola de procesos asignados
-        self.algorithm = "FCFS"  # Algoritmo por defecto
-        self.quantum = None  # Quantum solo aplicable a Round Robin
+        self._algorithm = "FCFS"  # Algoritmo por defecto
+        self.procesos = crear_cola(self._algorithm)  # Cola de procesos asignados (listos)
+        self._quantum = None  # Quantum solo aplicable a Round Robin
+
+        # Estado usado por el motor de simulación
+        self.actual = None  # Proceso en ejecución (fuera de la cola)
+        self.inicio_slice = 0.0  # Desde cuándo corre actual sin contabilizar
+        self.generacion = 0  # Invalida eventos de fin de slice obsoletos
+        self.carga = 0.0  # trabajo restante asignado (cola + actual), para el despachador
+        self.ocupado = 0.0  # tiempo simulado ejecutando procesos
+        self.sobrecarga = 0.0  # tiempo perdido en cambios de contexto y migraciones
+        self.ultimo_pid = None  # último proceso despachado: volver a él no cambia de contexto
+        self.grupo = None  # GrupoCPU si comparte la cola de listos con otras CPUs
+        self.nivel = None  # Multinivel: (nivel, tiempo) del último despacho
+
+    @property
+    def algorithm(self):
+        return self._algorithm
+
+    @algorithm.setter
+    def algorithm(self, algorithm):
+        # Cambiar de algoritmo reconstruye la cola con la estructura adecuada
+        # (heap para SJF, deque para FCFS/RR) conservando los procesos encolados
+        if algorithm != self._algorithm:
+            self._usar_cola(crear_cola(algorithm, list(self.procesos)), algorithm)
+
+    @property
+    def quantum(self):
+        # En un grupo el quantum, como la cola y el algoritmo, es de todo el grupo
+        return self.grupo.quantum if self.grupo is not None else self._quantum
+
+    @quantum.setter
+    def quantum(self, quantum):
+        if self.grupo is not None:
+            self.grupo.quantum = quantum
+        else:
+            self._quantum = quantum
+
+    def _usar_cola(self, cola, algorithm):
+        # En un grupo la cola es compartida: el cambio alcanza a todas sus CPUs
+        for cpu in self.grupo.cpus if self.grupo is not None else (self,):
+            cpu.procesos = cola
+            cpu._algorithm = algorithm
 
     def limpiar_procesos(self):
-        self.procesos = []
-
-    def asignar_proceso(self, proceso):
-        self.procesos.append(proceso)
+        # Vaciar en el lugar: conserva los parámetros de la cola (quanta de
+        # Multinivel) y, en un grupo, la cola compartida con las demás CPUs
+        self.procesos.limpiar()
+        self.actual = None
+        self.carga = 0.0
+        self.generacion += 1
+        if self.grupo is not None:
+            self.grupo.libres[self.id] = self
+
+    def configurar_multinivel(self, quanta, boost=None, envejecimiento=None):
+        """Pasar a Multinivel (MLFQ) con un quantum por nivel"""
+        self._usar_cola(ColaMultinivel(list(self.procesos), quanta, boost, envejecimiento), "Multinivel")
+
+    def asignar_proceso(self, proceso, ahora=0.0):
+        self.procesos.agregar(proceso, ahora)
+
+    def reencolar(self, proceso, ahora=0.0):
+        """Devolver a la cola un proceso que agotó su quantum"""
+        if self._algorithm == "Multinivel":
+            self.procesos.reencolar(proceso, ahora, self.nivel)
+        else:
+            self.procesos.reencolar(proceso, ahora)
+
+    def retomar(self, proceso, ahora=0.0, nivel=None):
+        """Devolver a la cola un proceso que terminó una E/S (Multinivel: al nivel del que salió)"""
+        if self._algorithm == "Multinivel":
+            self.procesos.retomar(proceso, ahora, nivel)
+        else:
+            self.procesos.agregar(proceso, ahora)
+
+    def quantum_para(self, proceso):
+        """Quantum del slice de `proceso`, recién despachado (None: corre hasta terminar)"""
+        if self._algorithm == "Round Robin":
+            return self.quantum
+        if self._algorithm == "Multinivel":
+            # el nivel lo guarda la CPU: con una cola compartida varias despachan a la vez
+            self.nivel = self.procesos.ultimo
+            return self.procesos.quanta[self.nivel[0]]
+        return None
 
     def ejecutar_algoritmo(self):
-
-        if self.algorithm == "SJF":
-            self.procesos.sort(key=lambda p: p.cpu_time)  # ordena por tiempo de CPU más corto
-
-        elif self.algorithm == "Round Robin" and self.quantum is not None:
-            # Convertir la lista de procesos en segmentos según quantum (solo para mostrar)
-            self.procesos = self.round_robin_simulation(self.procesos, self.quantum)
-
-        elif self.algorithm == "FCFS":
-            self.procesos = self.procesos
+        # Devuelve el orden de ejecución previsto (solo para mostrar);
+        # la cola ya está ordenada según el algoritmo
+        if self.algorithm == "Round Robin" and self.quantum is not None:
+            # Convertir la lista de procesos en segmentos según quantum
+            return self.round_robin_simulation(list(self.procesos), self.quantum)
+        return list(self.procesos)
 
     def round_robin_simulation(self, procesos, quantum):
-        cola = procesos[:] 
+        cola = deque(procesos)
         resultado = []
         tiempo_restante = {p.pid: p.cpu_time for p in procesos}  # dict {pid -> tiempo que aun necesita}
 
         while cola:
-            proceso = cola.pop(0)  # saca primer proceso
+            proceso = cola.popleft()  # saca primer proceso
 
             if tiempo_restante[proceso.pid] > quantum:
                 # proceso tiene más tiempo que el quantum!!!!!!!!!!!!!
@@ -62,4 +136,57 @@ class CPU:
 
     # devuelve los procesos directamente
     def get_cola_procesos(self):
-        return self.procesos
\ No newline at end of file
+        return self.procesos
+
+class GrupoCPU:
+    """CPUs que comparten una cola de listos, como los núcleos de un nodo NUMA
+
+    El algoritmo y el quantum de la primera CPU pasan a ser los de todo el
+    grupo (CPU.quantum lee y escribe el del grupo). `libres`
+    son las CPUs del grupo sin proceso: el motor despacha en una de ellas lo
+    que llega a la cola compartida sin recorrer el grupo.
+    """
+
+    def __init__(self, id, cpus):
+        self.id = id
+        self.cpus = list(cpus)
+        primera = self.cpus[0]
+        self.quantum = primera.quantum
+        procesos = [p for cpu in self.cpus for p in cpu.procesos]
+        for cpu in self.cpus:
+            cpu.grupo = self
+        cola = primera.procesos
+        if isinstance(cola, ColaMultinivel):
+            cola = ColaMultinivel(procesos, cola.quanta, cola.boost, cola.envejecimiento)
+        else:
+            cola = crear_cola(primera.algorithm, procesos)
+        primera._usar_cola(cola, primera.algorithm)
+        self.libres = {cpu.id: cpu for cpu in self.cpus if cpu.actual is None}
+
+    def libre(self):
+        """Una CPU sin proceso del grupo, o None"""
+        return next(iter(self.libres.values()), None)
+
+
+def cpus_del_host(logicas=True):
+    """Cantidad de CPUs del host según psutil (os.cpu_count si no está instalado)"""
+    try:
+        import psutil
+    except ImportError:
+        return os.cpu_count() or 1
+    return psutil.cpu_count(logical=logicas) or os.cpu_count() or 1
+
+
+def crear_topologia(cantidad, por_grupo=1, primer_id=1):
+    """`cantidad` CPUs; con por_grupo > 1 se agrupan de a `por_grupo` compartiendo cola"""
+    cpus = [CPU(id=primer_id + i) for i in range(cantidad)]
+    agrupar(cpus, por_grupo)
+    return cpus
+
+
+def agrupar(cpus, por_grupo):
+    """Formar grupos consecutivos de `por_grupo` CPUs (1 = cada CPU con su cola)"""
+    if por_grupo > 1:
+        for g, i in enumerate(range(0, len(cpus), por_grupo), start=1):
+            GrupoCPU(g, cpus[i:i + por_grupo])
+    return cpus
@@ -0,0 +1,177 @@
+"""Despachador global: reparto de llegadas y balanceo de carga entre CPUs
+
+Un asignador del motor es cualquier callable (cpus, proceso) -> cpu. El
+Despachador además puede:
+    robar(cpus, libre)  una CPU que se queda sin trabajo toma el último
+                        proceso de la cola más larga (work stealing)
+    balancear(cpus)     cada `periodo` segundos simulados, mover procesos de
+                        la CPU más cargada a la menos cargada
+La carga de una CPU es el trabajo restante de su cola más el de su proceso en
+ejecución (CPU.carga, que mantiene el motor). Las CPUs de un grupo comparten
+la cola, así que se reparten y balancean como una sola unidad.
+
+El motor avisa con actualizar(cpu) cada cambio de carga o de cola, y el
+Despachador guarda las unidades en montículos por carga y por largo de cola:
+colocar una llegada o elegir a quién robar cuesta O(log unidades), sin
+recorrer las CPUs en cada evento.
+"""
+import heapq
+
+from motor import AsignadorRotativo
+
+
+COLOCACIONES = ('rotativa', 'menor_carga')
+
+# Estrategias con nombre para simular.py y la GUI
+ESTRATEGIAS = {
+    'rotativo': {'colocacion': 'rotativa'},
+    'menor-carga': {'colocacion': 'menor_carga'},
+    'robo': {'colocacion': 'rotativa', 'robo': True},
+    'migracion': {'colocacion': 'menor_carga', 'robo': True, 'periodo': 5.0},
+}
+
+
+class Despachador:
+    """Asignador con colocación configurable, robo de trabajo y migración periódica
+
+    colocacion: 'rotativa' (idx % cpus) o 'menor_carga' (la de menos trabajo
+    restante). robo: las CPUs ociosas roban de la cola más larga. periodo:
+    segundos entre balanceos (None: sin migración); se migra mientras la
+    CPU más cargada supere a la media en más de `tolerancia` (fracción).
+    """
+
+    def __init__(self, colocacion='menor_carga', robo=False, periodo=None, tolerancia=0.25):
+        if colocacion not in COLOCACIONES:
+            raise ValueError(f"colocacion debe ser una de {COLOCACIONES}")
+        self.colocacion = colocacion
+        self.robo = robo
+        self.periodo = periodo
+        self.tolerancia = tolerancia
+        self._rotativo = AsignadorRotativo()
+        # Montículos (clave, id de la cabeza de la unidad) con entradas vencidas
+        # perezosas: vale la que coincide con la clave vigente en el dict
+        self._cpus = None  # lista de CPUs a la que corresponden los montículos
+        self._por_carga = []  # clave: (sin CPU libre, carga media)
+        self._por_cola = []  # clave: -procesos en cola
+        self._carga = {}  # id de la cabeza -> clave de carga vigente
+        self._cola = {}  # id de la cabeza -> clave de cola vigente
+        self._cabezas = {}  # id de la cabeza -> primera CPU de la unidad
+
+    def __call__(self, cpus, proceso):
+        if self.colocacion == 'rotativa':
+            return self._rotativo(cpus, proceso)
+        self._seguir(cpus)
+        return self._tope(self._por_carga, self._carga)
+
+    def robar(self, cpus, libre):
+        """CPU de la que `libre` toma el último de la cola, o None"""
+        if not self.robo:
+            return None
+        self._seguir(cpus)
+        victima = self._tope(self._por_cola, self._cola)
+        if victima.procesos is libre.procesos or not victima.procesos:
+            return None
+        return victima
+
+    def actualizar(self, cpu):
+        """Aviso del motor: cambió la carga o la cola de `cpu` (None: cambió la topología)"""
+        if cpu is None:
+            self._cpus = None
+        elif self._cpus is not None:
+            self._anotar(_cabeza(cpu))
+
+    def _seguir(self, cpus):
+        """Armar los montículos la primera vez o si cambiaron las CPUs: O(CPUs)"""
+        if cpus is self._cpus:
+            return
+        self._cpus = cpus
+        self._cabezas = {unidad[0].id: unidad[0] for unidad in _unidades(cpus)}
+        self._carga = {i: _clave_carga(c) for i, c in self._cabezas.items()} if self.colocacion == 'menor_carga' else {}
+        self._cola = {i: -len(c.procesos) for i, c in self._cabezas.items()} if self.robo else {}
+        self._rehacer()
+
+    def _anotar(self, cabeza):
+        i = cabeza.id
+        if self._carga:
+            clave = _clave_carga(cabeza)
+            if self._carga[i] != clave:
+                self._carga[i] = clave
+                heapq.heappush(self._por_carga, (clave, i))
+        if self._cola:
+            clave = -len(cabeza.procesos)
+            if self._cola[i] != clave:
+                self._cola[i] = clave
+                heapq.heappush(self._por_cola, (clave, i))
+        if len(self._por_carga) + len(self._por_cola) > 8 * len(self._cabezas) + 64:
+            self._rehacer()  # descartar las entradas vencidas: O(1) amortizado
+
+    def _rehacer(self):
+        self._por_carga = [(clave, i) for i, clave in self._carga.items()]
+        self._por_cola = [(clave, i) for i, clave in self._cola.items()]
+        heapq.heapify(self._por_carga)
+        heapq.heapify(self._por_cola)
+
+    def _tope(self, monticulo, vigentes):
+        """Cabeza de la mejor unidad, descartando las entradas vencidas del tope"""
+        while monticulo[0][0] != vigentes[monticulo[0][1]]:
+            heapq.heappop(monticulo)
+        return self._cabezas[monticulo[0][1]]
+
+    def balancear(self, cpus):
+        """Pares (origen, destino) a migrar, un proceso cada uno"""
+        unidades = list(_unidades(cpus))
+        if len(unidades) < 2:
+            return []
+        # carga por CPU de cada unidad (un grupo reparte su cola entre sus CPUs)
+        cargas = [sum(map(_carga, u)) / len(u) for u in unidades]
+        en_cola = [len(u[0].procesos) for u in unidades]
+        media = sum(cargas) / len(cargas)
+        movimientos = []
+        for _ in range(len(unidades)):
+            origen = max((i for i in range(len(unidades)) if en_cola[i]), key=cargas.__getitem__, default=None)
+            destino = min(range(len(unidades)), key=cargas.__getitem__)
+            if origen is None or origen == destino or cargas[origen] <= media * (1 + self.tolerancia):
+                break
+            # estimación: se mueve la carga media de un proceso de la cola de origen
+            movido = cargas[origen] * len(unidades[origen]) / (en_cola[origen] + 1)
+            if cargas[destino] + movido / len(unidades[destino]) >= cargas[origen]:
+                break
+            cargas[origen] -= movido / len(unidades[origen])
+            cargas[destino] += movido / len(unidades[destino])
+            en_cola[origen] -= 1
+            movimientos.append((unidades[origen][0], unidades[destino][0]))
+        return movimientos
+
+
+def crear_despachador(estrategia, periodo=None):
+    """Despachador de una estrategia de ESTRATEGIAS (`periodo` pisa el de la estrategia)"""
+    opciones = dict(ESTRATEGIAS[estrategia])
+    if periodo is not None:
+        opciones['periodo'] = periodo or None
+    return Despachador(**opciones)
+
+
+def _unidades(cpus):
+    """CPUs agrupadas por cola: una lista por grupo, o de una sola CPU"""
+    unidades = {}
+    for cpu in cpus:
+        unidades.setdefault(id(cpu.procesos), []).append(cpu)
+    return unidades.values()
+
+
+def _cabeza(cpu):
+    """Primera CPU de la unidad de `cpu` (su grupo, o ella misma)"""
+    return cpu.grupo.cpus[0] if cpu.grupo is not None else cpu
+
+
+def _clave_carga(cabeza):
+    """Orden de colocación de la unidad que encabeza `cabeza` (menor es mejor)"""
+    grupo = cabeza.grupo
+    if grupo is None:
+        return False, cabeza.carga
+    # un grupo con una CPU libre atiende enseguida aunque otra cargue un proceso largo
+    return not grupo.libres, sum(map(_carga, grupo.cpus)) / len(grupo.cpus)
+
+
+def _carga(cpu):
+    return cpu.carga
@@ -0,0 +1,20 @@
+"""Dispositivos de E/S: cada uno atiende un proceso a la vez, en orden de llegada
+
+Un proceso que termina una ráfaga de CPU y sigue con una de E/S se bloquea:
+libera la CPU y espera en la cola de su dispositivo. Al terminar el servicio
+vuelve a la cola de listos de su CPU (ver MotorSimulacion._bloquear).
+"""
+from collections import deque
+
+
+class Dispositivo:
+    def __init__(self, nombre):
+        self.nombre = nombre
+        self.cola = deque()  # procesos bloqueados esperando el dispositivo
+        self.actual = None  # proceso en servicio
+        self.inicio = 0.0  # desde cuándo atiende a actual
+        self.ocupado = 0.0  # tiempo simulado atendiendo procesos
+        self.generacion = 0  # invalida el fin de servicio de un proceso eliminado
+
+    def __len__(self):
+        return len(self.cola)
@@ -0,0 +1,300 @@
+import math
+from collections import deque
+
+import paleta
+from segmentos import SIN_PROCESO
+
+
+def paso_regla(ventana, marcas=10):
+    """Paso 'redondo' (1, 2 o 5 x 10^k) para unas `marcas` divisiones de la ventana"""
+    crudo = ventana / marcas
+    magnitud = 10 ** math.floor(math.log10(crudo))
+    for m in (1, 2, 5, 10):
+        if m * magnitud >= crudo:
+            return m * magnitud
+
+
+class VistaGantt:
+    """Diagrama de Gantt en modo retenido sobre un tk.Canvas
+
+    Filas, etiquetas y regla se crean una vez; cada segmento tiene su
+    rectángulo y su texto, que se desplazan con canvas.move al avanzar el
+    tiempo. Los que salen de la ventana se ocultan y se reutilizan.
+    Solo se reconstruye la escena si cambia el tamaño, el zoom o las CPUs.
+
+    Con la rueda se hace zoom, arrastrando se recorre la historia y con doble
+    clic se vuelve a seguir el tiempo actual. Si la ventana tiene más de
+    `max_detalle` segmentos se dibuja el resumen por cubetas del almacén
+    (ocupación y PID dominante), cuyo coste depende del ancho en píxeles y no
+    de la duración de la simulación.
+    """
+
+    X_INICIO = 60
+    Y_BASE = 40
+    ALTO_FILA = 50
+    ALTO_FILA_MINIMO = 2
+    ALTO_FILA_CON_GRILLA = 6  # por debajo no se dibuja fondo ni línea por fila
+    ALTO_ETIQUETA = 10
+    MIN_ANCHO_TEXTO = 25
+    PIXELES_POR_CUBETA = 2
+
+    def __init__(self, canvas, ventana=20.0, max_detalle=3000):
+        self.canvas = canvas
+        self.ventana = ventana
+        self.max_detalle = max_detalle
+        self._fin = None  # fin fijo de la ventana al recorrer la historia (None = en vivo)
+        self._arrastre = None
+        self._clave_escena = None
+        self._reiniciar_estado()
+
+        canvas.bind('<MouseWheel>', lambda e: self.zoom(0.8 if e.delta > 0 else 1.25))
+        canvas.bind('<Button-4>', lambda e: self.zoom(0.8))
+        canvas.bind('<Button-5>', lambda e: self.zoom(1.25))
+        canvas.bind('<ButtonPress-1>', self._al_presionar)
+        canvas.bind('<B1-Motion>', self._al_arrastrar)
+        canvas.bind('<Double-Button-1>', lambda e: self.en_vivo())
+
+    def _reiniciar_estado(self):
+        self._t0 = 0.0  # tiempo en el borde izquierdo de la ventana
+        self._t1 = 0.0
+        self._escala = 1.0
+        self._filas = {}  # cpu_id -> índice de fila
+        self._alto_fila = self.ALTO_FILA
+        self._alto_barra = 30
+        self._items = {}  # cpu_id -> deque de [índice, rect, texto] en orden de índice
+        self._pool = []  # (rect, texto) ocultos, listos para reutilizar
+        self._cubetas = []  # rectángulos del resumen, reutilizados cuadro a cuadro
+        self._cubetas_visibles = 0
+        self._marcas = []  # (línea, texto, valor) de la regla
+        self._paso = 1.0
+        self._linea_ahora = None
+        self._fondo = self.Y_BASE
+
+    def reiniciar(self):
+        """Olvidar los segmentos dibujados (nueva simulación)"""
+        self.canvas.delete("all")
+        self._clave_escena = None
+        self._reiniciar_estado()
+
+    # ------------------------- navegación -------------------------
+    def zoom(self, factor):
+        self.ventana = min(1e6, max(2.0, self.ventana * factor))
+
+    def en_vivo(self):
+        self._fin = None
+
+    def _al_presionar(self, event):
+        self._arrastre = (event.x, self._t1)
+
+    def _al_arrastrar(self, event):
+        if self._arrastre is None:
+            return
+        x, t1 = self._arrastre
+        self._fin = t1 - (event.x - x) / self._escala
+
+    # ------------------------- escena estática -------------------------
+    def _construir_escena(self, cpus, ancho, alto):
+        c = self.canvas
+        c.delete("all")
+        self._reiniciar_estado()
+
+        n = max(1, len(cpus))
+        # Con muchas CPUs las filas se achican para entrar en el canvas
+        self._alto_fila = max(self.ALTO_FILA_MINIMO, min(self.ALTO_FILA, (alto - self.Y_BASE - 10) / n))
+        self._alto_barra = self._alto_fila * 0.6
+        self._escala = (ancho - self.X_INICIO - 20) / self.ventana
+        self._fondo = self.Y_BASE + n * self._alto_fila
+
+        finas = self._alto_fila < self.ALTO_FILA_CON_GRILLA
+        if finas:
+            # Cientos de filas: un solo fondo en lugar de un rectángulo y una línea por CPU
+            c.create_rectangle(0, self.Y_BASE, ancho, self._fondo, fill="#f8f9fa", outline="")
+        for i, cpu in enumerate(cpus):
+            self._filas[cpu.id] = i
+            self._items[cpu.id] = deque()
+            if finas:
+                continue
+            y = self.Y_BASE + i * self._alto_fila
+            c.create_rectangle(0, y, ancho, y + self._alto_fila, fill="#f8f9fa", outline="")
+            c.create_line(self.X_INICIO, y + self._alto_fila, ancho, y + self._alto_fila, fill="#e2e8f0")
+
+        # Regla: un pool fijo de marcas que se reposiciona en cada cuadro
+        self._paso = paso_regla(self.ventana)
+        for _ in range(int(self.ventana // self._paso) + 2):
+            linea = c.create_line(0, self.Y_BASE, 0, self._fondo, fill="#cbd5e0", dash=(2, 4), state='hidden')
+            texto = c.create_text(0, self.Y_BASE - 15, text="", font=('Segoe UI', 8), state='hidden')
+            self._marcas.append([linea, texto, None])
+
+        # Columna de etiquetas por encima de los segmentos que salen por la izquierda
+        c.create_rectangle(0, self.Y_BASE, self.X_INICIO, self._fondo, fill="#f8f9fa", outline="", tags=('etiqueta',))
+        fuente = ('Segoe UI', 9 if self._alto_fila >= 20 else 6, 'bold')
+        cada = max(1, math.ceil(self.ALTO_ETIQUETA / self._alto_fila))  # etiquetar una fila de cada `cada`
+        for i, cpu in enumerate(cpus):
+            if i % cada:
+                continue
+            y = self.Y_BASE + i * self._alto_fila
+            c.create_text(30, y + self._alto_fila / 2, text=f"CPU {cpu.id}", font=fuente, tags=('etiqueta',))
+
+        self._linea_ahora = c.create_line(0, self.Y_BASE - 10, 0, self._fondo, fill="#e53e3e", width=2)
+
+    # ------------------------- segmentos -------------------------
+    def _x(self, t):
+        return self.X_INICIO + (t - self._t0) * self._escala
+
+    def _colocar(self, fila, rect, texto, inicio, fin, pid):
+        x1 = self._x(inicio)
+        x2 = self._x(fin)
+        y_centro = self.Y_BASE + fila * self._alto_fila + self._alto_fila / 2
+        self.canvas.coords(rect, x1, y_centro - self._alto_barra / 2, x2, y_centro + self._alto_barra / 2)
+        self.canvas.coords(texto, (x1 + x2) / 2, y_centro)
+        self.canvas.itemconfig(texto, text=f"P{pid}" if x2 - x1 > self.MIN_ANCHO_TEXTO else "")
+
+    def _crear(self, cpu_id, indice, segmento):
+        fondo, letra = paleta.COLORES[segmento[3]], paleta.TEXTOS[segmento[3]]
+        if self._pool:
+            rect, texto = self._pool.pop()
+            self.canvas.itemconfig(rect, fill=fondo, state='normal')
+            self.canvas.itemconfig(texto, fill=letra, state='normal')
+        else:
+            rect = self.canvas.create_rectangle(0, 0, 0, 0, fill=fondo, outline='black',
+                                                width=1, tags=('segmento',))
+            texto = self.canvas.create_text(0, 0, text="", font=('Segoe UI', 8, 'bold'), fill=letra,
+                                            tags=('segmento',))
+        self._colocar(self._filas[cpu_id], rect, texto, *segmento[:3])
+        return [indice, rect, texto]
+
+    def _reciclar(self, item):
+        _, rect, texto = item
+        self.canvas.itemconfig(rect, state='hidden')
+        self.canvas.itemconfig(texto, state='hidden')
+        self._pool.append((rect, texto))
+
+    def _actualizar_cpu(self, almacen, cpu_id, i, j):
+        """Dejar dibujados exactamente los segmentos [i, j) de la CPU"""
+        items = self._items[cpu_id]
+
+        # Los que salieron por los bordes (o se compactaron) vuelven al pool
+        while items and items[0][0] < i:
+            self._reciclar(items.popleft())
+        while items and items[-1][0] >= j:
+            self._reciclar(items.pop())
+
+        if not items:
+            primero = ultimo = j
+        else:
+            primero, ultimo = items[0][0], items[-1][0] + 1
+            # Solo el último segmento dibujado puede haber crecido por una fusión
+            indice, rect, texto = items[-1]
+            segmento = almacen.segmento(cpu_id, indice)
+            if segmento is not None:
+                self._colocar(self._filas[cpu_id], rect, texto, *segmento[:3])
+
+        for indice in range(primero - 1, i - 1, -1):
+            segmento = almacen.segmento(cpu_id, indice)
+            if segmento is not None:
+                items.appendleft(self._crear(cpu_id, indice, segmento))
+        for indice in range(max(ultimo, i), j):
+            segmento = almacen.segmento(cpu_id, indice)
+            if segmento is not None:
+                items.append(self._crear(cpu_id, indice, segmento))
+
+    def _vaciar_detalle(self):
+        for items in self._items.values():
+            while items:
+                self._reciclar(items.pop())
+
+    # ------------------------- resumen por cubetas -------------------------
+    def _dibujar_resumen(self, almacen, cpus):
+        """Tramos de cubetas con el mismo PID dominante, con alto según la ocupación"""
+        c = self.canvas
+        # Cubetas de al menos unos píxeles y no más de max_detalle en total
+        resolucion = max(self.PIXELES_POR_CUBETA / self._escala,
+                         self.ventana * len(cpus) / self.max_detalle)
+        usados = 0
+        for cpu in cpus:
+            ancho, primera, cubetas = almacen.cubetas(cpu.id, self._t0, self._t1, resolucion)
+            y_centro = self.Y_BASE + self._filas[cpu.id] * self._alto_fila + self._alto_fila / 2
+            k = 0
+            while k < len(cubetas):
+                dominante = cubetas[k][1]
+                inicio = k
+                ocupado = 0.0
+                while k < len(cubetas) and cubetas[k][1] == dominante:
+                    ocupado += cubetas[k][0]
+                    k += 1
+                if dominante == SIN_PROCESO or ocupado <= 0:
+                    continue
+                t_inicio = max(self._t0, (primera + inicio) * ancho)
+                t_fin = min(self._t1, (primera + k) * ancho)
+                medio = self._alto_barra * max(0.15, ocupado / (k - inicio)) / 2
+                if usados < len(self._cubetas):
+                    rect = self._cubetas[usados]
+                    c.itemconfig(rect, fill=paleta.color(dominante), state='normal')
+                else:
+                    rect = c.create_rectangle(0, 0, 0, 0, fill=paleta.color(dominante), outline='', tags=('resumen',))
+                    self._cubetas.append(rect)
+                c.coords(rect, self._x(t_inicio), y_centro - medio, self._x(t_fin), y_centro + medio)
+                usados += 1
+        for rect in self._cubetas[usados:self._cubetas_visibles]:
+            c.itemconfig(rect, state='hidden')
+        self._cubetas_visibles = usados
+
+    # ------------------------- cuadro -------------------------
+    def dibujar(self, almacen, cpus, ahora):
+        """Actualizar la escena con los segmentos de `almacen` (AlmacenSegmentos)"""
+        c = self.canvas
+        ancho = c.winfo_width()
+        alto = c.winfo_height()
+        if ancho <= 1:
+            ancho, alto = 800, 600
+
+        if self._fin is not None and self._fin >= ahora:
+            self._fin = None  # se arrastró hasta el presente: seguir en vivo
+        t1 = ahora if self._fin is None else max(self._fin, min(self.ventana, ahora))
+        t0 = max(0.0, t1 - self.ventana)
+
+        clave = (ancho, alto, tuple(cpu.id for cpu in cpus), id(almacen), self.ventana)
+        if clave != self._clave_escena:
+            self._construir_escena(cpus, ancho, alto)
+            self._clave_escena = clave
+            self._t0 = t0
+
+        # 1. Desplazar todo lo dibujado en una sola llamada
+        if t0 != self._t0:
+            c.move('segmento', -(t0 - self._t0) * self._escala, 0)
+            self._t0 = t0
+        self._t1 = t1
+
+        # 2. Por CPU: búsqueda binaria de la ventana; detalle o resumen según cuántos haya
+        rangos = [almacen.rango(cpu.id, t0, t1) for cpu in cpus]
+        if sum(j - i for i, j in rangos) <= self.max_detalle:
+            if self._cubetas_visibles:
+                c.itemconfig('resumen', state='hidden')
+                self._cubetas_visibles = 0
+            for cpu, (i, j) in zip(cpus, rangos):
+                self._actualizar_cpu(almacen, cpu.id, i, j)
+        else:
+            self._vaciar_detalle()
+            self._dibujar_resumen(almacen, cpus)
+
+        # 3. Regla y línea "ahora"
+        primera = math.floor(t0 / self._paso) * self._paso
+        for k, marca in enumerate(self._marcas):
+            t = round(primera + k * self._paso, 6)
+            linea, texto, valor = marca
+            if t < t0 or t > t1 + self._paso:
+                c.itemconfig(linea, state='hidden')
+                c.itemconfig(texto, state='hidden')
+                continue
+            x = self._x(t)
+            c.coords(linea, x, self.Y_BASE, x, self._fondo)
+            c.coords(texto, x, self.Y_BASE - 15)
+            if valor != t:
+                c.itemconfig(texto, text=f"{t:g}s")
+                marca[2] = t
+            c.itemconfig(linea, state='normal')
+            c.itemconfig(texto, state='normal')
+
+        x_ahora = self._x(ahora)
+        c.coords(self._linea_ahora, x_ahora, self.Y_BASE - 10, x_ahora, self._fondo)
+        c.tag_raise('etiqueta')
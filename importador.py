@@ -0,0 +1,152 @@
+"""Importación de procesos reales del host con psutil, fuera del hilo de la GUI
+
+El % de CPU se calcula con dos lecturas de cpu_times separadas por
+`intervalo` segundos (la primera llamada a cpu_percent de psutil siempre
+devuelve 0.0). Cada lectura usa oneshot() para traer todos los datos de un
+proceso con una sola consulta al sistema.
+"""
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections import namedtuple
+
+import psutil
+
+from proceso import Proceso
+
+
+Muestra = namedtuple('Muestra', 'pid nombre cpu_percent cpu_segundos nice')
+
+PRIORIDAD_POR_DEFECTO = 5
+RAFAGA_MINIMA = 0.5
+
+
+def prioridad_de_nice(nice):
+    """nice de Unix (-20 más prioritario .. 19) -> prioridad del simulador (0..10, 10 más alta)"""
+    if isinstance(nice, int) and -20 <= nice <= 19:
+        return round((19 - nice) * 10 / 39)
+    return PRIORIDAD_POR_DEFECTO  # Windows devuelve clases de prioridad, no nice
+
+
+def leer_procesos():
+    """pid -> (create_time, segundos de CPU acumulados, nombre, nice)"""
+    lectura = {}
+    for p in psutil.process_iter():
+        try:
+            with p.oneshot():
+                tiempos = p.cpu_times()
+                lectura[p.pid] = (p.create_time(), tiempos.user + tiempos.system, p.name(), p.nice())
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+    return lectura
+
+
+def muestrear(intervalo=1.0, top_n=25, min_cpu=0.0, filtro='', detener=None):
+    """Dos lecturas separadas por `intervalo`; devuelve las Muestras más activas
+
+    top_n=None devuelve todas las que pasan los filtros. `detener` (Event)
+    permite cortar la espera; en ese caso devuelve una lista vacía.
+    """
+    antes = leer_procesos()
+    t0 = time.monotonic()
+    if detener is not None:
+        if detener.wait(intervalo):
+            return []
+    else:
+        time.sleep(intervalo)
+    despues = leer_procesos()
+    transcurrido = max(time.monotonic() - t0, 1e-6)
+
+    propio = os.getpid()
+    filtro = filtro.lower()
+    muestras = []
+    for pid, (creado, cpu, nombre, nice) in despues.items():
+        previo = antes.get(pid)
+        if previo is None or previo[0] != creado or pid == propio:
+            continue  # proceso nuevo o PID reutilizado: sin delta válido
+        delta = max(0.0, cpu - previo[1])
+        porcentaje = delta / transcurrido * 100
+        if porcentaje < min_cpu or (filtro and filtro not in (nombre or '').lower()):
+            continue
+        muestras.append(Muestra(pid, nombre or f"proc{pid}", porcentaje, delta, nice))
+
+    if top_n is None:
+        return sorted(muestras, key=lambda m: m.cpu_percent, reverse=True)
+    return heapq.nlargest(top_n, muestras, key=lambda m: m.cpu_percent)
+
+
+def a_proceso(muestra, llegada, escala=10.0, pid=None):
+    """Muestra -> Proceso: la ráfaga es la CPU consumida en el intervalo por `escala`
+
+    Con `pid` el proceso simulado lleva ese PID y el del host queda en el
+    nombre ("nombre[pid]"), como en las trazas.
+    """
+    rafaga = max(RAFAGA_MINIMA, muestra.cpu_segundos * escala)
+    nombre = muestra.nombre if pid is None else f"{muestra.nombre}[{muestra.pid}]"
+    return Proceso(muestra.pid if pid is None else pid, nombre, rafaga, llegada, rafaga, None,
+                   prioridad_de_nice(muestra.nice))
+
+
+class ImportadorHost:
+    """Muestrea el host en un hilo propio y entrega los procesos al motor
+
+    Cada proceso entra por motor.recibir apenas se arma (no hace falta el lock
+    de la simulación); después `al_lote` recibe la lista de lo entregado en el
+    muestreo, desde el hilo del importador: la GUI debe pasarlo por root.after.
+    Con refresco > 0 repite el muestreo cada `refresco` segundos hasta llamar a
+    detener(). Como en las trazas, un proceso del host que sigue consumiendo
+    aporta una ráfaga nueva por muestreo (las sin consumo no se repiten); los
+    PIDs simulados son correlativos desde `primer_pid` y el del host queda en
+    el nombre.
+    """
+
+    def __init__(self, motor, al_lote, top_n=25, min_cpu=0.0, filtro='', intervalo=1.0, refresco=0.0,
+                 primer_pid=1, escala=10.0):
+        self.motor = motor
+        self.al_lote = al_lote
+        self.top_n = top_n
+        self.min_cpu = min_cpu
+        self.filtro = filtro
+        self.intervalo = intervalo
+        self.refresco = refresco
+        self.escala = escala
+        self._pids = itertools.count(primer_pid)
+        self._vistos = set()  # PIDs del host ya entregados al menos una vez
+        self._detener = threading.Event()
+        self._hilo = None
+
+    @property
+    def activo(self):
+        return self._hilo is not None and self._hilo.is_alive()
+
+    def iniciar(self):
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._correr, daemon=True)
+        self._hilo.start()
+        return self
+
+    def detener(self):
+        self._detener.set()
+
+    def _correr(self):
+        while not self._detener.is_set():
+            lote = muestrear(self.intervalo, self.top_n, self.min_cpu, self.filtro, self._detener)
+            if self._detener.is_set():
+                break
+            self.al_lote(self._entregar(lote))
+            if not self.refresco or self._detener.wait(self.refresco):
+                break
+
+    def _entregar(self, lote):
+        """Pasar al motor, uno a uno, los procesos del muestreo; devuelve los entregados"""
+        entregados = []
+        for muestra in lote:
+            if muestra.pid in self._vistos and muestra.cpu_segundos <= 0:
+                continue  # ya importado y sin consumo nuevo: nada que simular
+            self._vistos.add(muestra.pid)
+            proceso = a_proceso(muestra, self.motor.sim_time, self.escala, next(self._pids))
+            self.motor.recibir(proceso)
+            entregados.append(proceso)
+        return entregados
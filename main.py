@@ -5,4 +5,5 @@ from visu import VisualizadorProcesos
 if __name__ == "__main__":
     root = tk.Tk()
     app = VisualizadorProcesos(root)
+    root.protocol("WM_DELETE_WINDOW", lambda: (app.close(), root.destroy()))
     root.mainloop()
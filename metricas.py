@@ -0,0 +1,256 @@
+import itertools
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: el cálculo por lotes cae a Python puro
+    np = None
+
+
+CUANTILES = (0.50, 0.95, 0.99)
+
+
+class SketchCuantiles:
+    """Sketch de cuantiles en streaming con error relativo acotado (estilo DDSketch)
+
+    Cada muestra cae en un cubo logarítmico: O(1) por muestra y memoria acotada
+    por el rango de valores (no por la cantidad de muestras).
+    """
+
+    MINIMO = 1e-9  # por debajo de esto el valor cuenta como cero
+
+    def __init__(self, error_relativo=0.01):
+        self._gamma = (1 + error_relativo) / (1 - error_relativo)
+        self._inv_log_gamma = 1 / math.log(self._gamma)
+        self._positivos = {}  # índice de cubo -> cuenta
+        self._negativos = {}
+        self._ceros = 0
+        self.n = 0
+
+    def agregar(self, x):
+        self.n += 1
+        if x > self.MINIMO:
+            cubos = self._positivos
+        elif x < -self.MINIMO:
+            cubos = self._negativos
+            x = -x
+        else:
+            self._ceros += 1
+            return
+        idx = math.ceil(math.log(x) * self._inv_log_gamma)
+        cubos[idx] = cubos.get(idx, 0) + 1
+
+    def combinar(self, otro):
+        """Sumar otro sketch con el mismo error relativo"""
+        for mios, suyos in ((self._positivos, otro._positivos), (self._negativos, otro._negativos)):
+            for idx, cuenta in suyos.items():
+                mios[idx] = mios.get(idx, 0) + cuenta
+        self._ceros += otro._ceros
+        self.n += otro.n
+
+    def _valor_cubo(self, idx):
+        return 2 * self._gamma ** idx / (self._gamma + 1)
+
+    def cuantil(self, p):
+        if not self.n:
+            return 0.0
+        rango = p * (self.n - 1)
+        acumulado = 0
+        for idx in sorted(self._negativos, reverse=True):
+            acumulado += self._negativos[idx]
+            if acumulado > rango:
+                return -self._valor_cubo(idx)
+        acumulado += self._ceros
+        if acumulado > rango:
+            return 0.0
+        for idx in sorted(self._positivos):
+            acumulado += self._positivos[idx]
+            if acumulado > rango:
+                return self._valor_cubo(idx)
+        return self._valor_cubo(max(self._positivos))
+
+
+class Acumulador:
+    """Estadísticas incrementales de una serie: n, media, varianza, min/max y cuantiles"""
+
+    def __init__(self, cuantiles=CUANTILES):
+        self.n = 0
+        self.media = 0.0
+        self._m2 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self.cuantiles = cuantiles
+        self._sketch = SketchCuantiles() if cuantiles else None
+
+    def agregar(self, x):
+        # Welford: estable numéricamente y O(1)
+        self.n += 1
+        delta = x - self.media
+        self.media += delta / self.n
+        self._m2 += delta * (x - self.media)
+        if x < self.minimo:
+            self.minimo = x
+        if x > self.maximo:
+            self.maximo = x
+        if self._sketch is not None:
+            self._sketch.agregar(x)
+
+    def combinar(self, otro):
+        """Sumar las muestras de otro Acumulador (Chan et al. para media y varianza)"""
+        if not otro.n:
+            return
+        n = self.n + otro.n
+        delta = otro.media - self.media
+        self._m2 += otro._m2 + delta * delta * self.n * otro.n / n
+        self.media += delta * otro.n / n
+        self.n = n
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        if self._sketch is not None and otro._sketch is not None:
+            self._sketch.combinar(otro._sketch)
+
+    @property
+    def varianza(self):
+        return self._m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def cuantil(self, p):
+        # acotado a [min, max] para que el redondeo del cubo no se salga del rango
+        return min(max(self._sketch.cuantil(p), self.minimo), self.maximo) if self.n else 0.0
+
+    def resumen(self):
+        if not self.n:
+            return _resumen_vacio()
+        resumen = {'n': self.n, 'media': self.media, 'varianza': self.varianza,
+                   'min': self.minimo, 'max': self.maximo}
+        for p in self.cuantiles:
+            resumen[_nombre_cuantil(p)] = self.cuantil(p)
+        return resumen
+
+
+class MetricasEjecucion:
+    """Métricas de una simulación que se actualizan en O(1) por proceso completado"""
+
+    def __init__(self):
+        self.turnaround = Acumulador()
+        self.espera = Acumulador()
+        self.respuesta = Acumulador()  # de listo (llegada o fin de E/S) al despacho
+        self.ultima_finalizacion = 0.0
+
+    @property
+    def completados(self):
+        return self.turnaround.n
+
+    def registrar(self, proceso, finalizacion):
+        turnaround = finalizacion - proceso.arrival_time
+        self.turnaround.agregar(turnaround)
+        # la espera es en la cola de listos: no cuenta el tiempo bloqueado por E/S
+        self.espera.agregar(turnaround - proceso.cpu_time - proceso.bloqueado)
+        self.ultima_finalizacion = max(self.ultima_finalizacion, finalizacion)
+
+    def throughput(self):
+        """Procesos completados por segundo simulado"""
+        return self.completados / self.ultima_finalizacion if self.ultima_finalizacion > 0 else 0.0
+
+    def resumen(self):
+        return {
+            'completados': self.completados,
+            'throughput': self.throughput(),
+            'turnaround': self.turnaround.resumen(),
+            'waiting': self.espera.resumen(),
+            'respuesta': self.respuesta.resumen(),
+        }
+
+
+def calcular_lote(arrival, cpu_time, completion, bloqueado=None):
+    """Métricas completas de una ejecución terminada en una sola pasada vectorizada
+
+    Recibe columnas paralelas (por ejemplo las de TablaProcesos); las filas con
+    completion NaN (sin terminar) se ignoran. `bloqueado` es el tiempo de E/S
+    de cada fila, que no cuenta como espera. Devuelve el mismo formato que
+    MetricasEjecucion.resumen() (sin respuesta), con cuantiles exactos.
+    """
+    if np is None:
+        return _calcular_lote_python(arrival, cpu_time, completion, bloqueado)
+
+    arrival = np.asarray(arrival, dtype=np.float64)
+    cpu_time = np.asarray(cpu_time, dtype=np.float64)
+    completion = np.asarray(completion, dtype=np.float64)
+
+    terminados = ~np.isnan(completion)
+    turnaround = completion[terminados] - arrival[terminados]
+    espera = turnaround - cpu_time[terminados]
+    if bloqueado is not None:
+        espera -= np.asarray(bloqueado, dtype=np.float64)[terminados]
+    n = int(turnaround.size)
+    ultima = float(completion[terminados].max()) if n else 0.0
+    return {
+        'completados': n,
+        'throughput': n / ultima if ultima > 0 else 0.0,
+        'turnaround': _resumen_numpy(turnaround),
+        'waiting': _resumen_numpy(espera),
+    }
+
+
+def _resumen_numpy(valores):
+    if not valores.size:
+        return _resumen_vacio()
+    resumen = {
+        'n': int(valores.size),
+        'media': float(valores.mean()),
+        'varianza': float(valores.var(ddof=1)) if valores.size > 1 else 0.0,
+        'min': float(valores.min()),
+        'max': float(valores.max()),
+    }
+    percentiles = np.percentile(valores, [p * 100 for p in CUANTILES])
+    for p, valor in zip(CUANTILES, percentiles):
+        resumen[_nombre_cuantil(p)] = float(valor)
+    return resumen
+
+
+def _calcular_lote_python(arrival, cpu_time, completion, bloqueado=None):
+    turnaround = []
+    espera = []
+    ultima = 0.0
+    if bloqueado is None:
+        bloqueado = itertools.repeat(0.0)
+    for a, c, fin, b in zip(arrival, cpu_time, completion, bloqueado):
+        if fin != fin:  # NaN => sin terminar
+            continue
+        turnaround.append(fin - a)
+        espera.append(fin - a - c - b)
+        ultima = max(ultima, fin)
+    n = len(turnaround)
+    return {
+        'completados': n,
+        'throughput': n / ultima if ultima > 0 else 0.0,
+        'turnaround': _resumen_python(turnaround),
+        'waiting': _resumen_python(espera),
+    }
+
+
+def _resumen_python(valores):
+    if not valores:
+        return _resumen_vacio()
+    valores = sorted(valores)
+    acumulador = Acumulador(cuantiles=())
+    for x in valores:
+        acumulador.agregar(x)
+    resumen = acumulador.resumen()
+    for p in CUANTILES:
+        # interpolación lineal, igual que np.percentile
+        pos = p * (len(valores) - 1)
+        i = int(pos)
+        j = min(i + 1, len(valores) - 1)
+        resumen[_nombre_cuantil(p)] = valores[i] + (valores[j] - valores[i]) * (pos - i)
+    return resumen
+
+
+def _resumen_vacio():
+    resumen = {'n': 0, 'media': 0.0, 'varianza': 0.0, 'min': 0.0, 'max': 0.0}
+    for p in CUANTILES:
+        resumen[_nombre_cuantil(p)] = 0.0
+    return resumen
+
+
+def _nombre_cuantil(p):
+    return f"p{round(p * 100)}"
@@ -0,0 +1,597 @@
+import heapq
+import itertools
+from collections import deque, namedtuple
+
+from metricas import MetricasEjecucion, Acumulador
+from colas import EXPROPIATIVOS
+from dispositivos import Dispositivo
+
+
+# Evento emitido por el motor hacia sus consumidores (GUI, métricas, logs...)
+# tipo: 'llegada', 'despacho', 'ejecucion', 'quantum', 'expropiacion', 'migracion',
+# 'bloqueo' (pasa a esperar E/S), 'desbloqueo' (vuelve a la cola de listos) o 'fin'
+# duracion solo aplica a 'ejecucion' (el tramo ejecutado termina en tiempo)
+Evento = namedtuple('Evento', ['tipo', 'tiempo', 'cpu_id', 'proceso', 'duracion'])
+
+EPSILON = 1e-9
+
+# Algoritmos entre los que AsignadorUmbral alterna; el resto no se toca
+ALTERNABLES = ("FCFS", "Round Robin")
+
+
+class AsignadorRotativo:
+    """Reparto simple idx % cpu_count (el mismo que usaba la GUI)"""
+
+    def __init__(self):
+        self._idx = 0
+
+    def __call__(self, cpus, proceso):
+        cpu = cpus[self._idx % len(cpus)]
+        self._idx += 1
+        return cpu
+
+
+class AsignadorUmbral:
+    """Reparte según priority_threshold: alta prioridad -> Round Robin, baja -> FCFS
+
+    Solo alterna entre FCFS y Round Robin: una CPU configurada con otro
+    algoritmo (SJF, SRTF, prioridades, Multinivel) lo conserva.
+    """
+
+    def __init__(self, umbral=5, quantum=1.0):
+        self.umbral = umbral
+        self.quantum = quantum
+        self._idx_alta = 0
+        self._idx_baja = 0
+
+    def __call__(self, cpus, proceso):
+        if proceso.priority >= self.umbral:
+            cpu = cpus[self._idx_alta % len(cpus)]
+            self._idx_alta += 1
+            if cpu.algorithm not in ALTERNABLES:
+                return cpu  # algoritmo elegido a propósito: no se le cambia
+            cpu.algorithm = "Round Robin"
+            if cpu.quantum is None:
+                cpu.quantum = self.quantum
+        else:
+            # una CPU ya en Round Robin sigue así: en FCFS bloquearía a los de alta prioridad
+            cpu = cpus[self._idx_baja % len(cpus)]
+            self._idx_baja += 1
+        return cpu
+
+
+class MotorSimulacion:
+    """Simulación de eventos discretos: salta de evento en evento, sin GUI ni sleep"""
+
+    def __init__(self, cpus, asignador=None, conservar_completados=True, cambio_contexto=0.0,
+                 costo_migracion=0.0):
+        self.cpus = cpus
+        self.asignador = asignador or AsignadorRotativo()
+        self.sim_time = 0.0
+        # pid -> {'completion', 'turnaround', 'waiting'}; con millones de procesos
+        # conviene desactivarlo y leer los resultados de los eventos 'fin'
+        self.conservar_completados = conservar_completados
+        self.completados = {}
+        self.metricas = MetricasEjecucion()  # agregados incrementales, O(1) por proceso
+        self.migraciones = 0
+        # Sobrecarga del despacho (segundos simulados): cambiar de proceso en una
+        # CPU y retomar en una CPU distinta de la anterior (caché fría)
+        self.cambio_contexto = cambio_contexto
+        self.costo_migracion = costo_migracion
+        self.cambios_contexto = 0
+        self.cambios_cpu = 0
+
+        self._cpus_por_id = {cpu.id: cpu for cpu in cpus}
+        self._ocupadas = {}  # cpu_id -> CPU con proceso: el avance por tick no toca las ociosas
+        self._llegadas = []  # heap (llegada, seq, proceso, fuente)
+        self._eventos = []   # heap (tiempo, seq, cpu_id, generacion) -> fin de slice
+        self.dispositivos = {}  # nombre -> Dispositivo, creados al primer uso
+        self._es = []  # heap (tiempo, seq, nombre, generacion) -> fin de servicio de E/S
+        self._seq = itertools.count()
+        self._oyentes = []
+        self._entrantes = deque()  # entregados con recibir(); entran en el próximo paso
+        self._balance = None  # próximo balanceo del despachador (si tiene periodo)
+
+    @property
+    def asignador(self):
+        return self._asignador
+
+    @asignador.setter
+    def asignador(self, asignador):
+        self._asignador = asignador
+        # Un asignador con actualizar(cpu) (el Despachador) sigue la carga y la
+        # cola de cada CPU para no recorrerlas todas en cada llegada
+        self._seguir_carga = getattr(asignador, 'actualizar', None)
+
+    def _avisar(self, cpu):
+        """Cambió la carga o la cola de `cpu`"""
+        if self._seguir_carga is not None:
+            self._seguir_carga(cpu)
+
+    # ------------------------- puntos de control -------------------------
+    def __getstate__(self):
+        """Estado serializable: los oyentes no se guardan, hay que volver a suscribirlos
+
+        Las fuentes pendientes viajan con el motor, así que tienen que poder
+        serializarse (TablaProcesos y CargaMapeada lo permiten; un generador no).
+        """
+        estado = self.__dict__.copy()
+        estado['_oyentes'] = []
+        estado['_seq'] = next(self._seq)
+        return estado
+
+    def __setstate__(self, estado):
+        estado['_seq'] = itertools.count(estado['_seq'])
+        self.__dict__.update(estado)
+
+    # ------------------------- consumidores -------------------------
+    def suscribir(self, oyente):
+        """Registrar un callable que recibe cada Evento"""
+        self._oyentes.append(oyente)
+
+    def _emitir(self, tipo, cpu_id, proceso, duracion=0.0):
+        evento = Evento(tipo, self.sim_time, cpu_id, proceso, duracion)
+        for oyente in self._oyentes:
+            oyente(evento)
+
+    # ------------------------- entrada de procesos -------------------------
+    def agregar(self, proceso):
+        """Programar la llegada de un proceso (arrival_time en tiempo simulado)"""
+        self._programar(proceso, None)
+
+    def recibir(self, proceso):
+        """Entregar un proceso desde cualquier hilo sin tomar el lock de la simulación
+
+        Queda en una cola de entrada que el motor vacía al buscar el próximo
+        evento: coste O(llegadas nuevas) por paso, sin recorrer los ya asignados.
+        """
+        self._entrantes.append(proceso)
+
+    def _drenar_entrantes(self):
+        entrantes = self._entrantes
+        while entrantes:
+            self._programar(entrantes.popleft(), None)
+
+    def agregar_fuente(self, procesos):
+        """Programar llegadas desde un iterable ordenado por arrival_time
+
+        Los procesos se leen de uno en uno a medida que llega su turno, así que
+        la fuente puede ser perezosa (tabla columnar, archivo, generador...).
+        """
+        self._siguiente_de_fuente(iter(procesos))
+
+    def _siguiente_de_fuente(self, fuente):
+        proceso = next(fuente, None)
+        if proceso is not None:
+            self._programar(proceso, fuente)
+
+    def _programar(self, proceso, fuente):
+        if proceso.arrival_time is None or proceso.arrival_time < self.sim_time:
+            proceso.arrival_time = self.sim_time  # no se puede llegar al pasado
+        heapq.heappush(self._llegadas, (proceso.arrival_time, next(self._seq), proceso, fuente))
+
+    def eliminar(self, proceso):
+        """Quitar un proceso de su CPU (en cola o en ejecución)"""
+        if proceso in self._entrantes:
+            self._entrantes.remove(proceso)
+            return
+        fuente = None
+        pendientes = []
+        for entrada in self._llegadas:
+            if entrada[2] is proceso:
+                fuente = entrada[3]
+            else:
+                pendientes.append(entrada)
+        if len(pendientes) != len(self._llegadas):
+            heapq.heapify(pendientes)
+            self._llegadas = pendientes
+            if fuente is not None:
+                self._siguiente_de_fuente(fuente)
+            return
+
+        if proceso.rafagas is not None:
+            for dispositivo in self.dispositivos.values():
+                if dispositivo.actual is proceso:
+                    dispositivo.ocupado += self.sim_time - dispositivo.inicio
+                    dispositivo.actual = None
+                    dispositivo.generacion += 1
+                    if dispositivo.cola:
+                        self._servir(dispositivo)
+                    return
+                if proceso in dispositivo.cola:
+                    dispositivo.cola.remove(proceso)
+                    return
+
+        cpu = self._cpus_por_id.get(proceso.cpu_id)
+        if cpu is None:
+            return
+        cpu.carga -= proceso.remaining_time
+        if cpu.actual is proceso:
+            self._liberar(cpu)
+            self._despachar(cpu)
+        elif proceso in cpu.procesos:
+            cpu.procesos.eliminar(proceso)
+        self._avisar(cpu)
+
+    def esperas_por_nivel(self):
+        """Espera por nivel de las CPUs Multinivel, sumando todas (lista de Acumulador)"""
+        total = []
+        colas = {id(cpu.procesos): cpu.procesos for cpu in self.cpus}  # un grupo comparte la cola
+        for cola in colas.values():
+            for nivel, acumulador in enumerate(getattr(cola, 'espera_por_nivel', ())):
+                if nivel == len(total):
+                    total.append(Acumulador())
+                total[nivel].combinar(acumulador)
+        return total
+
+    # ------------------------- bucle de eventos -------------------------
+    def proximo_evento(self):
+        """Tiempo del siguiente evento pendiente (None si no queda nada)"""
+        if self._entrantes:
+            self._drenar_entrantes()
+        self._purgar_obsoletos()
+        candidatos = []
+        if self._eventos:
+            candidatos.append(self._eventos[0][0])
+        if self._es:
+            candidatos.append(self._es[0][0])
+        if self._llegadas:
+            candidatos.append(self._llegadas[0][0])
+        if not candidatos:
+            return None
+        balance = self._proximo_balance()
+        if balance is not None:
+            candidatos.append(balance)
+        return min(candidatos)
+
+    def paso(self):
+        """Procesar un único evento. Devuelve False si no quedan eventos"""
+        t = self.proximo_evento()
+        if t is None:
+            return False
+        self.sim_time = max(self.sim_time, t)
+
+        # A igual tiempo, primero se liberan CPUs, luego vuelven los de E/S y luego llegan procesos
+        if self._eventos and self._eventos[0][0] <= t:
+            _, _, cpu_id, _ = heapq.heappop(self._eventos)
+            self._fin_slice(self._cpus_por_id[cpu_id])
+        elif self._es and self._es[0][0] <= t:
+            _, _, nombre, _ = heapq.heappop(self._es)
+            self._fin_es(self.dispositivos[nombre])
+        elif self._llegadas and self._llegadas[0][0] <= t:
+            _, _, proceso, fuente = heapq.heappop(self._llegadas)
+            if fuente is not None:
+                self._siguiente_de_fuente(fuente)
+            self._llegada(proceso)
+        else:
+            self._balancear()
+        return True
+
+    def avanzar_hasta(self, t):
+        """Procesar todos los eventos hasta t y contabilizar el avance parcial"""
+        while True:
+            siguiente = self.proximo_evento()
+            if siguiente is None or siguiente > t:
+                break
+            self.paso()
+
+        self.sim_time = max(self.sim_time, t)
+        for cpu in self._ocupadas.values():
+            self._contabilizar(cpu)
+
+    def ejecutar(self):
+        """Correr la simulación hasta que no queden eventos"""
+        while self.paso():
+            pass
+        return self.completados
+
+    # ------------------------- reparto entre CPUs -------------------------
+    def cambiar_cpus(self, cpus):
+        """Pasar a otra topología: lo que esperaba o corría se reparte entre las nuevas CPUs
+
+        Las llegadas pendientes, las métricas y el tiempo simulado se conservan;
+        una CPU nueva con el id de una anterior hereda su tiempo ocupado y su
+        sobrecarga.
+        """
+        for cpu in self._ocupadas.values():
+            self._contabilizar(cpu)
+        pendientes = [cpu.actual for cpu in self._ocupadas.values()]
+        for cola in {id(cpu.procesos): cpu.procesos for cpu in self.cpus}.values():
+            pendientes.extend(cola)
+        for cpu in self.cpus:
+            cpu.limpiar_procesos()  # las nuevas pueden ser estas mismas CPUs (reagrupadas)
+        anteriores = self._cpus_por_id
+
+        self.cpus = cpus
+        self._cpus_por_id = {cpu.id: cpu for cpu in cpus}
+        self._ocupadas = {}
+        self._eventos = []
+        self._balance = None
+        if self._seguir_carga is not None:
+            self._seguir_carga(None)  # otra topología: el despachador vuelve a empezar
+        for cpu in cpus:
+            if cpu.id in anteriores:
+                cpu.ocupado = anteriores[cpu.id].ocupado
+                cpu.sobrecarga = anteriores[cpu.id].sobrecarga
+
+        for proceso in sorted(pendientes, key=lambda p: p.arrival_time):
+            cpu = self.asignador(self.cpus, proceso)
+            proceso.cpu_id = cpu.id
+            cpu.asignar_proceso(proceso, self.sim_time)
+            cpu.carga += proceso.remaining_time
+            if self._oyentes:
+                self._emitir('migracion', cpu.id, proceso)
+            self._tras_encolar(cpu)
+
+    def utilizacion(self):
+        """cpu_id -> fracción del tiempo simulado que la CPU estuvo ejecutando"""
+        if self.sim_time <= 0:
+            return {cpu.id: 0.0 for cpu in self.cpus}
+        return {cpu.id: cpu.ocupado / self.sim_time for cpu in self.cpus}
+
+    def desbalance(self):
+        """Cuánto supera la CPU más ocupada a la media (0 = reparto perfecto)"""
+        ocupado = [cpu.ocupado for cpu in self.cpus]
+        media = sum(ocupado) / len(ocupado) if ocupado else 0.0
+        return max(ocupado) / media - 1 if media > 0 else 0.0
+
+    def utilizacion_es(self):
+        """nombre -> fracción del tiempo simulado que el dispositivo estuvo atendiendo"""
+        if self.sim_time <= 0:
+            return {nombre: 0.0 for nombre in self.dispositivos}
+        return {nombre: d.ocupado / self.sim_time for nombre, d in self.dispositivos.items()}
+
+    def sobrecarga(self):
+        """Fracción del tiempo ocupado de las CPUs que se fue en cambios de contexto y migraciones"""
+        perdido = sum(cpu.sobrecarga for cpu in self.cpus)
+        total = perdido + sum(cpu.ocupado for cpu in self.cpus)
+        return perdido / total if total > 0 else 0.0
+
+    def _proximo_balance(self):
+        periodo = getattr(self.asignador, 'periodo', None)
+        if not periodo:
+            self._balance = None
+        elif self._balance is None:
+            self._balance = self.sim_time + periodo
+        return self._balance
+
+    def _balancear(self):
+        self._balance = self.sim_time + self.asignador.periodo
+        for origen, destino in self.asignador.balancear(self.cpus):
+            if origen.procesos:
+                self._migrar(origen, destino)
+
+    def _migrar(self, origen, destino):
+        """Mover el último de la cola de `origen` a `destino`"""
+        proceso = origen.procesos.quitar_ultimo()
+        origen.carga -= proceso.remaining_time
+        destino.carga += proceso.remaining_time
+        self._avisar(origen)
+        proceso.cpu_id = destino.id
+        self.migraciones += 1
+        destino.asignar_proceso(proceso, self.sim_time)
+        if self._oyentes:
+            self._emitir('migracion', destino.id, proceso)
+        self._tras_encolar(destino)
+
+    # ------------------------- lógica interna -------------------------
+    def _purgar_obsoletos(self):
+        eventos = self._eventos
+        while eventos:
+            _, _, cpu_id, generacion = eventos[0]
+            if self._cpus_por_id[cpu_id].generacion == generacion:
+                break
+            heapq.heappop(eventos)
+        es = self._es
+        while es and self.dispositivos[es[0][2]].generacion != es[0][3]:
+            heapq.heappop(es)
+
+    def _llegada(self, proceso):
+        cpu = self._cpus_por_id.get(proceso.cpu_id)
+        if cpu is None:
+            cpu = self.asignador(self.cpus, proceso)
+            proceso.cpu_id = cpu.id
+        cpu.asignar_proceso(proceso, self.sim_time)
+        cpu.carga += proceso.remaining_time
+        if self._oyentes:
+            self._emitir('llegada', cpu.id, proceso)
+        self._tras_encolar(cpu)
+
+    def _tras_encolar(self, cpu):
+        self._avisar(cpu)
+        if cpu.actual is None:
+            self._despachar(cpu)
+        elif cpu.grupo is not None and cpu.grupo.libres:
+            self._despachar(cpu.grupo.libre())  # la cola es compartida: la toma una CPU libre
+        elif cpu.algorithm in EXPROPIATIVOS:
+            if cpu.grupo is not None:
+                cpu = self._peor_del_grupo(cpu.grupo)  # la cola compartida compite con todo el grupo
+            if self._expropia(cpu):
+                self._expropiar(cpu)
+
+    def _restante(self, cpu):
+        """CPU que le falta al proceso de `cpu`; la sobrecarga aún no pagada no cuenta"""
+        return cpu.actual.remaining_time - max(0.0, self.sim_time - cpu.inicio_slice)
+
+    def _peor_del_grupo(self, grupo):
+        """La CPU del grupo cuyo proceso conviene expropiar primero"""
+        if grupo.cpus[0].algorithm == "SRTF":
+            return max(grupo.cpus, key=self._restante)
+        return min(grupo.cpus, key=lambda cpu: cpu.actual.priority)
+
+    def _expropia(self, cpu):
+        """¿El primero de la cola es mejor que el que corre? (solo se mira al llegar alguien)"""
+        candidato = cpu.procesos.primero()
+        if cpu.algorithm == "SRTF":
+            return candidato.remaining_time < self._restante(cpu) - EPSILON
+        return candidato.priority > cpu.actual.priority
+
+    def _expropiar(self, cpu):
+        proceso = cpu.actual
+        self._contabilizar(cpu)
+        self._liberar(cpu)
+        cpu.asignar_proceso(proceso, self.sim_time)
+        if self._oyentes:
+            self._emitir('expropiacion', cpu.id, proceso)
+        self._despachar(cpu)
+
+    def _despachar(self, cpu):
+        if cpu.actual is not None:
+            return
+        if not cpu.procesos:
+            if cpu.grupo is not None:
+                cpu.grupo.libres[cpu.id] = cpu
+            else:
+                cpu.carga = 0.0  # sin trabajo: descarta el error de redondeo acumulado
+            self._avisar(cpu)
+            robar = getattr(self.asignador, 'robar', None)
+            victima = robar(self.cpus, cpu) if robar is not None else None
+            if victima is not None:
+                self._migrar(victima, cpu)  # al encolar se despacha
+            return
+        proceso = cpu.procesos.siguiente(self.sim_time)
+        cpu.actual = proceso
+        self._respuesta(proceso)
+        # el proceso empieza a avanzar después de la sobrecarga del despacho
+        cpu.inicio_slice = self.sim_time + self._sobrecarga(cpu, proceso)
+        self._ocupadas[cpu.id] = cpu
+        if cpu.grupo is not None:
+            cpu.grupo.libres.pop(cpu.id, None)
+        self._avisar(cpu)
+        if proceso.cpu_id != cpu.id:
+            proceso.cpu_id = cpu.id  # en un grupo lo puede tomar otra CPU de la cola compartida
+
+        slice_time = proceso.remaining_time
+        quantum = cpu.quantum_para(proceso)
+        if quantum:
+            slice_time = min(slice_time, quantum)
+        heapq.heappush(self._eventos, (cpu.inicio_slice + slice_time, next(self._seq), cpu.id, cpu.generacion))
+
+        if self._oyentes:
+            self._emitir('despacho', cpu.id, proceso)
+
+    def _respuesta(self, proceso):
+        """Tiempo de respuesta: desde que está listo (llegada o fin de E/S) hasta su primer despacho"""
+        rafagas = proceso.rafagas
+        if rafagas is not None and rafagas.listo is not None:
+            self.metricas.respuesta.agregar(self.sim_time - rafagas.listo)
+            rafagas.listo = None
+        elif proceso.ultima_cpu is None:
+            self.metricas.respuesta.agregar(self.sim_time - proceso.arrival_time)
+
+    def _sobrecarga(self, cpu, proceso):
+        """Tiempo que pierde `cpu` antes de ejecutar `proceso`
+
+        Cambio de contexto si no es el mismo proceso que corrió antes en la
+        CPU; costo de migración si el proceso corrió antes en otra CPU (robo,
+        balanceo u otra CPU de su grupo).
+        """
+        sobrecarga = 0.0
+        if cpu.ultimo_pid != proceso.pid:
+            cpu.ultimo_pid = proceso.pid
+            sobrecarga += self.cambio_contexto
+            self.cambios_contexto += 1
+        if proceso.ultima_cpu != cpu.id:
+            if proceso.ultima_cpu is not None:
+                sobrecarga += self.costo_migracion
+                self.cambios_cpu += 1
+            proceso.ultima_cpu = cpu.id
+        cpu.sobrecarga += sobrecarga
+        return sobrecarga
+
+    def _contabilizar(self, cpu):
+        """Descontar lo ejecutado por cpu.actual desde el inicio del slice"""
+        executed = self.sim_time - cpu.inicio_slice
+        if executed <= 0:
+            return
+        proceso = cpu.actual
+        proceso.remaining_time -= executed
+        cpu.inicio_slice = self.sim_time
+        cpu.carga -= executed
+        cpu.ocupado += executed
+        self._avisar(cpu)
+        if self._oyentes:
+            self._emitir('ejecucion', cpu.id, proceso, executed)
+
+    def _liberar(self, cpu):
+        if cpu.inicio_slice > self.sim_time:
+            cpu.sobrecarga -= cpu.inicio_slice - self.sim_time  # se fue antes de terminar el cambio
+        cpu.actual = None
+        self._ocupadas.pop(cpu.id, None)
+        cpu.generacion += 1  # invalida el evento de fin de slice pendiente
+
+    def _fin_slice(self, cpu):
+        proceso = cpu.actual
+        self._contabilizar(cpu)
+        self._liberar(cpu)
+
+        if proceso.remaining_time <= EPSILON and proceso.rafagas is not None and proceso.rafagas.quedan():
+            proceso.remaining_time = 0.0
+            self._bloquear(cpu, proceso)
+        elif proceso.remaining_time <= EPSILON:
+            proceso.remaining_time = 0.0
+            self.metricas.registrar(proceso, self.sim_time)
+            if self.conservar_completados:
+                turnaround = self.sim_time - proceso.arrival_time
+                self.completados[proceso.pid] = {
+                    'completion': self.sim_time,
+                    'turnaround': turnaround,
+                    'waiting': turnaround - proceso.cpu_time - proceso.bloqueado
+                }
+            if self._oyentes:
+                self._emitir('fin', cpu.id, proceso)
+        else:
+            # Quantum agotado: vuelve al final de la cola (Multinivel además lo baja de nivel)
+            cpu.reencolar(proceso, self.sim_time)
+            if self._oyentes:
+                self._emitir('quantum', cpu.id, proceso)
+
+        self._despachar(cpu)
+
+    # ------------------------- E/S -------------------------
+    def _bloquear(self, cpu, proceso):
+        """Terminó una ráfaga de CPU y sigue una de E/S: a la cola del dispositivo"""
+        rafagas = proceso.rafagas
+        rafagas.fase += 1
+        rafagas.desde = self.sim_time
+        # Multinivel: no agotó el quantum, así que vuelve al nivel del que salió
+        rafagas.nivel = cpu.nivel if cpu.algorithm == "Multinivel" else None
+        nombre = rafagas.dispositivo()
+        dispositivo = self.dispositivos.get(nombre)
+        if dispositivo is None:
+            dispositivo = self.dispositivos[nombre] = Dispositivo(nombre)
+        dispositivo.cola.append(proceso)
+        if self._oyentes:
+            self._emitir('bloqueo', cpu.id, proceso)
+        if dispositivo.actual is None:
+            self._servir(dispositivo)
+
+    def _servir(self, dispositivo):
+        proceso = dispositivo.cola.popleft()
+        dispositivo.actual = proceso
+        dispositivo.inicio = self.sim_time
+        heapq.heappush(self._es, (self.sim_time + proceso.rafagas.duracion(), next(self._seq),
+                                  dispositivo.nombre, dispositivo.generacion))
+
+    def _fin_es(self, dispositivo):
+        """Terminó la E/S: el proceso vuelve a la cola de listos de su CPU"""
+        proceso = dispositivo.actual
+        dispositivo.ocupado += self.sim_time - dispositivo.inicio
+        dispositivo.actual = None
+        if dispositivo.cola:
+            self._servir(dispositivo)
+
+        rafagas = proceso.rafagas
+        rafagas.bloqueado += self.sim_time - rafagas.desde
+        rafagas.fase += 1
+        rafagas.listo = self.sim_time
+        proceso.remaining_time = rafagas.duracion()
+        cpu = self._cpus_por_id.get(proceso.cpu_id)
+        if cpu is None:  # su CPU ya no existe (cambio de topología)
+            cpu = self.asignador(self.cpus, proceso)
+            proceso.cpu_id = cpu.id
+        cpu.retomar(proceso, self.sim_time, rafagas.nivel)
+        cpu.carga += proceso.remaining_time
+        if self._oyentes:
+            self._emitir('desbloqueo', cpu.id, proceso)
+        self._tras_encolar(cpu)
@@ -0,0 +1,54 @@
+"""Paleta de colores por PID compartida por el Gantt, las colas de CPU y las exportaciones
+
+Los colores se calculan una sola vez al importar el módulo. Cada PID se
+reduce a un índice chico de la tabla (`indice`), que es lo que guardan los
+segmentos; el color de fondo y el del texto salen de ahí sin hashing.
+"""
+import colorsys
+
+_BITS = 8
+TAMANO = 1 << _BITS
+_ANGULO_AUREO = 0.618033988749895
+
+
+def _generar(n):
+    """Tonos repartidos con el ángulo áureo, alternando saturación y brillo"""
+    colores = []
+    for i in range(n):
+        tono = (i * _ANGULO_AUREO) % 1.0
+        saturacion = (0.55, 0.75, 0.9)[i % 3]
+        valor = (0.95, 0.75, 0.55)[(i // 3) % 3]
+        r, g, b = colorsys.hsv_to_rgb(tono, saturacion, valor)
+        colores.append((r, g, b))
+    return colores
+
+
+def _luminancia(r, g, b):
+    """Luminancia relativa (WCAG) de un color en [0, 1]"""
+    def canal(c):
+        return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+    return 0.2126 * canal(r) + 0.7152 * canal(g) + 0.0722 * canal(b)
+
+
+def _hex(r, g, b):
+    return '#%02x%02x%02x' % (round(r * 255), round(g * 255), round(b * 255))
+
+
+_RGB = _generar(TAMANO)
+COLORES = tuple(_hex(*rgb) for rgb in _RGB)
+# Negro o blanco, el que más contraste tenga con el fondo
+TEXTOS = tuple('#000000' if _luminancia(*rgb) > 0.179 else '#ffffff' for rgb in _RGB)
+
+
+def indice(pid):
+    """Índice de la paleta para un PID: mezcla multiplicativa para que PIDs
+    consecutivos caigan en colores distintos"""
+    return ((pid * 2654435761) & 0xFFFFFFFF) >> (32 - _BITS)
+
+
+def color(pid):
+    return COLORES[indice(pid)]
+
+
+def color_texto(pid):
+    return TEXTOS[indice(pid)]
@@ -1,9 +1,12 @@
-import psutil
-import time
-import random
+DISPOSITIVO_POR_DEFECTO = "disco"
+
 
 class Proceso:
-    def __init__(self, pid, nombre, cpu_time, arrival_time, remaining_time, cpu_id, priority=5):
+    # Sin __dict__ por instancia: menos memoria y acceso a atributos más rápido
+    __slots__ = ('pid', 'nombre', 'cpu_time', 'arrival_time', 'remaining_time', 'cpu_id', 'priority', 'ultima_cpu',
+                 'rafagas')
+
+    def __init__(self, pid, nombre, cpu_time, arrival_time, remaining_time, cpu_id, priority=5, rafagas=None):
         self.pid = pid
         self.nombre = nombre
         self.cpu_time = cpu_time
@@ -11,8 +14,60 @@ class Proceso:
         self.remaining_time = remaining_time
         self.cpu_id = cpu_id
         self.priority = priority
+        self.ultima_cpu = None  # id de la CPU donde corrió por última vez (coste de migración)
+        # Con ráfagas (CPU, E/S, CPU, ...) cpu_time es la suma de las de CPU y
+        # remaining_time lo que falta de la ráfaga de CPU en curso
+        self.rafagas = None
+        if rafagas is not None:
+            self.rafagas = RafagasES(rafagas)
+            self.cpu_time = self.rafagas.cpu_total()
+            self.remaining_time = self.rafagas.duracion()
+
+    @property
+    def bloqueado(self):
+        """Tiempo total bloqueado por E/S, cola del dispositivo incluida (0 si solo usa CPU)"""
+        return self.rafagas.bloqueado if self.rafagas is not None else 0.0
 
     def __repr__(self):
         return (f"Proceso(PID={self.pid}, Nombre={self.nombre}, "
                 f"CPU Time={self.cpu_time}, Arrival Time={self.arrival_time}, "
-                f"Remaining Time={self.remaining_time}, CPU={self.cpu_id}, Priority={self.priority})")
\ No newline at end of file
+                f"Remaining Time={self.remaining_time}, CPU={self.cpu_id}, Priority={self.priority})")
+
+
+class RafagasES:
+    """Ráfagas alternadas de un proceso: CPU, E/S, CPU, ..., CPU
+
+    Las pares son segundos de CPU; las impares (dispositivo, segundos) de E/S
+    (un número solo va a DISPOSITIVO_POR_DEFECTO). `fase` es la ráfaga en curso.
+    El motor anota cuándo se bloqueó (desde), cuándo volvió a estar listo
+    (listo, para el tiempo de respuesta) y el nivel Multinivel del que salió.
+    """
+    __slots__ = ('rafagas', 'fase', 'bloqueado', 'desde', 'listo', 'nivel')
+
+    def __init__(self, rafagas):
+        rafagas = tuple(r if i % 2 == 0 or not isinstance(r, (int, float)) else (DISPOSITIVO_POR_DEFECTO, r)
+                        for i, r in enumerate(rafagas))
+        if len(rafagas) % 2 == 0:
+            raise ValueError("las ráfagas deben empezar y terminar en CPU (CPU, E/S, ..., CPU)")
+        self.rafagas = rafagas
+        self.fase = 0
+        self.bloqueado = 0.0
+        self.desde = None
+        self.listo = None
+        self.nivel = None
+
+    def cpu_total(self):
+        return sum(self.rafagas[0::2])
+
+    def duracion(self):
+        """Segundos de la ráfaga en curso"""
+        rafaga = self.rafagas[self.fase]
+        return rafaga if self.fase % 2 == 0 else rafaga[1]
+
+    def dispositivo(self):
+        """Dispositivo de la ráfaga de E/S en curso"""
+        return self.rafagas[self.fase][0]
+
+    def quedan(self):
+        """¿Sigue alguna ráfaga después de la actual?"""
+        return self.fase + 1 < len(self.rafagas)
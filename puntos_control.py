@@ -0,0 +1,101 @@
+"""Puntos de control: instantáneas binarias del estado de una simulación
+
+    archivo   b'PCS1' + pickle comprimido con zlib de un dict
+              {'motor': MotorSimulacion, 'carga': ..., 'segmentos': AlmacenSegmentos, ...}
+
+capturar() serializa en memoria y debe llamarse con la simulación quieta
+(entre dos pasos del motor, o con sim_lock tomado en la GUI). Comprimir y
+escribir lo hace EscritorPuntosControl en su propio hilo; el archivo se
+reemplaza de forma atómica, así que siempre queda el último punto completo.
+Solo deben cargarse puntos de control propios: pickle ejecuta código al leer.
+"""
+import os
+import pickle
+import threading
+import zlib
+
+
+MAGIA = b'PCS1'
+EXTENSION = '.pcs'
+
+
+def capturar(**estado):
+    """Serializar el estado (motor, carga, segmentos...) a bytes, sin comprimir
+
+    ValueError si algo no se puede guardar, por ejemplo una fuente de
+    llegadas que es un generador.
+    """
+    try:
+        return pickle.dumps(estado, protocol=pickle.HIGHEST_PROTOCOL)
+    except (TypeError, pickle.PicklingError) as e:
+        raise ValueError(f"el estado no admite puntos de control: {e}") from None
+
+
+def guardar(ruta, datos, nivel=1):
+    """Comprimir y escribir `datos` (de capturar) reemplazando `ruta` de forma atómica"""
+    temporal = ruta + '.tmp'
+    with open(temporal, 'wb') as f:
+        f.write(MAGIA)
+        f.write(zlib.compress(datos, nivel))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+
+
+def cargar(ruta):
+    """Leer un punto de control y devolver el dict guardado"""
+    with open(ruta, 'rb') as f:
+        contenido = f.read()
+    if contenido[:len(MAGIA)] != MAGIA:
+        raise ValueError(f"{ruta}: no es un punto de control ({MAGIA!r})")
+    try:
+        return pickle.loads(zlib.decompress(contenido[len(MAGIA):]))
+    except (zlib.error, pickle.UnpicklingError, EOFError) as e:
+        raise ValueError(f"{ruta}: punto de control dañado ({e})") from None
+
+
+class EscritorPuntosControl:
+    """Escribe en disco, desde un hilo propio, las capturas que se le envían
+
+    Si llega una captura mientras se escribe la anterior, solo se conserva la
+    más nueva: el simulador nunca espera al disco.
+    """
+
+    def __init__(self, ruta, nivel=1):
+        self.ruta = ruta
+        self.nivel = nivel
+        self.escritos = 0
+        self.error = None  # última excepción de escritura
+        self._pendiente = None
+        self._cerrado = False
+        self._condicion = threading.Condition()
+        self._hilo = threading.Thread(target=self._correr, daemon=True)
+        self._hilo.start()
+
+    def enviar(self, datos):
+        with self._condicion:
+            self._pendiente = datos
+            self._condicion.notify()
+
+    def cerrar(self):
+        """Escribir lo pendiente y terminar el hilo"""
+        with self._condicion:
+            self._cerrado = True
+            self._condicion.notify()
+        self._hilo.join()
+        if self.error is not None:
+            raise self.error
+
+    def _correr(self):
+        while True:
+            with self._condicion:
+                while self._pendiente is None and not self._cerrado:
+                    self._condicion.wait()
+                datos, self._pendiente = self._pendiente, None
+                if datos is None:
+                    return
+            try:
+                guardar(self.ruta, datos, self.nivel)
+                self.escritos += 1
+            except OSError as e:
+                self.error = e
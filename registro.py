@@ -0,0 +1,96 @@
+import csv
+import os
+import queue
+import threading
+import time
+
+
+CAMPOS = ('pid', 'nombre', 'cpu_id', 'cpu_time', 'arrival', 'completion', 'turnaround', 'waiting')
+
+_FIN = object()  # centinela para cerrar el hilo escritor
+
+
+class RegistroCompletados:
+    """Log CSV de procesos completados con buffer y escritura en segundo plano
+
+    registrar() solo encola una tupla, así que se puede llamar con el lock de la
+    simulación tomado: el archivo se abre una vez y un hilo propio escribe en
+    bloques cada max_filas filas o cada max_espera segundos. Solo agrega a un
+    archivo vacío o con las mismas columnas (ValueError si no).
+    """
+
+    def __init__(self, ruta="procesos_terminados.csv", max_filas=1000, max_espera=1.0):
+        self.ruta = ruta
+        self.max_filas = max_filas
+        self.max_espera = max_espera
+        self._comprobar_cabecera()
+        self._cola = queue.SimpleQueue()
+        self._hilo = threading.Thread(target=self._escribir, daemon=True)
+        self._hilo.start()
+
+    def _comprobar_cabecera(self):
+        try:
+            with open(self.ruta, newline="", encoding="utf-8") as f:
+                cabecera = next(csv.reader(f), None)
+        except FileNotFoundError:
+            return
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            raise ValueError(f"{self.ruta}: no se puede leer la cabecera ({e})") from None
+        if cabecera is not None and tuple(cabecera) != CAMPOS:
+            raise ValueError(f"{self.ruta}: sus columnas no son {','.join(CAMPOS)}; usar otro archivo")
+
+    def registrar(self, proceso, completion):
+        turnaround = completion - proceso.arrival_time
+        # El tiempo bloqueado por E/S no es espera en la cola de listos (igual que el motor)
+        waiting = turnaround - proceso.cpu_time - proceso.bloqueado
+        self._cola.put((
+            proceso.pid, proceso.nombre, proceso.cpu_id,
+            f"{proceso.cpu_time:.4f}", f"{proceso.arrival_time:.4f}", f"{completion:.4f}",
+            f"{turnaround:.4f}", f"{waiting:.4f}"
+        ))
+
+    def al_evento(self, evento):
+        """Oyente para MotorSimulacion.suscribir"""
+        if evento.tipo == 'fin':
+            self.registrar(evento.proceso, evento.tiempo)
+
+    def cerrar(self):
+        """Vaciar el buffer y terminar el hilo escritor"""
+        if self._hilo.is_alive():
+            self._cola.put(_FIN)
+            self._hilo.join()
+
+    def _escribir(self):
+        try:
+            nuevo = not os.path.exists(self.ruta) or os.path.getsize(self.ruta) == 0
+            with open(self.ruta, "a", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                if nuevo:
+                    writer.writerow(CAMPOS)
+                self._bucle(f, writer)
+        except OSError as e:
+            print("Error al guardar:", e)
+
+    def _bucle(self, f, writer):
+        buffer = []
+        ultimo_flush = time.monotonic()
+        while True:
+            restante = self.max_espera - (time.monotonic() - ultimo_flush)
+            try:
+                fila = self._cola.get(timeout=max(0.0, restante))
+            except queue.Empty:
+                fila = None
+            if fila is _FIN:
+                break
+            if fila is not None:
+                buffer.append(fila)
+
+            if len(buffer) >= self.max_filas or time.monotonic() - ultimo_flush >= self.max_espera:
+                if buffer:
+                    writer.writerows(buffer)
+                    f.flush()
+                    buffer.clear()
+                ultimo_flush = time.monotonic()
+
+        writer.writerows(buffer)
+        f.flush()
@@ -0,0 +1,254 @@
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+
+import paleta
+
+
+class _Pista:
+    """Segmentos de una CPU, en arrays paralelos ordenados por inicio
+
+    En una CPU los segmentos no se solapan, así que los fines también quedan
+    ordenados y ambos arrays sirven para buscar con bisect. `colores` guarda
+    el índice de paleta de cada segmento (1 byte). `base` es el
+    índice absoluto del primer segmento que sigue guardado (crece al compactar).
+    """
+
+    __slots__ = ('inicios', 'fines', 'pids', 'colores', 'base')
+
+    def __init__(self):
+        self.inicios = array('d')
+        self.fines = array('d')
+        self.pids = array('q')
+        self.colores = array('B')
+        self.base = 0
+
+    def __len__(self):
+        return len(self.inicios)
+
+
+SIN_PROCESO = -1  # cubeta sin ejecución
+
+
+class _Nivel:
+    """Una resolución del resumen: cubetas de `ancho` segundos de una CPU
+
+    Cada cubeta cerrada guarda la fracción ocupada y el PID que más tiempo
+    corrió en ella. Solo la cubeta abierta (la última) lleva el detalle por
+    PID; como los segmentos de una CPU llegan en orden, las demás no cambian.
+    """
+
+    __slots__ = ('ancho', 'max_cubetas', 'primera', 'ocupacion', 'dominante', 'abierta', 'tiempos')
+
+    def __init__(self, ancho, max_cubetas):
+        self.ancho = ancho
+        self.max_cubetas = max_cubetas
+        self.primera = 0  # número de cubeta de ocupacion[0]
+        self.ocupacion = array('d')
+        self.dominante = array('q')
+        self.abierta = None  # número de la cubeta abierta
+        self.tiempos = {}  # pid -> tiempo dentro de la cubeta abierta
+
+    def agregar(self, pid, inicio, fin):
+        w = self.ancho
+        if self.abierta is not None and self.abierta * w <= inicio and fin <= (self.abierta + 1) * w:
+            # caso común: el tramo cae entero en la cubeta abierta
+            self.tiempos[pid] = self.tiempos.get(pid, 0.0) + (fin - inicio)
+            return
+        b = int(inicio // w)
+        ultima = int(fin // w)
+        if ultima > b and ultima * w >= fin:
+            ultima -= 1  # termina justo en el borde
+        if self.abierta is not None and b < self.abierta:
+            b = self.abierta  # no se reescriben cubetas cerradas
+        for c in range(max(b, ultima - self.max_cubetas), ultima + 1):
+            if c != self.abierta:
+                self._abrir(c)
+            dur = min(fin, (c + 1) * w) - max(inicio, c * w)
+            if dur > 0:
+                self.tiempos[pid] = self.tiempos.get(pid, 0.0) + dur
+
+    def _abrir(self, c):
+        """Cerrar la cubeta abierta, rellenar el hueco sin ejecución y abrir c"""
+        if self.abierta is None or c - self.abierta > self.max_cubetas:
+            del self.ocupacion[:]
+            del self.dominante[:]
+            self.primera = c
+        else:
+            self.ocupacion.append(self._ocupacion_abierta())
+            self.dominante.append(self._dominante_abierta())
+            hueco = c - self.abierta - 1
+            if hueco:
+                self.ocupacion.extend([0.0] * hueco)
+                self.dominante.extend([SIN_PROCESO] * hueco)
+            if len(self.ocupacion) > self.max_cubetas:
+                k = len(self.ocupacion) // 2
+                del self.ocupacion[:k]
+                del self.dominante[:k]
+                self.primera += k
+        self.abierta = c
+        self.tiempos = {}
+
+    def _ocupacion_abierta(self):
+        return min(1.0, sum(self.tiempos.values()) / self.ancho)
+
+    def _dominante_abierta(self):
+        return max(self.tiempos, key=self.tiempos.get) if self.tiempos else SIN_PROCESO
+
+    def cubre(self, t):
+        return self.abierta is None or self.primera * self.ancho <= t
+
+    def cubetas(self, t0, t1):
+        """(número de la primera cubeta, [(ocupacion, pid dominante), ...]) en [t0, t1]"""
+        if self.abierta is None:
+            return 0, []
+        desde = max(self.primera, int(t0 // self.ancho))
+        hasta = min(self.abierta, int(t1 // self.ancho))
+        i, j = desde - self.primera, hasta - self.primera
+        res = list(zip(self.ocupacion[i:j + 1], self.dominante[i:j + 1]))
+        if desde <= self.abierta <= hasta:
+            res.append((self._ocupacion_abierta(), self._dominante_abierta()))
+        return desde, res
+
+
+class ResumenNiveles:
+    """Pirámide de resoluciones por CPU (base, 2*base, 4*base, ...)
+
+    Se alimenta con cada tramo ejecutado y cada nivel guarda a lo sumo
+    `max_cubetas`, así que una consulta cuesta lo mismo sin importar cuánto
+    lleve la simulación: los niveles gruesos cubren toda la historia.
+    """
+
+    def __init__(self, base=0.5, niveles=14, max_cubetas=1024):
+        self.anchos = [base * 2 ** k for k in range(niveles)]
+        self.max_cubetas = max_cubetas
+        self._cpus = {}  # cpu_id -> [_Nivel]
+
+    def agregar(self, cpu_id, pid, inicio, fin):
+        niveles = self._cpus.get(cpu_id)
+        if niveles is None:
+            niveles = self._cpus[cpu_id] = [_Nivel(w, self.max_cubetas) for w in self.anchos]
+        for nivel in niveles:
+            nivel.agregar(pid, inicio, fin)
+
+    def consultar(self, cpu_id, t0, t1, resolucion):
+        """Cubetas de al menos `resolucion` segundos que cubren [t0, t1]
+
+        Devuelve (ancho, número de la primera cubeta, [(ocupacion, dominante)]).
+        """
+        niveles = self._cpus.get(cpu_id)
+        if not niveles:
+            return resolucion, 0, []
+        for nivel in niveles:
+            if nivel.ancho >= resolucion and nivel.cubre(t0):
+                break
+        return (nivel.ancho,) + nivel.cubetas(t0, t1)
+
+    def limpiar(self):
+        self._cpus.clear()
+
+
+class AlmacenSegmentos:
+    """Historial del Gantt: por CPU, (inicio, fin, pid) con índice temporal
+
+    agregar() fusiona en O(1) con el último segmento de la CPU si es el mismo
+    proceso y es contiguo; rango() devuelve en O(log n) los segmentos que tocan
+    [t0, t1]. Los índices son absolutos por CPU y no cambian al compactar: cuando
+    una CPU supera `max_por_cpu` segmentos se descarta la mitad más antigua.
+    Cada tramo alimenta además `resumen` (ResumenNiveles) para las vistas alejadas.
+    """
+
+    def __init__(self, max_por_cpu=20000, tolerancia=1e-6):
+        self.max_por_cpu = max_por_cpu
+        self.tolerancia = tolerancia
+        self.resumen = ResumenNiveles()
+        self._pistas = {}  # cpu_id -> _Pista
+        self._lock = threading.Lock()  # escribe el hilo de simulación, lee la GUI
+
+    def agregar(self, cpu_id, pid, inicio, duracion):
+        fin = inicio + duracion
+        with self._lock:
+            pista = self._pistas.get(cpu_id)
+            if pista is None:
+                pista = self._pistas[cpu_id] = _Pista()
+            if pista.pids and pista.pids[-1] == pid and abs(pista.fines[-1] - inicio) < self.tolerancia:
+                pista.fines[-1] = fin
+            else:
+                pista.inicios.append(inicio)
+                pista.fines.append(fin)
+                pista.pids.append(pid)
+                pista.colores.append(paleta.indice(pid))
+                if len(pista) > self.max_por_cpu:
+                    self._compactar(pista)
+            self.resumen.agregar(cpu_id, pid, inicio, fin)
+
+    def al_evento(self, evento):
+        """Oyente del motor: registrar cada tramo 'ejecucion'"""
+        if evento.tipo == 'ejecucion':
+            self.agregar(evento.cpu_id, evento.proceso.pid, evento.tiempo - evento.duracion, evento.duracion)
+
+    def __getstate__(self):
+        # El lock no se serializa: el punto de control se toma con la simulación quieta
+        estado = self.__dict__.copy()
+        del estado['_lock']
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self._lock = threading.Lock()
+
+    def _compactar(self, pista):
+        # Borrar la mitad vieja de una vez: coste amortizado O(1) por alta
+        k = len(pista) // 2
+        del pista.inicios[:k]
+        del pista.fines[:k]
+        del pista.pids[:k]
+        del pista.colores[:k]
+        pista.base += k
+
+    def cpus(self):
+        return list(self._pistas)
+
+    def rango(self, cpu_id, t0, t1):
+        """Índices absolutos [i, j) de los segmentos de la CPU que tocan [t0, t1]"""
+        with self._lock:
+            pista = self._pistas.get(cpu_id)
+            if pista is None:
+                return 0, 0
+            i = bisect_left(pista.fines, t0)
+            j = bisect_right(pista.inicios, t1)
+            return pista.base + i, pista.base + max(i, j)
+
+    def segmento(self, cpu_id, indice):
+        """(inicio, fin, pid, color) por índice absoluto, o None si ya se compactó"""
+        with self._lock:
+            pista = self._pistas.get(cpu_id)
+            if pista is None:
+                return None
+            k = indice - pista.base
+            if not 0 <= k < len(pista):
+                return None
+            return pista.inicios[k], pista.fines[k], pista.pids[k], pista.colores[k]
+
+    def segmentos(self, cpu_id, t0, t1):
+        """Lista de (inicio, fin, pid, color) de la CPU que tocan [t0, t1]"""
+        with self._lock:
+            pista = self._pistas.get(cpu_id)
+            if pista is None:
+                return []
+            i = bisect_left(pista.fines, t0)
+            j = bisect_right(pista.inicios, t1)
+            return list(zip(pista.inicios[i:j], pista.fines[i:j], pista.pids[i:j], pista.colores[i:j]))
+
+    def cubetas(self, cpu_id, t0, t1, resolucion):
+        """Vista agregada de [t0, t1]; ver ResumenNiveles.consultar"""
+        with self._lock:
+            return self.resumen.consultar(cpu_id, t0, t1, resolucion)
+
+    def __len__(self):
+        return sum(len(p) for p in self._pistas.values())
+
+    def limpiar(self):
+        with self._lock:
+            self._pistas.clear()
+            self.resumen.limpiar()
@@ -0,0 +1,300 @@
+"""Simulación por lotes sin Tk: carga -> motor -> métricas
+
+Ejemplos:
+    python simular.py carga.csv --cpus 4 -a FCFS -a SJF -a rr:2 -a multinivel
+    python simular.py carga.csv --cpus 2 -a multinivel:0.1,0.4,1.6 --boost 10
+    python simular.py carga.csv --cpus 16 --reparto robo
+    python simular.py grande.carga --cpus 256 --por-grupo 32 -a srtf --reparto menor-carga
+    python simular.py carga.csv --cpus host
+    python simular.py carga.csv -a rr:0.05 --cambio-contexto 0.002 --costo-migracion 0.01
+    cat carga.csv | python simular.py - --formato json > metricas.json
+    python simular.py grande.carga --cpus 8 --punto-control corrida.pcs --cada 3600
+    python simular.py --reanudar corrida.pcs
+"""
+import argparse
+import csv
+import json
+import sys
+
+from cpu import crear_topologia, cpus_del_host
+from colas import QUANTA_MULTINIVEL, BOOST_MULTINIVEL
+from motor import MotorSimulacion, AsignadorUmbral
+from cargas import leer_carga
+from registro import RegistroCompletados
+from despacho import ESTRATEGIAS, crear_despachador
+from segmentos import AlmacenSegmentos
+import puntos_control
+
+
+ALGORITMOS = {
+    'fcfs': "FCFS",
+    'sjf': "SJF",
+    'rr': "Round Robin",
+    'round robin': "Round Robin",
+    'srtf': "SRTF",
+    'prioridad': "Prioridad",
+    'prioridad-exp': "Prioridad Expropiativa",
+    'multinivel': "Multinivel",
+}
+
+
+def parsear_algoritmo(especificacion, quantum):
+    """'rr:2' -> ("Round Robin", 2.0); 'fcfs' -> ("FCFS", None)
+
+    'multinivel:0.5,1,2' -> ("Multinivel", (0.5, 1.0, 2.0)), un quantum por nivel.
+    """
+    nombre, _, valor = especificacion.partition(':')
+    algoritmo = ALGORITMOS.get(nombre.strip().lower())
+    if algoritmo is None:
+        raise ValueError(f"algoritmo desconocido: {especificacion}")
+    if algoritmo == "Multinivel":
+        return algoritmo, tuple(float(q) for q in valor.split(',')) if valor else QUANTA_MULTINIVEL
+    if algoritmo != "Round Robin":
+        return algoritmo, None
+    return algoritmo, float(valor) if valor else quantum
+
+
+def crear_cpus(cantidad, especificaciones, quantum=1.0, boost=BOOST_MULTINIVEL, envejecimiento=None,
+               por_grupo=1):
+    """Crear las CPUs; los algoritmos se reparten cíclicamente si hay menos que CPUs
+
+    Con por_grupo > 1 las CPUs se agrupan compartiendo cola (ver cpu.GrupoCPU);
+    cada grupo usa el algoritmo de su primera CPU.
+    """
+    cpus = crear_topologia(cantidad, por_grupo)
+    especificaciones = especificaciones or ["FCFS"]
+    for i, cpu in enumerate(cpus):
+        algoritmo, parametro = parsear_algoritmo(especificaciones[i % len(especificaciones)], quantum)
+        if cpu.grupo is not None and cpu is not cpu.grupo.cpus[0]:
+            continue  # configurar la primera ya configura el grupo
+        if algoritmo == "Multinivel":
+            cpu.configurar_multinivel(parametro, boost, envejecimiento)
+        else:
+            cpu.algorithm, cpu.quantum = algoritmo, parametro
+    return cpus
+
+
+def cantidad_cpus(texto):
+    """Tipo de argparse: un entero o 'host' (las CPUs lógicas de esta máquina)"""
+    if texto == 'host':
+        return cpus_del_host()
+    try:
+        return int(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"se esperaba un entero o 'host': {texto}") from None
+
+
+def completar_resumen(resumen, motor):
+    """Agregar al resumen de la carga lo que solo sabe el motor"""
+    resumen['tiempo_simulado'] = motor.sim_time
+    resumen['utilizacion'] = {f"cpu{cpu_id}": u for cpu_id, u in motor.utilizacion().items()}
+    resumen['desbalance'] = motor.desbalance()
+    resumen['migraciones'] = motor.migraciones
+    resumen['cambios_contexto'] = motor.cambios_contexto
+    resumen['cambios_cpu'] = motor.cambios_cpu
+    resumen['sobrecarga'] = motor.sobrecarga()
+    resumen['respuesta'] = motor.metricas.respuesta.resumen()
+    resumen['utilizacion_es'] = motor.utilizacion_es()
+    for nivel, espera in enumerate(motor.esperas_por_nivel()):
+        resumen[f'espera_nivel_{nivel}'] = espera.resumen()
+    return resumen
+
+
+def ejecutar_carga(tabla, cpus, asignador=None, registro=None, cambio_contexto=0.0, costo_migracion=0.0):
+    """Correr la carga completa en el motor y devolver el resumen de métricas"""
+    motor = MotorSimulacion(cpus, asignador, False, cambio_contexto, costo_migracion)
+    if registro is not None:
+        motor.suscribir(registro.al_evento)
+    tabla.alimentar(motor)
+    motor.ejecutar()
+    return completar_resumen(tabla.metricas(), motor)
+
+
+def ejecutar_con_puntos_control(ruta, cada, tabla=None, cpus=None, asignador=None, registro=None,
+                                cambio_contexto=0.0, costo_migracion=0.0):
+    """Como ejecutar_carga, guardando el estado en `ruta` cada `cada` segundos simulados
+
+    Sin tabla se reanuda desde el punto de control de `ruta` y el resultado es
+    el mismo que el de la corrida sin interrumpir. También se guarda el
+    historial del Gantt (AlmacenSegmentos) para abrirlo en visu.py.
+    """
+    if tabla is None:
+        estado = puntos_control.cargar(ruta)
+        motor, tabla, segmentos = estado['motor'], estado['carga'], estado['segmentos']
+        tabla.reconectar(motor)
+    else:
+        motor = MotorSimulacion(cpus, asignador, False, cambio_contexto, costo_migracion)
+        segmentos = AlmacenSegmentos()
+        tabla.alimentar(motor)
+    motor.suscribir(segmentos.al_evento)
+    if registro is not None:
+        motor.suscribir(registro.al_evento)
+
+    def captura():
+        return puntos_control.capturar(motor=motor, carga=tabla, segmentos=segmentos)
+
+    escritor = puntos_control.EscritorPuntosControl(ruta)
+    try:
+        escritor.enviar(captura())  # falla antes de correr si la carga no se puede guardar
+        limite = motor.sim_time + cada
+        while True:
+            # Se captura entre dos eventos: reanudar repite exactamente los mismos pasos
+            t = motor.proximo_evento()
+            if t is None:
+                break
+            if t > limite:
+                escritor.enviar(captura())
+                limite = t + cada
+            motor.paso()
+        escritor.enviar(captura())
+    finally:
+        escritor.cerrar()
+    return completar_resumen(tabla.metricas(), motor)
+
+
+def aplanar(resumen):
+    """Resumen anidado -> dict plano (turnaround_media, waiting_p99, ...)"""
+    plano = {}
+    for clave, valor in resumen.items():
+        if isinstance(valor, dict):
+            for sub, v in valor.items():
+                plano[f"{clave}_{sub}"] = v
+        else:
+            plano[clave] = valor
+    return plano
+
+
+def imprimir(resumen, formato, salida):
+    if formato == 'json':
+        json.dump(resumen, salida, indent=2)
+        salida.write("\n")
+    elif formato == 'csv':
+        plano = aplanar(resumen)
+        writer = csv.DictWriter(salida, fieldnames=list(plano))
+        writer.writeheader()
+        writer.writerow(plano)
+    else:
+        salida.write(f"Procesos completados: {resumen['completados']}\n")
+        salida.write(f"Tiempo simulado: {resumen['tiempo_simulado']:.2f}s\n")
+        salida.write(f"Throughput: {resumen['throughput']:.4f} procesos/s\n")
+        for serie in ('turnaround', 'waiting', 'respuesta'):
+            r = resumen[serie]
+            salida.write(f"{serie.capitalize()}: media {r['media']:.3f}s, "
+                         f"p50 {r['p50']:.3f}s, p95 {r['p95']:.3f}s, p99 {r['p99']:.3f}s, "
+                         f"max {r['max']:.3f}s\n")
+        utilizacion = resumen['utilizacion']
+        salida.write(f"Utilización: media {sum(utilizacion.values()) / len(utilizacion):.1%}, "
+                     f"desbalance {resumen['desbalance']:.1%}, migraciones {resumen['migraciones']}\n")
+        salida.write(f"Sobrecarga: {resumen['sobrecarga']:.1%} del tiempo ocupado "
+                     f"({resumen['cambios_contexto']} cambios de contexto, {resumen['cambios_cpu']} cambios de CPU)\n")
+        if resumen['utilizacion_es']:
+            salida.write("Utilización de E/S: " + ", ".join(
+                f"{nombre} {u:.1%}" for nombre, u in sorted(resumen['utilizacion_es'].items())) + "\n")
+        nivel = 0
+        while f'espera_nivel_{nivel}' in resumen:
+            r = resumen[f'espera_nivel_{nivel}']
+            salida.write(f"Espera en nivel {nivel}: {r['n']} despachos, media {r['media']:.3f}s, "
+                         f"p95 {r['p95']:.3f}s, max {r['max']:.3f}s\n")
+            nivel += 1
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(description="Simulación de planificación por lotes (sin GUI)")
+    parser.add_argument('carga', nargs='?', help="archivo CSV de carga (pid,nombre,cpu_time,arrival_time,priority), traza .trz, carga binaria .carga o - para stdin")
+    parser.add_argument('--cpus', type=cantidad_cpus, default=4,
+                        help="cantidad de CPUs (4 por defecto) o host para usar las de esta máquina")
+    parser.add_argument('--por-grupo', type=int, default=1,
+                        help="CPUs por grupo que comparten cola, como un nodo NUMA (1 = sin grupos)")
+    parser.add_argument('-a', '--algoritmo', action='append', default=[],
+                        help="algoritmo por CPU: fcfs, sjf, srtf, rr[:quantum], prioridad, prioridad-exp o "
+                             "multinivel[:q0,q1,...] (MLFQ); repetir para asignar uno por CPU")
+    parser.add_argument('--quantum', type=float, default=1.0, help="quantum por defecto de Round Robin")
+    parser.add_argument('--boost', type=float, default=BOOST_MULTINIVEL,
+                        help=f"multinivel: segundos entre subidas de todos al nivel 0 ({BOOST_MULTINIVEL:g} por defecto, 0 = nunca)")
+    parser.add_argument('--envejecimiento', type=float, default=None,
+                        help="multinivel: espera máxima en un nivel antes de subir uno")
+    parser.add_argument('--umbral', type=int, default=None,
+                        help="reparto multinivel por prioridad (>= umbral -> Round Robin)")
+    parser.add_argument('--reparto', choices=list(ESTRATEGIAS), default=None,
+                        help="despachador entre CPUs: rotativo (por defecto), menor-carga, robo o migracion")
+    parser.add_argument('--periodo-migracion', type=float, default=None,
+                        help="segundos simulados entre balanceos (0 = sin migración periódica)")
+    parser.add_argument('--cambio-contexto', type=float, default=0.0,
+                        help="segundos que pierde una CPU al pasar a otro proceso (0 por defecto)")
+    parser.add_argument('--costo-migracion', type=float, default=0.0,
+                        help="segundos extra al retomar un proceso en otra CPU (0 por defecto)")
+    parser.add_argument('--formato', choices=('texto', 'json', 'csv'), default='texto')
+    parser.add_argument('-o', '--salida', default='-', help="archivo de métricas (- para stdout)")
+    parser.add_argument('--completados', help="escribir el log CSV de procesos completados en esta ruta")
+    parser.add_argument('--punto-control', metavar='RUTA',
+                        help="guardar el estado periódicamente en RUTA (.pcs) para poder reanudar")
+    parser.add_argument('--cada', type=float, default=60.0,
+                        help="segundos simulados entre puntos de control (60 por defecto)")
+    parser.add_argument('--reanudar', metavar='RUTA',
+                        help="continuar desde un punto de control (ignora carga, --cpus, -a y los costos)")
+    return parser
+
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    if args.cpus < 1:
+        parser.error("--cpus debe ser al menos 1")
+    if args.por_grupo < 1:
+        parser.error("--por-grupo debe ser al menos 1")
+    if args.cada <= 0:
+        parser.error("--cada debe ser positivo")
+    if args.cambio_contexto < 0 or args.costo_migracion < 0:
+        parser.error("--cambio-contexto y --costo-migracion no pueden ser negativos")
+    if args.umbral is not None and args.reparto is not None:
+        parser.error("--umbral y --reparto no se pueden combinar")
+    if args.reanudar is None and args.carga is None:
+        parser.error("falta la carga (o --reanudar)")
+
+    try:
+        registro = RegistroCompletados(args.completados) if args.completados else None
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        if args.reanudar is not None:
+            try:
+                resumen = ejecutar_con_puntos_control(args.reanudar, args.cada, registro=registro)
+            except (OSError, ValueError) as e:
+                parser.error(str(e))
+        else:
+            try:
+                cpus = crear_cpus(args.cpus, args.algoritmo, args.quantum,
+                                  args.boost or None, args.envejecimiento, args.por_grupo)
+                tabla = leer_carga(args.carga)
+            except (OSError, ValueError) as e:
+                parser.error(str(e))
+
+            asignador = None
+            if args.umbral is not None:
+                asignador = AsignadorUmbral(args.umbral, args.quantum)
+            elif args.reparto is not None:
+                asignador = crear_despachador(args.reparto, args.periodo_migracion)
+
+            if args.punto_control:
+                try:
+                    resumen = ejecutar_con_puntos_control(args.punto_control, args.cada, tabla, cpus,
+                                                          asignador, registro, args.cambio_contexto,
+                                                          args.costo_migracion)
+                except ValueError as e:
+                    parser.error(str(e))
+            else:
+                resumen = ejecutar_carga(tabla, cpus, asignador, registro, args.cambio_contexto,
+                                         args.costo_migracion)
+    finally:
+        if registro is not None:
+            registro.cerrar()
+
+    if args.salida == '-':
+        imprimir(resumen, args.formato, sys.stdout)
+    else:
+        with open(args.salida, 'w', newline='', encoding='utf-8') as f:
+            imprimir(resumen, args.formato, f)
+
+
+if __name__ == "__main__":
+    main()
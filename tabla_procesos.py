@@ -0,0 +1,184 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usan arrays de la stdlib
+    np = None
+
+from proceso import Proceso, RafagasES
+from metricas import calcular_lote
+
+
+# (columna, typecode de array, dtype equivalente de NumPy)
+COLUMNAS = (
+    ('pid', 'q', 'int64'),
+    ('cpu_time', 'd', 'float64'),
+    ('remaining_time', 'd', 'float64'),
+    ('arrival_time', 'd', 'float64'),
+    ('priority', 'b', 'int8'),
+    ('cpu_id', 'i', 'int32'),
+    ('completion', 'd', 'float64'),
+)
+_DTYPES = {nombre: dtype for nombre, _, dtype in COLUMNAS}
+
+SIN_CPU = -1  # cpu_id de un proceso todavía sin asignar
+PENDIENTE = float('nan')  # completion de un proceso que no terminó
+
+
+class ProcesoFila(Proceso):
+    """Proceso materializado desde una fila de TablaProcesos"""
+    __slots__ = ('fila',)
+
+
+def _extender(columna, valores, dtype):
+    if np is not None and isinstance(valores, np.ndarray):
+        columna.frombytes(np.ascontiguousarray(valores, dtype=dtype).tobytes())
+    else:
+        columna.extend(valores)
+
+
+class TablaProcesos:
+    """Almacén columnar de procesos: un array contiguo por campo de Proceso
+
+    Unos 45 bytes por proceso, sin objeto ni __dict__ por fila. Los Proceso
+    solo se materializan cuando el motor los necesita (ver alimentar()).
+    """
+
+    def __init__(self):
+        for nombre, typecode, _ in COLUMNAS:
+            setattr(self, nombre, array(typecode))
+        self.nombres = {}  # fila -> nombre, solo si no es el "Proceso_<pid>" por defecto
+        self.rafagas = {}  # fila -> ráfagas CPU/E/S, solo de los procesos que hacen E/S
+        self.bloqueos = {}  # fila -> tiempo bloqueado por E/S de los terminados
+
+    @classmethod
+    def desde_procesos(cls, procesos):
+        tabla = cls()
+        for p in procesos:
+            tabla.agregar(p.pid, p.cpu_time, p.arrival_time, p.priority, p.cpu_id, p.nombre,
+                          p.rafagas.rafagas if p.rafagas is not None else None)
+        return tabla
+
+    def __len__(self):
+        return len(self.pid)
+
+    def agregar(self, pid, cpu_time, arrival_time, priority=5, cpu_id=None, nombre=None, rafagas=None):
+        """Agregar una fila; con `rafagas` (CPU, E/S, ..., CPU) cpu_time es la suma de las de CPU"""
+        fila = len(self.pid)
+        if rafagas is not None:
+            rafagas = RafagasES(rafagas)
+            cpu_time = rafagas.cpu_total()
+            self.rafagas[fila] = rafagas.rafagas
+        self.pid.append(pid)
+        self.cpu_time.append(cpu_time)
+        self.remaining_time.append(cpu_time)
+        self.arrival_time.append(arrival_time)
+        self.priority.append(priority)
+        self.cpu_id.append(SIN_CPU if cpu_id is None else cpu_id)
+        self.completion.append(PENDIENTE)
+        if nombre is not None and nombre != f"Proceso_{pid}":
+            self.nombres[fila] = nombre
+        return fila
+
+    def extender(self, pid, cpu_time, arrival_time, priority=None):
+        """Agregar un lote de filas de una vez (secuencias o arrays de NumPy)"""
+        n = len(pid)
+        _extender(self.pid, pid, 'int64')
+        _extender(self.cpu_time, cpu_time, 'float64')
+        _extender(self.remaining_time, cpu_time, 'float64')
+        _extender(self.arrival_time, arrival_time, 'float64')
+        if priority is None:
+            self.priority.extend(array('b', [5]) * n)
+        else:
+            _extender(self.priority, priority, 'int8')
+        self.cpu_id.extend(array('i', [SIN_CPU]) * n)
+        self.completion.extend(array('d', [PENDIENTE]) * n)
+
+    def reiniciar(self):
+        """Volver todas las filas a su estado inicial para simular de nuevo"""
+        self.remaining_time = array('d', self.cpu_time)
+        self.cpu_id = array('i', [SIN_CPU]) * len(self)
+        self.completion = array('d', [PENDIENTE]) * len(self)
+        self.bloqueos.clear()
+
+    def columna(self, nombre):
+        """Columna como array de NumPy sin copia (o el array de la stdlib sin NumPy)
+
+        Mientras exista la vista de NumPy la tabla no puede crecer (BufferError).
+        """
+        if np is None:
+            return getattr(self, nombre)
+        return np.frombuffer(getattr(self, nombre), dtype=_DTYPES[nombre])
+
+    def proceso(self, fila):
+        """Materializar la fila como Proceso"""
+        cpu_id = self.cpu_id[fila]
+        p = ProcesoFila(
+            self.pid[fila], self.nombres.get(fila, f"Proceso_{self.pid[fila]}"),
+            self.cpu_time[fila], self.arrival_time[fila], self.remaining_time[fila],
+            None if cpu_id == SIN_CPU else cpu_id, self.priority[fila], self.rafagas.get(fila)
+        )
+        p.fila = fila
+        return p
+
+    def orden_llegada(self):
+        """Índices de fila ordenados por arrival_time (estable)"""
+        if np is not None:
+            return np.argsort(self.columna('arrival_time'), kind='stable')
+        return sorted(range(len(self)), key=self.arrival_time.__getitem__)
+
+    def por_llegada(self):
+        """Procesos pendientes (sin completion) en orden de llegada, uno a uno"""
+        return _CursorLlegadas(self)
+
+    def alimentar(self, motor):
+        """Usar la tabla como fuente de llegadas del motor y recoger los resultados"""
+        motor.suscribir(self._al_evento)
+        motor.agregar_fuente(self.por_llegada())
+
+    def reconectar(self, motor):
+        """Volver a suscribirse a un motor restaurado de un punto de control"""
+        motor.suscribir(self._al_evento)
+
+    def metricas(self):
+        """Turnaround/espera de toda la tabla en una pasada vectorizada"""
+        bloqueado = None
+        if self.bloqueos:
+            bloqueado = array('d', bytes(8 * len(self)))
+            for fila, tiempo in self.bloqueos.items():
+                bloqueado[fila] = tiempo
+        return calcular_lote(self.columna('arrival_time'), self.columna('cpu_time'), self.columna('completion'),
+                             bloqueado)
+
+    def _al_evento(self, evento):
+        if evento.tipo == 'fin' and isinstance(evento.proceso, ProcesoFila):
+            fila = evento.proceso.fila
+            self.completion[fila] = evento.tiempo
+            self.remaining_time[fila] = 0.0
+            self.cpu_id[fila] = evento.cpu_id
+            if evento.proceso.rafagas is not None:
+                self.bloqueos[fila] = evento.proceso.bloqueado
+
+
+class _CursorLlegadas:
+    """Iterador de TablaProcesos.por_llegada que se puede guardar en un punto de control
+
+    Un generador no se serializa; este guarda la tabla, el orden y la posición.
+    """
+
+    def __init__(self, tabla):
+        self.tabla = tabla
+        self.orden = tabla.orden_llegada()
+        self.posicion = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        completion = self.tabla.completion
+        while self.posicion < len(self.orden):
+            fila = int(self.orden[self.posicion])
+            self.posicion += 1
+            if completion[fila] != completion[fila]:  # NaN => pendiente
+                return self.tabla.proceso(fila)
+        raise StopIteration
@@ -0,0 +1,86 @@
+import io
+
+import pytest
+
+from cargas import convertir, escribir_carga, leer_carga
+from proceso import Proceso
+
+
+def filas(tabla):
+    return [(p.pid, p.nombre, p.cpu_time, p.arrival_time, p.priority,
+             p.rafagas.rafagas if p.rafagas is not None else None)
+            for p in tabla.por_llegada()]
+
+
+def test_escribir_y_leer_carga_ida_y_vuelta():
+    procesos = [
+        Proceso(1, "a", 2.5, 0.0, 2.5, None, 3),
+        Proceso(2, "b", 0, 0.75, 0, None, 7, (1.0, ("red", 0.5), 2.0, 0.25, 0.125)),
+    ]
+    salida = io.StringIO()
+    escribir_carga(salida, procesos)
+    salida.seek(0)
+    assert filas(leer_carga(salida)) == [
+        (1, "a", 2.5, 0.0, 3, None),
+        (2, "b", 3.125, 0.75, 7, (1.0, ("red", 0.5), 2.0, ("disco", 0.25), 0.125)),
+    ]
+
+
+def test_convertir_csv(tmp_path):
+    origen, destino = tmp_path / "origen.csv", tmp_path / "destino.csv"
+    origen.write_text("pid,cpu_time,arrival_time\n2,1.5,3\n1,4,0\n", encoding="utf-8")
+    assert convertir(str(origen), str(destino)) == 2
+    assert filas(leer_carga(str(destino))) == [
+        (1, "Proceso_1", 4.0, 0.0, 5, None),
+        (2, "Proceso_2", 1.5, 3.0, 5, None),
+    ]
+
+
+def test_convertir_a_binaria_y_de_vuelta(tmp_path):
+    origen = tmp_path / "origen.csv"
+    origen.write_text("pid,cpu_time,arrival_time,priority\n2,1.5,3,9\n1,4,0,1\n3,0.5,3,5\n",
+                      encoding="utf-8")
+    binaria, csv_ = str(tmp_path / "carga.carga"), str(tmp_path / "vuelta.csv")
+    assert convertir(str(origen), binaria) == 3
+    carga = leer_carga(binaria)
+    esperado = [
+        (1, "Proceso_1", 4.0, 0.0, 1, None),
+        (2, "Proceso_2", 1.5, 3.0, 9, None),
+        (3, "Proceso_3", 0.5, 3.0, 5, None),
+    ]
+    assert filas(carga) == esperado
+    carga.cerrar()
+    # De binaria a binaria (pasa por una TablaProcesos) y de vuelta a CSV
+    copia = str(tmp_path / "copia.carga")
+    assert convertir(binaria, copia) == 3
+    assert convertir(copia, csv_) == 3
+    assert filas(leer_carga(csv_)) == esperado
+
+
+def test_binaria_rechaza_rafagas_de_es(tmp_path):
+    origen = tmp_path / "origen.csv"
+    origen.write_text("pid,arrival_time,rafagas\n1,0,2;disco:3;1\n2,1,4\n", encoding="utf-8")
+    destino = tmp_path / "carga.carga"
+    with pytest.raises(ValueError, match="ráfagas"):
+        convertir(str(origen), str(destino))
+    assert not destino.exists()
+    # En CSV las ráfagas se conservan
+    csv_ = str(tmp_path / "copia.csv")
+    assert convertir(str(origen), csv_) == 2
+    assert filas(leer_carga(csv_)) == [
+        (1, "Proceso_1", 3.0, 0.0, 5, (2.0, ("disco", 3.0), 1.0)),
+        (2, "Proceso_2", 4.0, 1.0, 5, (4.0,)),
+    ]
+
+
+def test_binaria_rechaza_nombres_propios(tmp_path):
+    origen = tmp_path / "origen.csv"
+    origen.write_text("pid,nombre,cpu_time\n1,Proceso_1,2\n2,compilador,3\n", encoding="utf-8")
+    destino = tmp_path / "carga.carga"
+    with pytest.raises(ValueError, match="nombres"):
+        convertir(str(origen), str(destino))
+    assert not destino.exists()
+    # Los nombres por defecto no se pierden: se vuelven a generar al leer
+    origen.write_text("pid,nombre,cpu_time\n1,Proceso_1,2\n2,Proceso_2,3\n", encoding="utf-8")
+    assert convertir(str(origen), str(destino)) == 2
+    assert [p.nombre for p in leer_carga(str(destino)).por_llegada()] == ["Proceso_1", "Proceso_2"]
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from despacho import Despachador, _clave_carga, _unidades
+from motor import MotorSimulacion
+from proceso import Proceso
+from simular import crear_cpus
+
+
+class DespachadorVerificado(Despachador):
+    """Compara cada elección de los montículos con un recorrido de todas las CPUs"""
+
+    def __call__(self, cpus, proceso):
+        cpu = super().__call__(cpus, proceso)
+        mejor = min(_clave_carga(u[0]) for u in _unidades(cpus))
+        assert _clave_carga(cpu) == mejor
+        return cpu
+
+    def robar(self, cpus, libre):
+        victima = super().robar(cpus, libre)
+        mas_larga = max(len(u[0].procesos) for u in _unidades(cpus))
+        if victima is not None:
+            assert len(victima.procesos) == mas_larga
+        else:
+            assert mas_larga == 0
+        return victima
+
+
+@pytest.mark.parametrize("por_grupo", [1, 3])
+def test_monticulos_eligen_igual_que_recorrer_las_cpus(por_grupo):
+    azar = random.Random(5)
+    despachador = DespachadorVerificado('menor_carga', robo=True, periodo=2.0)
+    motor = MotorSimulacion(crear_cpus(12, ["fcfs", "rr:0.5", "sjf"], por_grupo=por_grupo), despachador)
+    llegada = 0.0
+    for pid in range(3000):
+        llegada += azar.expovariate(10.0)
+        cpu_time = azar.expovariate(1.0)
+        motor.agregar(Proceso(pid, f"p{pid}", cpu_time, llegada, cpu_time, None))
+    # Como la GUI: avanzar de a ticks contabiliza lo ejecutado sin terminar slices
+    t = 0.0
+    while t < llegada / 2:
+        t += 0.05
+        motor.avanzar_hasta(t)
+    motor.cambiar_cpus(crear_cpus(8, ["fcfs"], por_grupo=por_grupo))  # los montículos se rehacen
+    motor.ejecutar()
+    assert len(motor.completados) == 3000
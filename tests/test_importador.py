@@ -0,0 +1,23 @@
+import pytest
+
+psutil = pytest.importorskip("psutil")
+
+from importador import ImportadorHost, Muestra  # noqa: E402
+from motor import MotorSimulacion  # noqa: E402
+from simular import crear_cpus  # noqa: E402
+
+
+def test_cada_muestreo_entrega_rafagas_nuevas_al_motor():
+    motor = MotorSimulacion(crear_cpus(1, ["fcfs"]))
+    importador = ImportadorHost(motor, lambda procesos: None, primer_pid=100, escala=1.0)
+
+    primero = importador._entregar([Muestra(42, "db", 90.0, 0.9, 0), Muestra(7, "ocioso", 0.0, 0.0, 0)])
+    assert [(p.pid, p.nombre, p.cpu_time) for p in primero] == [(100, "db[42]", 0.9), (101, "ocioso[7]", 0.5)]
+    assert list(motor._entrantes) == primero  # cada uno ya está en la cola de entrada del motor
+
+    motor.ejecutar()
+    # El que sigue consumiendo aporta otra ráfaga; el ocioso ya importado no se repite
+    segundo = importador._entregar([Muestra(42, "db", 150.0, 1.5, 0), Muestra(7, "ocioso", 0.0, 0.0, 0)])
+    assert [(p.pid, p.nombre, p.cpu_time, p.arrival_time) for p in segundo] == [(102, "db[42]", 1.5, motor.sim_time)]
+    motor.ejecutar()
+    assert sorted(motor.completados) == [100, 101, 102]
@@ -0,0 +1,145 @@
+import random
+
+import pytest
+
+from despacho import Despachador
+from motor import MotorSimulacion, AsignadorUmbral
+from proceso import Proceso
+from simular import crear_cpus
+
+
+def test_umbral_conserva_algoritmos_configurados():
+    cpus = crear_cpus(4, ["srtf", "prioridad-exp", "fcfs", "multinivel"])
+    motor = MotorSimulacion(cpus, AsignadorUmbral(umbral=5, quantum=0.5))
+    for pid in range(4):
+        motor.agregar(Proceso(pid, f"alta{pid}", 1.0, 0.0, 1.0, None, 8))
+    for pid in range(4, 8):
+        motor.agregar(Proceso(pid, f"baja{pid}", 1.0, 0.0, 1.0, None, 2))
+    motor.ejecutar()
+    assert len(motor.completados) == 8
+    # Solo la CPU en FCFS pasa a Round Robin (con el quantum del asignador)
+    assert [cpu.algorithm for cpu in cpus] == ["SRTF", "Prioridad Expropiativa", "Round Robin", "Multinivel"]
+    assert cpus[2].quantum == 0.5
+
+
+def traza(motor):
+    eventos = []
+    motor.suscribir(lambda e: eventos.append((e.tipo, round(e.tiempo, 6), e.cpu_id, e.proceso.pid)))
+    return eventos
+
+
+def test_srtf_expropia_al_llegar_uno_mas_corto():
+    motor = MotorSimulacion(crear_cpus(1, ["srtf"]))
+    eventos = traza(motor)
+    motor.agregar(Proceso(1, "largo", 8.0, 0.0, 8.0, None))
+    motor.agregar(Proceso(2, "corto", 2.0, 1.0, 2.0, None))
+    motor.agregar(Proceso(3, "medio", 7.5, 2.0, 7.5, None))  # no le gana al que queda del largo
+    motor.ejecutar()
+    assert [e for e in eventos if e[0] in ('despacho', 'expropiacion', 'fin')] == [
+        ('despacho', 0.0, 1, 1),
+        ('expropiacion', 1.0, 1, 1),
+        ('despacho', 1.0, 1, 2),
+        ('fin', 3.0, 1, 2),
+        ('despacho', 3.0, 1, 1),
+        ('fin', 10.0, 1, 1),
+        ('despacho', 10.0, 1, 3),
+        ('fin', 17.5, 1, 3),
+    ]
+
+
+def test_prioridad_expropiativa():
+    motor = MotorSimulacion(crear_cpus(1, ["prioridad-exp"]))
+    eventos = traza(motor)
+    motor.agregar(Proceso(1, "baja", 4.0, 0.0, 4.0, None, 1))
+    motor.agregar(Proceso(2, "alta", 2.0, 1.0, 2.0, None, 9))
+    motor.agregar(Proceso(3, "igual", 1.0, 2.0, 1.0, None, 9))  # igual prioridad: no expropia
+    motor.ejecutar()
+    assert [e for e in eventos if e[0] in ('despacho', 'expropiacion', 'fin')] == [
+        ('despacho', 0.0, 1, 1),
+        ('expropiacion', 1.0, 1, 1),
+        ('despacho', 1.0, 1, 2),
+        ('fin', 3.0, 1, 2),
+        ('despacho', 3.0, 1, 3),
+        ('fin', 4.0, 1, 3),
+        ('despacho', 4.0, 1, 1),
+        ('fin', 7.0, 1, 1),
+    ]
+
+
+def test_srtf_no_cuenta_la_sobrecarga_pendiente():
+    # El cambio de contexto (1 s) aún no terminó cuando llega el segundo: al
+    # primero le faltan 5 s de CPU, no 5.5, así que 5.2 no lo expropia
+    motor = MotorSimulacion(crear_cpus(1, ["srtf"]), cambio_contexto=1.0)
+    eventos = traza(motor)
+    motor.agregar(Proceso(1, "a", 5.0, 0.0, 5.0, None))
+    motor.agregar(Proceso(2, "b", 5.2, 0.5, 5.2, None))
+    motor.ejecutar()
+    assert not [e for e in eventos if e[0] == 'expropiacion']
+    assert motor.completados[1]['completion'] == 6.0
+
+
+def test_srtf_en_grupo_expropia_al_peor_del_grupo():
+    # El corto llega a la CPU 1 (rotativo), cuyo proceso termina antes que él;
+    # el que conviene expropiar es el largo de la CPU 2, que comparte la cola
+    cpus = crear_cpus(2, ["srtf"], por_grupo=2)
+    motor = MotorSimulacion(cpus)
+    eventos = traza(motor)
+    motor.agregar(Proceso(1, "breve", 3.0, 0.0, 3.0, None))
+    motor.agregar(Proceso(2, "largo", 10.0, 0.0, 10.0, None))
+    motor.agregar(Proceso(3, "corto", 2.0, 1.0, 2.0, None))
+    motor.ejecutar()
+    assert ('expropiacion', 1.0, 2, 2) in eventos
+    assert motor.completados[3]['completion'] == 3.0
+    assert motor.completados[2]['completion'] == 12.0  # retoma en t=3 en la primera CPU libre
+
+
+def test_sobrecarga_una_vez_por_cambio():
+    motor = MotorSimulacion(crear_cpus(1, ["rr:1"]), cambio_contexto=0.1)
+    eventos = traza(motor)
+    motor.agregar(Proceso(1, "a", 2.0, 0.0, 2.0, None))
+    motor.agregar(Proceso(2, "b", 1.0, 0.0, 1.0, None))
+    motor.agregar(Proceso(3, "solo", 2.0, 5.0, 2.0, None))  # vuelve a despacharse sin cambiar: no paga
+    motor.ejecutar()
+    assert [e for e in eventos if e[0] in ('despacho', 'fin')] == [
+        ('despacho', 0.0, 1, 1),
+        ('despacho', 1.1, 1, 2),
+        ('fin', 2.2, 1, 2),
+        ('despacho', 2.2, 1, 1),
+        ('fin', 3.3, 1, 1),
+        ('despacho', 5.0, 1, 3),
+        ('despacho', 6.1, 1, 3),
+        ('fin', 7.1, 1, 3),
+    ]
+    assert motor.cambios_contexto == 4
+    assert motor.cpus[0].sobrecarga == pytest.approx(0.4)
+
+
+def test_migracion_se_cobra_una_vez_por_cambio_de_cpu():
+    azar = random.Random(3)
+    despachador = Despachador('menor_carga', robo=True, periodo=1.0, tolerancia=0.1)
+    motor = MotorSimulacion(crear_cpus(4, ["fcfs", "rr:0.5"]), despachador,
+                            cambio_contexto=0.01, costo_migracion=0.05)
+    ultimo_pid, ultima_cpu = {}, {}
+    esperados = {'contexto': 0, 'cpu': 0}
+
+    def contar(evento):
+        if evento.tipo != 'despacho':
+            return
+        pid = evento.proceso.pid
+        if ultimo_pid.get(evento.cpu_id) != pid:
+            esperados['contexto'] += 1
+        if ultima_cpu.get(pid, evento.cpu_id) != evento.cpu_id:
+            esperados['cpu'] += 1
+        ultimo_pid[evento.cpu_id], ultima_cpu[pid] = pid, evento.cpu_id
+
+    motor.suscribir(contar)
+    llegada = 0.0
+    for pid in range(2000):
+        llegada += azar.expovariate(6.0)
+        cpu_time = azar.expovariate(1.0)
+        motor.agregar(Proceso(pid, f"p{pid}", cpu_time, llegada, cpu_time, None))
+    motor.ejecutar()
+    assert esperados['cpu'] > 0
+    assert (motor.cambios_contexto, motor.cambios_cpu) == (esperados['contexto'], esperados['cpu'])
+    assert sum(cpu.sobrecarga for cpu in motor.cpus) == pytest.approx(
+        0.01 * motor.cambios_contexto + 0.05 * motor.cambios_cpu)
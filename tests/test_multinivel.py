@@ -0,0 +1,57 @@
+from motor import MotorSimulacion
+from proceso import Proceso
+from simular import crear_cpus
+
+
+def correr(procesos, boost=None, envejecimiento=None):
+    """Correr en una CPU 'multinivel:1,2,4'; devuelve (motor, despachos como (t, pid, nivel))"""
+    cpus = crear_cpus(1, ["multinivel:1,2,4"], boost=boost, envejecimiento=envejecimiento)
+    motor = MotorSimulacion(cpus)
+    despachos = []
+
+    def anotar(evento):
+        if evento.tipo == 'despacho':
+            despachos.append((evento.tiempo, evento.proceso.pid, cpus[0].nivel[0]))
+
+    motor.suscribir(anotar)
+    for proceso in procesos:
+        motor.agregar(proceso)
+    motor.ejecutar()
+    return motor, despachos
+
+
+def dos_largos():
+    return [Proceso(1, "a", 6.0, 0.0, 6.0, None), Proceso(2, "b", 6.0, 0.0, 6.0, None)]
+
+
+def test_baja_un_nivel_por_quantum_agotado():
+    motor, despachos = correr([Proceso(1, "largo", 10.0, 0.0, 10.0, None)])
+    # slices de 1, 2, 4 y el resto en el último nivel (Round Robin)
+    assert despachos == [(0.0, 1, 0), (1.0, 1, 1), (3.0, 1, 2), (7.0, 1, 2)]
+    assert motor.completados[1]['completion'] == 10.0
+
+
+def test_espera_por_nivel():
+    motor, despachos = correr(dos_largos())
+    assert despachos == [(0.0, 1, 0), (1.0, 2, 0), (2.0, 1, 1), (4.0, 2, 1), (6.0, 1, 2), (9.0, 2, 2)]
+    esperas = motor.esperas_por_nivel()
+    assert [a.n for a in esperas] == [2, 2, 2]
+    assert [a.media for a in esperas] == [0.5, 1.5, 2.5]
+    assert [a.maximo for a in esperas] == [1.0, 2.0, 3.0]
+
+
+def test_boost_devuelve_todos_al_nivel_0():
+    _, despachos = correr(dos_largos(), boost=4.0)
+    # en t=4 y t=8 vencen los boosts: el que estaba en el nivel 1 o 2 vuelve al 0
+    assert despachos[:6] == [(0.0, 1, 0), (1.0, 2, 0), (2.0, 1, 1), (4.0, 2, 0), (5.0, 1, 0), (6.0, 2, 1)]
+    assert despachos[6] == (8.0, 1, 0)
+
+
+def test_envejecimiento_promueve_al_que_espera():
+    procesos = lambda: [Proceso(pid, f"p{pid}", 6.0, 0.0, 6.0, None) for pid in (1, 2, 3)]
+    _, sin_envejecer = correr(procesos())
+    _, envejeciendo = correr(procesos(), envejecimiento=2.0)
+    # el 1 baja al nivel 1 en t=1; en t=3 lleva 2 esperando y sube de nuevo al 0
+    assert sin_envejecer[3] == (3.0, 1, 1)
+    assert envejeciendo[3] == (3.0, 1, 0)
+    assert envejeciendo[4] == (4.0, 2, 0)
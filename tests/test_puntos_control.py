@@ -0,0 +1,49 @@
+import pytest
+
+import puntos_control
+from despacho import Despachador
+from generador import Generador
+from motor import MotorSimulacion
+from segmentos import AlmacenSegmentos
+from simular import crear_cpus, ejecutar_carga, ejecutar_con_puntos_control
+
+CONFIGURACIONES = [
+    dict(especs=["fcfs"], por_grupo=1, despachador=None, cambio_contexto=0.0, costo_migracion=0.0),
+    dict(especs=["sjf", "rr:0.5", "srtf"], por_grupo=1, despachador='robo', cambio_contexto=0.01,
+         costo_migracion=0.05),
+    dict(especs=["multinivel:0.5,1,2", "prioridad-exp"], por_grupo=2, despachador='robo',
+         cambio_contexto=0.01, costo_migracion=0.05),
+]
+
+
+def carga():
+    return Generador(tasa=3.0, media=1.0, semilla=7).tabla(3000)
+
+
+def armar(config):
+    despachador = None
+    if config['despachador'] == 'robo':
+        despachador = Despachador('menor_carga', robo=True, periodo=2.0)
+    return crear_cpus(4, config['especs'], por_grupo=config['por_grupo']), despachador
+
+
+@pytest.mark.parametrize("config", CONFIGURACIONES)
+def test_reanudar_a_mitad_da_el_mismo_resumen(tmp_path, config):
+    cpus, despachador = armar(config)
+    referencia = ejecutar_carga(carga(), cpus, despachador, None, config['cambio_contexto'],
+                                config['costo_migracion'])
+
+    # Corrida cortada a mitad, como la que arma ejecutar_con_puntos_control
+    cpus, despachador = armar(config)
+    tabla = carga()
+    motor = MotorSimulacion(cpus, despachador, False, config['cambio_contexto'], config['costo_migracion'])
+    segmentos = AlmacenSegmentos()
+    tabla.alimentar(motor)
+    motor.suscribir(segmentos.al_evento)
+    for _ in range(4000):
+        motor.paso()
+    assert motor.proximo_evento() is not None
+    ruta = str(tmp_path / "corrida.pcs")
+    puntos_control.guardar(ruta, puntos_control.capturar(motor=motor, carga=tabla, segmentos=segmentos))
+
+    assert ejecutar_con_puntos_control(ruta, 50.0) == referencia
@@ -0,0 +1,47 @@
+import csv
+
+import pytest
+
+from motor import MotorSimulacion
+from proceso import Proceso
+from registro import RegistroCompletados
+from simular import crear_cpus
+
+
+def test_registro_coincide_con_el_motor_con_es(tmp_path):
+    ruta = tmp_path / "terminados.csv"
+    registro = RegistroCompletados(str(ruta))
+    motor = MotorSimulacion(crear_cpus(1, ["fcfs"]))
+    motor.suscribir(registro.al_evento)
+    motor.agregar(Proceso(1, "es", 0, 0.0, 0, None, 5, (2, ("disco", 3), 1)))
+    motor.agregar(Proceso(2, "cpu", 4.0, 0.0, 4.0, None))
+    motor.ejecutar()
+    registro.cerrar()
+
+    with open(ruta, newline="", encoding="utf-8") as f:
+        filas = {int(fila['pid']): fila for fila in csv.DictReader(f)}
+    assert set(filas) == set(motor.completados)
+    for pid, esperado in motor.completados.items():
+        for campo in ('completion', 'turnaround', 'waiting'):
+            assert abs(float(filas[pid][campo]) - esperado[campo]) < 1e-4
+    # Sale del disco en t=5 y corre en t=6: esperó 1 s, no los 4 s de turnaround - cpu_time
+    assert abs(float(filas[1]['waiting']) - 1.0) < 1e-4
+
+
+def test_agrega_a_un_log_con_las_mismas_columnas(tmp_path):
+    ruta = tmp_path / "terminados.csv"
+    for pid in (1, 2):
+        registro = RegistroCompletados(str(ruta))
+        registro.registrar(Proceso(pid, f"p{pid}", 1.0, 0.0, 0.0, 1), 1.0)
+        registro.cerrar()
+    with open(ruta, newline="", encoding="utf-8") as f:
+        filas = list(csv.reader(f))
+    assert [fila[0] for fila in filas] == ['pid', '1', '2']  # una sola cabecera
+
+
+def test_no_agrega_a_un_csv_con_otras_columnas(tmp_path):
+    ruta = tmp_path / "ajeno.csv"
+    ruta.write_text("pid,cpu_time\n1,2\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="columnas"):
+        RegistroCompletados(str(ruta))
+    assert ruta.read_text(encoding="utf-8") == "pid,cpu_time\n1,2\n"
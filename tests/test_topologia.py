@@ -0,0 +1,52 @@
+from cpu import agrupar
+from motor import MotorSimulacion
+from proceso import Proceso
+from simular import crear_cpus
+
+
+def test_grupo_comparte_quantum_de_la_primera_cpu():
+    # La segunda CPU pide FCFS, pero el grupo usa el Round Robin de la primera
+    cpus = crear_cpus(2, ["rr:2", "fcfs"], por_grupo=2)
+    assert [cpu.algorithm for cpu in cpus] == ["Round Robin", "Round Robin"]
+    assert [cpu.quantum for cpu in cpus] == [2.0, 2.0]
+
+    tramos = []
+    motor = MotorSimulacion(cpus)
+    motor.suscribir(lambda e: tramos.append(e.duracion) if e.tipo == 'ejecucion' else None)
+    for pid in range(4):
+        motor.agregar(Proceso(pid, f"p{pid}", 10.0, 0.0, 10.0, None))
+    motor.ejecutar()
+    assert len(motor.completados) == 4
+    assert max(tramos) <= 2.0 + 1e-9
+
+
+def test_quantum_asignado_a_una_cpu_alcanza_al_grupo():
+    cpus = crear_cpus(2, ["rr:2"], por_grupo=2)
+    cpus[1].quantum = 0.5
+    assert [cpu.quantum for cpu in cpus] == [0.5, 0.5]
+
+
+def test_limpiar_procesos_conserva_la_cola_del_grupo():
+    cpus = crear_cpus(2, ["multinivel:0.5,1,2"], por_grupo=2)
+    cola = cpus[0].procesos
+    for pid in range(3):
+        cpus[1].asignar_proceso(Proceso(pid, f"p{pid}", 1.0, 0.0, 1.0, None))
+    cpus[1].limpiar_procesos()
+    assert all(cpu.procesos is cola for cpu in cpus)
+    assert len(cola) == 0
+    assert cola.quanta == (0.5, 1.0, 2.0)
+    assert [cpu.algorithm for cpu in cpus] == ["Multinivel", "Multinivel"]
+
+
+def test_cambiar_cpus_con_las_mismas_cpus_reagrupadas():
+    cpus = crear_cpus(4, ["fcfs"])
+    motor = MotorSimulacion(cpus)
+    for pid in range(12):
+        motor.agregar(Proceso(pid, f"p{pid}", 2.0, pid * 0.25, 2.0, None))
+    motor.avanzar_hasta(1.5)
+    # Las mismas CPUs, ahora de a dos por cola: cada proceso tiene que quedar una sola vez
+    motor.cambiar_cpus(agrupar(cpus, 2))
+    motor.ejecutar()
+    assert sorted(motor.completados) == list(range(12))
+    assert abs(sum(cpu.ocupado for cpu in cpus) - 24.0) < 1e-9
+    assert all(abs(cpu.carga) < 1e-9 for cpu in cpus)
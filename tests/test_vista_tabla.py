@@ -0,0 +1,50 @@
+import itertools
+
+from motor import MotorSimulacion
+from proceso import Proceso
+from simular import crear_cpus
+from vista_tabla import CAMPOS, TablaVirtual
+
+
+class ArbolFalso:
+    """Lo mínimo de ttk.Treeview que usa TablaVirtual, sin Tk"""
+
+    def __init__(self):
+        self.valores = {}
+        self._iids = itertools.count()
+
+    def __getitem__(self, clave):
+        return tuple(CAMPOS) if clave == 'columns' else None
+
+    def insert(self, padre, posicion, values=()):
+        return f"I{next(self._iids)}"
+
+    def item(self, iid, values=(), tags=()):
+        self.valores[iid] = values
+
+    def selection(self):
+        return ()
+
+    def __getattr__(self, nombre):  # config, heading, bind, detach, move, delete, set...
+        return lambda *args, **kwargs: None
+
+
+def test_la_fila_muestra_la_llegada_que_fija_el_motor():
+    arbol = ArbolFalso()
+    tabla = TablaVirtual(arbol, ArbolFalso(), filas_visibles=3)
+    motor = MotorSimulacion(crear_cpus(1, ["fcfs"]))
+    motor.suscribir(lambda e: tabla.marcar(e.proceso) if e.tipo == 'llegada' else None)
+    motor.agregar(Proceso(1, "a", 4.0, 0.0, 4.0, None))
+    motor.avanzar_hasta(2.5)
+
+    # Entregado con una llegada ya pasada: el motor la corre al tiempo actual al recibirlo
+    tardio = Proceso(2, "b", 1.0, 1.0, 1.0, None)
+    motor.recibir(tardio)
+    tabla.agregar(tardio)
+    tabla.refrescar()
+    assert ('2', 'b', '1.00', '1.00') in {tuple(map(str, v[:4])) for v in arbol.valores.values()}
+
+    motor.avanzar_hasta(3.0)
+    tabla.refrescar()
+    assert tardio.arrival_time == 2.5
+    assert ('2', 'b', '1.00', '2.50') in {tuple(map(str, v[:4])) for v in arbol.valores.values()}
@@ -0,0 +1,167 @@
+"""Grabación y reproducción de trazas reales del host
+
+Una traza es un archivo binario compacto:
+    cabecera  b'TRZ1' + intervalo (float64)
+    'N'       pid (int64), create_time (float64), largo + nombre utf-8 (la primera vez que aparece)
+    'M'       tiempo (float64), pid (int64), segundos de CPU (float32), nice (int32)
+
+Cada muestra 'M' es la CPU que consumió el proceso en [tiempo, tiempo + intervalo].
+Los procesos sin consumo no se escriben. Al reproducir, las muestras seguidas de
+un mismo proceso se unen en una ráfaga que llega al motor en su primer instante.
+
+Ejemplos:
+    python trazas.py grabar host.trz --intervalo 1 --duracion 600
+    python simular.py host.trz --cpus 8 -a rr:0.05
+"""
+import argparse
+import struct
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from importador import leer_procesos, prioridad_de_nice
+from tabla_procesos import TablaProcesos
+
+
+MAGIA = b'TRZ1'
+EXTENSION = '.trz'
+_CABECERA = struct.Struct('<d')
+_NOMBRE = struct.Struct('<qdH')
+_MUESTRA = struct.Struct('<dqfi')
+
+RegistroTraza = namedtuple('RegistroTraza', 'tiempo pid nombre cpu_segundos nice')
+
+
+def grabar_traza(ruta, intervalo=1.0, duracion=None, min_cpu=0.0, detener=None):
+    """Muestrear cpu_times de todos los procesos cada `intervalo` y escribir la traza
+
+    Corre hasta `duracion` segundos o hasta que se active `detener` (Event).
+    Devuelve la cantidad de muestras escritas.
+    """
+    detener = detener or threading.Event()
+    escritas = 0
+    conocidos = set()  # (pid, create_time) con el nombre ya escrito
+    with open(ruta, 'wb') as f:
+        f.write(MAGIA + _CABECERA.pack(intervalo))
+        previa = leer_procesos()
+        inicio = time.monotonic()
+        t_previo, pared_previa = 0.0, time.time()
+        while not detener.wait(max(0.0, t_previo + intervalo - (time.monotonic() - inicio))):
+            actual = leer_procesos()
+            t_actual, pared_actual = time.monotonic() - inicio, time.time()
+            for pid, (creado, cpu, nombre, nice) in actual.items():
+                antes = previa.get(pid)
+                if antes is not None and antes[0] == creado:
+                    delta = cpu - antes[1]
+                elif creado >= pared_previa:
+                    delta = cpu  # nació durante el intervalo: todo su consumo es nuevo
+                else:
+                    continue
+                if delta <= min_cpu:
+                    continue
+                if (pid, creado) not in conocidos:
+                    datos = (nombre or f"proc{pid}").encode('utf-8')[:0xFFFF]
+                    f.write(b'N' + _NOMBRE.pack(pid, creado, len(datos)) + datos)
+                    conocidos.add((pid, creado))
+                f.write(b'M' + _MUESTRA.pack(t_previo, pid, delta, nice if isinstance(nice, int) else 0))
+                escritas += 1
+            previa, t_previo, pared_previa = actual, t_actual, pared_actual
+            if duracion is not None and t_actual >= duracion:
+                break
+    return escritas
+
+
+class LectorTraza:
+    """Recorre una traza en orden de tiempo como RegistroTraza"""
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        with open(ruta, 'rb') as f:
+            cabecera = f.read(len(MAGIA) + _CABECERA.size)
+        if cabecera[:len(MAGIA)] != MAGIA:
+            raise ValueError(f"{ruta}: no es una traza ({MAGIA!r})")
+        self.intervalo, = _CABECERA.unpack_from(cabecera, len(MAGIA))
+
+    def __iter__(self):
+        nombres = {}
+        with open(self.ruta, 'rb') as f:
+            f.seek(len(MAGIA) + _CABECERA.size)
+            while True:
+                tipo = f.read(1)
+                if not tipo:
+                    return
+                if tipo == b'N':
+                    pid, _, largo = _NOMBRE.unpack(f.read(_NOMBRE.size))
+                    nombres[pid] = f.read(largo).decode('utf-8', 'replace')
+                elif tipo == b'M':
+                    tiempo, pid, cpu, nice = _MUESTRA.unpack(f.read(_MUESTRA.size))
+                    yield RegistroTraza(tiempo, pid, nombres.get(pid, f"proc{pid}"), cpu, nice)
+                else:
+                    raise ValueError(f"{self.ruta}: registro desconocido {tipo!r} en {f.tell() - 1}")
+
+
+def cargar_traza(ruta, escala=1.0, unir=True):
+    """Traza -> TablaProcesos, una fila por ráfaga
+
+    Con unir=True las muestras de intervalos consecutivos de un mismo proceso
+    forman una sola ráfaga. Los PIDs simulados son correlativos; el del host
+    queda en el nombre ("nombre[pid]") porque un proceso aporta varias ráfagas.
+    """
+    lector = LectorTraza(ruta)
+    tabla = TablaProcesos()
+    abiertas = {}  # pid del host -> [inicio, cpu, último tiempo, nombre, nice]
+
+    def cerrar(pid, rafaga):
+        inicio, cpu, _, nombre, nice = rafaga
+        tabla.agregar(len(tabla) + 1, cpu * escala, inicio, prioridad_de_nice(nice), nombre=f"{nombre}[{pid}]")
+
+    tolerancia = lector.intervalo * 1.5
+    for r in lector:
+        rafaga = abiertas.get(r.pid)
+        if unir and rafaga is not None and r.tiempo - rafaga[2] <= tolerancia:
+            rafaga[1] += r.cpu_segundos
+            rafaga[2] = r.tiempo
+            continue
+        if rafaga is not None:
+            cerrar(r.pid, rafaga)
+        abiertas[r.pid] = [r.tiempo, r.cpu_segundos, r.tiempo, r.nombre, r.nice]
+    for pid, rafaga in abiertas.items():
+        cerrar(pid, rafaga)
+    return tabla
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Grabar o inspeccionar trazas de CPU del host")
+    sub = parser.add_subparsers(dest='accion', required=True)
+
+    grabar = sub.add_parser('grabar', help="muestrear el host y escribir una traza")
+    grabar.add_argument('salida', help="archivo .trz")
+    grabar.add_argument('--intervalo', type=float, default=1.0, help="segundos entre muestras")
+    grabar.add_argument('--duracion', type=float, default=None, help="segundos a grabar (Ctrl+C para cortar)")
+    grabar.add_argument('--min-cpu', type=float, default=0.0, help="ignorar consumos de hasta estos segundos")
+
+    resumen = sub.add_parser('resumen', help="ráfagas y CPU total de una traza")
+    resumen.add_argument('traza')
+    resumen.add_argument('--escala', type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    if args.accion == 'grabar':
+        detener = threading.Event()
+        try:
+            n = grabar_traza(args.salida, args.intervalo, args.duracion, args.min_cpu, detener)
+        except KeyboardInterrupt:
+            detener.set()
+            n = None
+        sys.stdout.write(f"Traza escrita en {args.salida}" + (f" ({n} muestras)\n" if n is not None else "\n"))
+    else:
+        tabla = cargar_traza(args.traza, args.escala)
+        cpu = tabla.columna('cpu_time')
+        llegadas = tabla.columna('arrival_time')
+        sys.stdout.write(f"Ráfagas: {len(tabla)}\n")
+        if len(tabla):
+            sys.stdout.write(f"CPU total: {sum(cpu):.2f}s en {max(llegadas):.1f}s de traza\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+import threading
+from bisect import bisect_left, bisect_right, insort
+
+
+# Encabezado del Treeview -> atributo de Proceso por el que se ordena/filtra
+CAMPOS = {
+    "PID": 'pid',
+    "Nombre": 'nombre',
+    "CPU Time": 'cpu_time',
+    "Arrival Time": 'arrival_time',
+    "Remaining Time": 'remaining_time',
+    "Priority": 'priority',
+}
+
+
+class IndiceOrdenado:
+    """Índice (valor, pid) ordenado por un campo: rango y posición en O(log n)"""
+
+    def __init__(self, campo):
+        self.campo = campo
+        self._claves = []
+        self._actual = {}  # pid -> clave indexada
+
+    def construir(self, procesos):
+        self._actual = {p.pid: (getattr(p, self.campo), p.pid) for p in procesos}
+        self._claves = sorted(self._actual.values())
+
+    def agregar(self, proceso):
+        clave = (getattr(proceso, self.campo), proceso.pid)
+        self._actual[proceso.pid] = clave
+        insort(self._claves, clave)
+
+    def quitar(self, pid):
+        clave = self._actual.pop(pid, None)
+        if clave is not None:
+            del self._claves[bisect_left(self._claves, clave)]
+
+    def actualizar(self, proceso):
+        """Reindexar solo si cambió el valor del campo"""
+        if self._actual.get(proceso.pid) != (getattr(proceso, self.campo), proceso.pid):
+            self.quitar(proceso.pid)
+            self.agregar(proceso)
+
+    def __contains__(self, pid):
+        return pid in self._actual
+
+    def __len__(self):
+        return len(self._claves)
+
+    def pid_en(self, posicion):
+        return self._claves[posicion][1]
+
+    def rango(self, desde, hasta):
+        """Posiciones [i, j) con desde <= valor <= hasta"""
+        return bisect_left(self._claves, (desde,)), bisect_right(self._claves, (hasta, float('inf')))
+
+    def rango_prefijo(self, prefijo):
+        return bisect_left(self._claves, (prefijo,)), bisect_left(self._claves, (prefijo + '\U0010ffff',))
+
+
+class TablaVirtual:
+    """Treeview virtual: solo existen las filas visibles (~30), el resto vive en el índice
+
+    Los cambios se anotan (agregar/quitar/marcar) y refrescar() actualiza el
+    índice solo para esos procesos y vuelve a pintar la ventana visible.
+    Ordenar (clic en el encabezado) reconstruye un único índice; filtrar por
+    la columna ordenada es una búsqueda binaria sobre él.
+    """
+
+    def __init__(self, tree, scrollbar, alto_fila=35, filas_visibles=30):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.alto_fila = alto_fila
+
+        self._procesos = {}  # pid -> proceso (el almacén de la tabla)
+        self._indice = IndiceOrdenado('pid')
+        self._descendente = False
+        self._filtro = ''
+        self._inicio = 0  # primera fila visible dentro del rango filtrado
+        self._pid_seleccionado = None
+
+        self._sucios = set()  # pids a reindexar en el próximo refresco
+        self._bajas = set()
+        self._lock = threading.Lock()  # los cambios llegan también desde el hilo de simulación
+
+        self._fijos = {}  # pid -> columnas que casi no cambian (ya formateadas)
+        self._filas = []  # iids de las filas reutilizables del Treeview
+        self._mostrado = []  # lo que muestra cada fila, para no tocar las que no cambian
+
+        scrollbar.config(command=self._desplazar)
+        tree.config(yscrollcommand='')
+        for col in tree['columns']:
+            tree.heading(col, command=lambda c=col: self.ordenar_por(c))
+        tree.bind('<MouseWheel>', lambda e: self._rueda(-1 if e.delta > 0 else 1))
+        tree.bind('<Button-4>', lambda e: self._rueda(-1))
+        tree.bind('<Button-5>', lambda e: self._rueda(1))
+        tree.bind('<Configure>', self._al_redimensionar)
+        tree.bind('<<TreeviewSelect>>', self._al_seleccionar)
+        self._ajustar_filas(filas_visibles)
+        self._dibujar()
+
+    # ------------------------- cambios del modelo -------------------------
+    def agregar(self, proceso):
+        with self._lock:
+            self._procesos[proceso.pid] = proceso
+            self._bajas.discard(proceso.pid)
+            self._sucios.add(proceso.pid)
+
+    def quitar(self, pid):
+        with self._lock:
+            self._procesos.pop(pid, None)
+            self._sucios.discard(pid)
+            self._bajas.add(pid)
+
+    def marcar(self, proceso):
+        """Anotar que cambió algún dato visible del proceso"""
+        with self._lock:
+            if proceso.pid in self._procesos:
+                self._sucios.add(proceso.pid)
+
+    def refrescar(self):
+        with self._lock:
+            sucios, self._sucios = self._sucios, set()
+            bajas, self._bajas = self._bajas, set()
+            cambios = [self._procesos[pid] for pid in sucios if pid in self._procesos]
+
+        for pid in bajas:
+            self._indice.quitar(pid)
+            self._fijos.pop(pid, None)
+        for proceso in cambios:
+            # el motor puede correr arrival_time al vaciar su cola de entrada
+            self._fijos.pop(proceso.pid, None)
+            if proceso.pid in self._indice:
+                self._indice.actualizar(proceso)
+            else:
+                self._indice.agregar(proceso)
+        self._dibujar()
+
+    def __len__(self):
+        return len(self._procesos)
+
+    def __contains__(self, pid):
+        return pid in self._procesos
+
+    # ------------------------- orden y filtro -------------------------
+    def ordenar_por(self, columna):
+        campo = CAMPOS[columna]
+        if campo == self._indice.campo:
+            self._descendente = not self._descendente
+        else:
+            self.refrescar()  # aplicar cambios pendientes antes de reconstruir
+            self._indice = IndiceOrdenado(campo)
+            self._indice.construir(self._procesos.values())
+            self._descendente = False
+        for col in self.tree['columns']:
+            flecha = (' ▼' if self._descendente else ' ▲') if CAMPOS[col] == campo else ''
+            self.tree.heading(col, text=col + flecha)
+        self._inicio = 0
+        self._dibujar()
+
+    def filtrar(self, texto):
+        """Filtrar por la columna ordenada: prefijo para Nombre, 'a' o 'a-b' para números"""
+        self._filtro = texto.strip()
+        self._inicio = 0
+        self._dibujar()
+
+    def _rango_filtrado(self):
+        indice = self._indice
+        if not self._filtro:
+            return 0, len(indice)
+        if indice.campo == 'nombre':
+            return indice.rango_prefijo(self._filtro)
+        desde, _, hasta = self._filtro.partition('-')
+        try:
+            desde = float(desde)
+            hasta = float(hasta) if hasta.strip() else desde
+        except ValueError:
+            return 0, len(indice)  # filtro incompleto o inválido: mostrar todo
+        return indice.rango(desde, hasta)
+
+    # ------------------------- ventana visible -------------------------
+    def _ajustar_filas(self, cantidad):
+        while len(self._filas) < cantidad:
+            # las filas nacen desenganchadas; _dibujar las engancha en su posición
+            iid = self.tree.insert("", "end", values=())
+            self.tree.detach(iid)
+            self._filas.append(iid)
+            self._mostrado.append(None)
+        while len(self._filas) > cantidad:
+            self.tree.delete(self._filas.pop())
+            self._mostrado.pop()
+
+    def _al_redimensionar(self, event):
+        cantidad = max(1, event.height // self.alto_fila - 1)  # menos el encabezado
+        if cantidad != len(self._filas):
+            self._ajustar_filas(cantidad)
+            self._dibujar()
+
+    def _dibujar(self):
+        i, j = self._rango_filtrado()
+        total = max(0, j - i)
+        visibles = len(self._filas)
+        self._inicio = max(0, min(self._inicio, total - visibles))
+
+        seleccion = ()
+        for k, iid in enumerate(self._filas):
+            r = self._inicio + k
+            if r < total:
+                pid = self._indice.pid_en(j - 1 - r if self._descendente else i + r)
+                valores = self._valores(self._procesos[pid])
+                mostrar = (valores, 'evenrow' if r % 2 == 0 else 'oddrow')
+                if pid == self._pid_seleccionado:
+                    seleccion = (iid,)
+            else:
+                mostrar = None
+
+            if mostrar != self._mostrado[k]:
+                if mostrar is None:
+                    self.tree.detach(iid)
+                else:
+                    if self._mostrado[k] is None:
+                        self.tree.move(iid, "", k)
+                    self.tree.item(iid, values=mostrar[0], tags=(mostrar[1],))
+                self._mostrado[k] = mostrar
+
+        if self.tree.selection() != seleccion:
+            self.tree.selection_set(seleccion)
+
+        if total:
+            self.scrollbar.set(self._inicio / total, min(1.0, (self._inicio + visibles) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _desplazar(self, accion, cantidad, unidad=None):
+        i, j = self._rango_filtrado()
+        if accion == 'moveto':
+            self._inicio = int(float(cantidad) * (j - i))
+        else:
+            paso = len(self._filas) if unidad == 'pages' else 1
+            self._inicio += int(cantidad) * paso
+        self._dibujar()
+
+    def _rueda(self, sentido):
+        self._inicio += 3 * sentido
+        self._dibujar()
+        return "break"
+
+    def _al_seleccionar(self, event):
+        seleccion = self.tree.selection()
+        if seleccion:
+            mostrado = self._mostrado[self._filas.index(seleccion[0])]
+            if mostrado is not None:
+                self._pid_seleccionado = mostrado[0][0]
+
+    def _valores(self, proceso):
+        fijos = self._fijos.get(proceso.pid)
+        if fijos is None:
+            # arrival y cpu_time se formatean una vez por cambio, no en cada dibujo
+            arrival = f"{proceso.arrival_time:.2f}" if proceso.arrival_time else "0"
+            fijos = (proceso.pid, proceso.nombre, f"{proceso.cpu_time:.2f}", arrival)
+            self._fijos[proceso.pid] = fijos
+        return fijos + (f"{proceso.remaining_time:.2f}", getattr(proceso, 'priority', '-'))
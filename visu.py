@@ -1,16 +1,28 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import psutil
+from tkinter import ttk, messagebox, filedialog
+import itertools
+import os
 import threading
 import time
-from random import uniform, randint
-from datetime import datetime
 
 from proceso import Proceso
-from cpu import CPU
+from cpu import crear_topologia, cpus_del_host
+from motor import MotorSimulacion, AsignadorUmbral
+from despacho import ESTRATEGIAS, crear_despachador
+from registro import RegistroCompletados
+from vista_tabla import TablaVirtual
+from gantt import VistaGantt
+from segmentos import AlmacenSegmentos
+from importador import ImportadorHost
+from cargas import parsear_rafagas
+import paleta
+import puntos_control
 
 
 class VisualizadorProcesos:
+    CPUS_EN_CONFIG = 4  # filas por CPU en la configuración; el resto se configura con "Todas"
+    PIDS_EN_COLA = 3  # PIDs de la cola que se muestran por CPU
+
     def __init__(self, root):
         self.root = root
         self.root.title("Visualizador de Procesos - Sistema de Planificación")
@@ -33,14 +45,23 @@ class VisualizadorProcesos:
         self.root.configure(bg=self.colors['bg_primary'])
 
         self.procesos = []
-        self.assigned_pids = set()
-        self.cpus = [CPU(id=i + 1) for i in range(4)]
+        self.cpus = crear_topologia(4)
+        self._cpus_sucias = set()  # cpu_id con eventos desde el último refresco del panel
+        self._cpus_panel = {}
 
-        # Colas multinivel (globales)
-        self.high_queue = []  # procesos de máxima prioridad (se procesan con RR)
-        self.low_queue = []   # procesos de mínima prioridad (se procesan con FCFS)
+        # Reparto multinivel: alta prioridad -> RR, baja prioridad -> FCFS
         self.priority_threshold = 5  # valor por encima o igual => alta prioridad
         self.default_rr_quantum = 1.0
+        self.asignador = AsignadorUmbral(self.priority_threshold, self.default_rr_quantum)
+        self.reparto = 'umbral'  # o una estrategia de despacho.ESTRATEGIAS
+
+        # Motor de eventos discretos: la ventana es solo un consumidor más
+        self.motor = MotorSimulacion(self.cpus, self.asignador)
+        self.motor.suscribir(self._on_evento_motor)
+
+        # Log CSV de completados: buffer + hilo escritor, nunca bloquea la simulación
+        self.registro = self._abrir_registro("procesos_terminados.csv")
+        self.motor.suscribir(self.registro.al_evento)
 
         # Crear interfaz mejorada
         self._create_header()
@@ -51,8 +72,24 @@ class VisualizadorProcesos:
         # Estado de simulación
         self.sim_thread = None
         self.sim_running = False
-        self.sim_lock = threading.Lock()
-        self.completed_info = {}
+        self.sim_lock = threading.RLock()
+        self.completed_info = self.motor.completados
+        self.gantt_segments = AlmacenSegmentos()
+        self.importador = None  # muestreo del host en segundo plano (ImportadorHost)
+
+        # Puntos de control periódicos; comprimir y escribir lo hace otro hilo
+        self.punto_control = "simulacion" + puntos_control.EXTENSION
+        self.punto_control_cada = 30.0  # segundos reales entre capturas
+        self.escritor_pc = None
+
+    def _abrir_registro(self, ruta):
+        """Log de completados; un archivo anterior con otras columnas se aparta, no se mezcla"""
+        try:
+            return RegistroCompletados(ruta)
+        except ValueError as e:
+            os.replace(ruta, ruta + ".anterior")
+            messagebox.showwarning("Log de completados", f"{e}\nSe movió a {ruta}.anterior y se empieza uno nuevo.")
+            return RegistroCompletados(ruta)
 
     def _create_header(self):
         """Crear header moderno con gradiente"""
@@ -133,6 +170,27 @@ class VisualizadorProcesos:
         style.map('Custom.Treeview', background=[('selected', self.colors['bg_button'])])
         style.map('Custom.Treeview.Heading', background=[('active', '#5568d3')])
 
+        # Filtro sobre la columna por la que se ordena (clic en el encabezado)
+        filter_frame = tk.Frame(table_frame, bg=self.colors['bg_primary'])
+        filter_frame.pack(fill=tk.X, pady=(0, 5))
+        tk.Label(
+            filter_frame,
+            text="🔍 Filtrar columna ordenada (Nombre: prefijo, números: a o a-b):",
+            font=('Segoe UI', 10),
+            bg=self.colors['bg_primary'],
+            fg=self.colors['text_secondary']
+        ).pack(side=tk.LEFT)
+        filter_var = tk.StringVar()
+        tk.Entry(
+            filter_frame,
+            textvariable=filter_var,
+            font=('Segoe UI', 10),
+            relief=tk.FLAT,
+            bg='white',
+            fg=self.colors['text_primary']
+        ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10, 0), ipady=4)
+        filter_var.trace_add('write', lambda *args: self.vista_tabla.filtrar(filter_var.get()))
+
         # Scrollbar
         scrollbar = ttk.Scrollbar(table_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -142,12 +200,9 @@ class VisualizadorProcesos:
             table_frame,
             columns=("PID", "Nombre", "CPU Time", "Arrival Time", "Remaining Time", "Priority"),
             show="headings",
-            style="Custom.Treeview",
-            yscrollcommand=scrollbar.set
+            style="Custom.Treeview"
         )
 
-        scrollbar.config(command=self.tree.yview)
-
         # Configurar columnas
         columns_config = {
             "PID": 80,
@@ -168,6 +223,10 @@ class VisualizadorProcesos:
         self.tree.tag_configure('oddrow', background='#f8f9fa')
         self.tree.tag_configure('evenrow', background='white')
 
+        # Tabla virtual: el Treeview solo contiene las filas visibles y el
+        # scrollbar recorre el índice ordenado de todos los procesos
+        self.vista_tabla = TablaVirtual(self.tree, scrollbar, alto_fila=35)
+
     def _create_button_panel(self):
         """Panel de botones mejorado"""
         btn_frame = tk.Frame(self.root, bg=self.colors['bg_primary'])
@@ -179,6 +238,7 @@ class VisualizadorProcesos:
             ("🗑️ Eliminar Proceso", self.eliminar_proceso, self.colors['danger']),
             ("💻 Asignar a CPUs", self.asignar_procesos_a_cpus, self.colors['warning']),
             ("⚙️ Configurar CPUs", self.configurar_cpus, self.colors['info']),
+            ("📂 Abrir Punto de Control", self.abrir_punto_control, self.colors['bg_button']),
             ("▶️ Simular en Vivo", self.abrir_simulador_en_vivo, '#38ef7d')
         ]
 
@@ -224,21 +284,8 @@ class VisualizadorProcesos:
         return f'#{r:02x}{g:02x}{b:02x}'
 
     def actualizar_tabla(self):
-        """Actualizar tabla con colores alternados"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        for idx, proceso in enumerate(self.procesos):
-            arrival = datetime.fromtimestamp(proceso.arrival_time).strftime("%Y-%m-%d %H:%M:%S") if proceso.arrival_time else "0"
-            tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
-            self.tree.insert("", "end", values=(
-                proceso.pid,
-                proceso.nombre,
-                f"{proceso.cpu_time:.2f}",
-                arrival,
-                f"{proceso.remaining_time:.2f}",
-                getattr(proceso, 'priority', '-')
-            ), tags=(tag,))
+        """Aplicar a la tabla solo las altas, bajas y filas modificadas"""
+        self.vista_tabla.refrescar()
 
         # Actualizar métricas
         self.metric_processes.config(text=str(len(self.procesos)))
@@ -249,11 +296,10 @@ class VisualizadorProcesos:
     def agregar_proceso(self):
         # Importaciones locales para asegurar que no falten
         from random import uniform, randint
-        import time
         
         ventana_agregar = tk.Toplevel(self.root)
         ventana_agregar.title("Agregar Proceso")
-        ventana_agregar.geometry("450x480")
+        ventana_agregar.geometry("450x560")
         ventana_agregar.configure(bg='white')
 
         # Header
@@ -286,7 +332,8 @@ class VisualizadorProcesos:
             ("PID:", "entry_pid", str(next_pid)),
             ("Nombre:", "entry_nombre", default_name),
             ("CPU Time (s):", "entry_cpu_time", default_cpu),
-            ("Priority (0-10):", "entry_priority", default_prio)
+            ("Priority (0-10):", "entry_priority", default_prio),
+            ("Ráfagas CPU;E/S;CPU... (opcional, ej. 2;disco:1;3):", "entry_rafagas", "")
         ]
 
         self.entry_widgets = {} # Usamos self para mantener referencias vivas
@@ -321,13 +368,18 @@ class VisualizadorProcesos:
                 nombre = self.entry_widgets['entry_nombre'].get()
                 cpu_time = float(self.entry_widgets['entry_cpu_time'].get())
                 priority = int(self.entry_widgets['entry_priority'].get())
+                texto_rafagas = self.entry_widgets['entry_rafagas'].get().strip()
+                rafagas = parsear_rafagas(texto_rafagas) if texto_rafagas else None
                 
-                if any(p.pid == pid for p in self.procesos):
+                if pid in self.vista_tabla:
                     messagebox.showwarning("Error", f"El PID {pid} ya existe.")
                     return
 
-                nuevo = Proceso(pid, nombre, cpu_time, time.time(), cpu_time, None, priority)
+                # con ráfagas, CPU Time pasa a ser la suma de las de CPU
+                nuevo = Proceso(pid, nombre, cpu_time, self.motor.sim_time, cpu_time, None, priority, rafagas)
                 self.procesos.append(nuevo)
+                self.vista_tabla.agregar(nuevo)
+                self.motor.recibir(nuevo)  # entra al motor en el próximo paso
                 self.actualizar_tabla()
                 ventana_agregar.destroy()
                 print(f"DEBUG: Proceso {nombre} guardado correctamente.")
@@ -346,66 +398,96 @@ class VisualizadorProcesos:
         btn_guardar.focus_set()
 
     def importar_procesos(self):
-        # 1. Obtener lista temporal de todos los procesos con sus datos
-        raw_procs = []
-        try:
-            # Iteramos una vez para capturar datos
-            for p in psutil.process_iter(['pid', 'name', 'cpu_percent', 'cpu_times']):
-                try:
-                    # Forzamos una lectura de CPU (psutil a veces requiere esto para actualizar)
-                    p.cpu_percent(interval=None) 
-                    raw_procs.append(p)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-        except Exception as e:
-            print(f"Error leyendo procesos: {e}")
+        ventana_importar = tk.Toplevel(self.root)
+        ventana_importar.title("Importar Procesos del Sistema")
+        ventana_importar.geometry("450x560")
+        ventana_importar.configure(bg='white')
 
-        # 2. ORDENAR por uso de CPU (descendente)
-        # Queremos ver los que están haciendo algo, no los que están en 0%
-        # Usamos un valor por defecto 0.0 si no se puede leer
-        raw_procs.sort(key=lambda p: p.info.get('cpu_percent') or 0.0, reverse=True)
+        header = tk.Frame(ventana_importar, bg=self.colors['bg_header'], height=60)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        tk.Label(
+            header, text="📥 Importar del Host", font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['bg_header'], fg='white'
+        ).pack(pady=15)
 
-        # 3. SELECCIONAR solo el TOP 25
-        top_procs = raw_procs[:25]
-        
-        count = 0
-        existing_pids = {p.pid for p in self.procesos}
+        content = tk.Frame(ventana_importar, bg='white')
+        content.pack(fill=tk.BOTH, expand=True, padx=30, pady=20)
 
-        for p in top_procs:
+        imp = self.importador
+        fields = [
+            ("Top N procesos (0 = todos):", 'top_n', str(imp.top_n or 0) if imp else "25"),
+            ("Filtro por nombre:", 'filtro', imp.filtro if imp else ""),
+            ("CPU mínima (%):", 'min_cpu', str(imp.min_cpu) if imp else "0"),
+            ("Muestreo (s):", 'intervalo', str(imp.intervalo) if imp else "1.0"),
+            ("Refrescar cada (s, 0 = una vez):", 'refresco', str(imp.refresco) if imp else "0"),
+        ]
+        entries = {}
+        for label_text, clave, default_val in fields:
+            tk.Label(
+                content, text=label_text, font=('Segoe UI', 11),
+                bg='white', fg=self.colors['text_primary']
+            ).pack(anchor='w', pady=(6, 2))
+            entry = tk.Entry(content, font=('Segoe UI', 11), relief=tk.FLAT, bg='#f7fafc',
+                             fg=self.colors['text_primary'])
+            entry.insert(0, default_val)
+            entry.pack(fill=tk.X, ipady=6)
+            entries[clave] = entry
+
+        def iniciar():
             try:
-                pid = p.info['pid']
-                if pid in existing_pids:
-                    continue
-                
-                nombre = p.info.get('name') or f"proc{pid}"
-                
-                # Calcular tiempo de ráfaga
-                ct = p.info.get('cpu_times')
-                if ct:
-                    # Si el proceso real tiene tiempo acumulado, usamos una fracción
-                    # para que no sea infinito en la simulación
-                    raw_time = (ct.user + ct.system)
-                    # Truco: Si es muy grande, lo limitamos a algo visible (ej. entre 2 y 8 seg)
-                    if raw_time > 10:
-                        cpu_time = uniform(4.0, 12.0)
-                    else:
-                        cpu_time = max(1.0, raw_time)
-                else:
-                    cpu_time = uniform(1.0, 5.0)
+                top_n = int(entries['top_n'].get())
+                min_cpu = float(entries['min_cpu'].get())
+                intervalo = float(entries['intervalo'].get())
+                refresco = float(entries['refresco'].get())
+            except ValueError:
+                messagebox.showerror("Error", "Revise que los números sean válidos.")
+                return
+            if intervalo <= 0 or refresco < 0:
+                messagebox.showerror("Error", "El muestreo debe ser positivo y el refresco no negativo.")
+                return
+            if self.importador is not None:
+                self.importador.detener()
+            # El muestreo corre en su propio hilo y entrega cada proceso al motor;
+            # la tabla se entera de cada lote por root.after
+            self.importador = ImportadorHost(
+                self.motor,
+                lambda procesos: self.root.after(0, self._recibir_importados, procesos, refresco == 0),
+                top_n=top_n or None, min_cpu=min_cpu, filtro=entries['filtro'].get().strip(),
+                intervalo=intervalo, refresco=refresco,
+                primer_pid=max((p.pid for p in self.procesos), default=0) + 1,
+            ).iniciar()
+            self.metric_status.config(text="Importando...")
+            ventana_importar.destroy()
+
+        def detener():
+            if self.importador is not None:
+                self.importador.detener()
+            self.metric_status.config(text="Listo")
+            ventana_importar.destroy()
 
-                arrival_time = time.time()
-                priority = randint(0, 10)
-                
-                nuevo_proceso = Proceso(pid, nombre, cpu_time, arrival_time, cpu_time, None, priority)
-                self.procesos.append(nuevo_proceso)
-                existing_pids.add(pid)
-                count += 1
-                
-            except Exception:
-                continue
+        tk.Button(
+            content, text="Importar", command=iniciar,
+            bg=self.colors['accent'], fg='white', font=('Segoe UI', 11, 'bold'),
+            relief=tk.FLAT, cursor='hand2', padx=20, pady=10
+        ).pack(pady=(15, 5))
+        if imp is not None and imp.activo:
+            tk.Button(
+                content, text="Detener espejo del host", command=detener,
+                bg=self.colors['danger'], fg='white', font=('Segoe UI', 11, 'bold'),
+                relief=tk.FLAT, cursor='hand2', padx=20, pady=10
+            ).pack()
+
+    def _recibir_importados(self, procesos, avisar):
+        """Mostrar los procesos que el importador ya entregó al motor (en el hilo de Tk)"""
+        for proceso in procesos:
+            self.procesos.append(proceso)
+            self.vista_tabla.agregar(proceso)
 
         self.actualizar_tabla()
-        messagebox.showinfo("Importación Inteligente", f"Se importaron los {count} procesos más activos del sistema.") 
+        if avisar:
+            self.metric_status.config(text="Listo")
+            messagebox.showinfo("Importación Inteligente", f"Se importaron los {len(procesos)} procesos más activos del sistema.")
 
     def eliminar_proceso(self):
         seleccion = self.tree.selection()
@@ -414,10 +496,12 @@ class VisualizadorProcesos:
             return
 
         pid_seleccionado = int(self.tree.item(seleccion, 'values')[0])
-        self.procesos = [p for p in self.procesos if p.pid != pid_seleccionado]
-        for cpu in self.cpus:
-            cpu.procesos = [p for p in cpu.procesos if p.pid != pid_seleccionado]
-        self.assigned_pids.discard(pid_seleccionado)
+        with self.sim_lock:
+            for p in self.procesos:
+                if p.pid == pid_seleccionado:
+                    self.motor.eliminar(p)
+            self.procesos = [p for p in self.procesos if p.pid != pid_seleccionado]
+        self.vista_tabla.quitar(pid_seleccionado)
         self.actualizar_tabla()
         messagebox.showinfo("Éxito", "Proceso eliminado correctamente")
 
@@ -427,48 +511,16 @@ class VisualizadorProcesos:
                 messagebox.showwarning("Advertencia", "No hay procesos para asignar.")
             return
 
-        # 1) limpiar CPUs
-        for cpu in self.cpus:
-            cpu.limpiar_procesos()
-        self.assigned_pids.clear()
+        # 1) parámetros actuales del reparto multinivel
+        if isinstance(self.asignador, AsignadorUmbral):
+            self.asignador.umbral = self.priority_threshold
+            self.asignador.quantum = self.default_rr_quantum
 
-        # 2) construir colas globales (Consideramos todos los procesos actuales)
-        # Nota: Al reasignar, tomamos todos para redistribuir carga
-        self.high_queue = [p for p in self.procesos if p.priority >= self.priority_threshold]
-        self.high_queue.sort(key=lambda p: p.arrival_time)
-        
-        self.low_queue = [p for p in self.procesos if p.priority < self.priority_threshold]
-        self.low_queue.sort(key=lambda p: p.arrival_time)
-
-        # 3) asignar high priority (RR)
-        cpu_count = len(self.cpus)
-        idx = 0
-        while self.high_queue:
-            proceso = self.high_queue.pop(0)
-            cpu = self.cpus[idx % cpu_count]
-            cpu.asignar_proceso(proceso)
-            
-            cpu.algorithm = "Round Robin"
-            if cpu.quantum is None:
-                cpu.quantum = self.default_rr_quantum
-            
-            proceso.cpu_id = cpu.id
-            self.assigned_pids.add(proceso.pid)
-            idx += 1
-
-        # 4) asignar low priority (FCFS)
-        idx = 0
-        while self.low_queue:
-            proceso = self.low_queue.pop(0)
-            cpu = self.cpus[idx % cpu_count]
-            cpu.asignar_proceso(proceso)
-            
-            if cpu.algorithm != "Round Robin":
-                cpu.algorithm = "FCFS"
-            
-            proceso.cpu_id = cpu.id
-            self.assigned_pids.add(proceso.pid)
-            idx += 1
+        # 2) los procesos nuevos ya esperan en la cola de entrada del motor
+        # (recibir); los ya asignados conservan su CPU, su posición y su progreso.
+        # Procesar las llegadas ya para que se vean en las colas de cada CPU
+        with self.sim_lock:
+            self.motor.avanzar_hasta(self.motor.sim_time)
 
         # --- 2. EL CAMBIO CLAVE ESTÁ AQUÍ ---
         if not silent:
@@ -477,7 +529,7 @@ class VisualizadorProcesos:
     def configurar_cpus(self):
         ventana_config = tk.Toplevel(self.root)
         ventana_config.title("Configurar CPUs")
-        ventana_config.geometry("700x450")
+        ventana_config.geometry("950x650")
         ventana_config.configure(bg='white')
 
         # Header
@@ -495,13 +547,52 @@ class VisualizadorProcesos:
         content = tk.Frame(ventana_config, bg='white')
         content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
-        for cpu in self.cpus:
+        # Topología: cantidad de CPUs y cuántas comparten cada cola
+        topo_frame = tk.Frame(content, bg='white')
+        topo_frame.pack(fill=tk.X, pady=(0, 8))
+        tk.Label(topo_frame, text="CPUs:", bg='white', fg=self.colors['text_primary']).grid(row=0, column=0, sticky='w')
+        spin_cpus = tk.Spinbox(topo_frame, from_=1, to=4096, width=6)
+        spin_cpus.delete(0, tk.END)
+        spin_cpus.insert(0, str(len(self.cpus)))
+        spin_cpus.grid(row=0, column=1, padx=(5, 5))
+
+        def del_host():
+            spin_cpus.delete(0, tk.END)
+            spin_cpus.insert(0, str(cpus_del_host()))
+
+        tk.Button(topo_frame, text="Del host", command=del_host, bg=self.colors['bg_button'], fg='white',
+                  font=('Segoe UI', 9, 'bold'), relief=tk.FLAT, cursor='hand2', padx=10).grid(row=0, column=2, padx=(0, 20))
+        tk.Label(topo_frame, text="CPUs por grupo (cola compartida):", bg='white',
+                 fg=self.colors['text_primary']).grid(row=0, column=3, sticky='w')
+        spin_grupo = tk.Spinbox(topo_frame, from_=1, to=4096, width=6)
+        spin_grupo.delete(0, tk.END)
+        spin_grupo.insert(0, str(len(self.cpus[0].grupo.cpus) if self.cpus[0].grupo is not None else 1))
+        spin_grupo.grid(row=0, column=4, padx=(5, 20))
+
+        def aplicar_topologia():
+            try:
+                cantidad = int(spin_cpus.get())
+                por_grupo = int(spin_grupo.get())
+                if cantidad < 1 or por_grupo < 1:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Error", "La cantidad de CPUs y el tamaño de grupo deben ser enteros positivos")
+                return
+            self._cambiar_topologia(cantidad, por_grupo)
+            ventana_config.destroy()
+            self.configurar_cpus()  # las filas por CPU cambiaron
+
+        tk.Button(topo_frame, text="Aplicar", command=aplicar_topologia, bg=self.colors['accent'], fg='white',
+                  font=('Segoe UI', 9, 'bold'), relief=tk.FLAT, cursor='hand2', padx=10).grid(row=0, column=5)
+
+        # "Todas" y las primeras CPUs; con cientos no entran todas en la ventana
+        for cpu in [None, *self.cpus[:self.CPUS_EN_CONFIG]]:
             frame_cpu = tk.Frame(content, bg='#f7fafc', relief=tk.FLAT, bd=1)
             frame_cpu.pack(pady=8, fill=tk.X, ipady=10, ipadx=10)
 
             tk.Label(
                 frame_cpu,
-                text=f"CPU {cpu.id}",
+                text="Todas" if cpu is None else f"CPU {cpu.id}",
                 font=('Segoe UI', 12, 'bold'),
                 bg='#f7fafc',
                 fg=self.colors['text_primary']
@@ -518,6 +609,8 @@ class VisualizadorProcesos:
             btn_configs = [
                 ("FCFS", lambda cpu_obj=cpu: self.configurar_algoritmo(cpu_obj, "FCFS", None)),
                 ("SJF", lambda cpu_obj=cpu: self.configurar_algoritmo(cpu_obj, "SJF", None)),
+                ("SRTF", lambda cpu_obj=cpu: self.configurar_algoritmo(cpu_obj, "SRTF", None)),
+                ("Prioridad Exp.", lambda cpu_obj=cpu: self.configurar_algoritmo(cpu_obj, "Prioridad Expropiativa", None)),
                 ("Round Robin", lambda cpu_obj=cpu: self.abrir_config_rr(cpu_obj)),
                 ("Multinivel", lambda cpu_obj=cpu: self.configurar_algoritmo(cpu_obj, "Multinivel", None))
             ]
@@ -537,6 +630,15 @@ class VisualizadorProcesos:
                 )
                 btn.grid(row=0, column=2+idx, padx=5)
 
+        if len(self.cpus) > self.CPUS_EN_CONFIG:
+            tk.Label(
+                content,
+                text=f"... y {len(self.cpus) - self.CPUS_EN_CONFIG} CPUs más (se configuran con \"Todas\")",
+                font=('Segoe UI', 10),
+                bg='white',
+                fg=self.colors['text_secondary']
+            ).pack(anchor='w')
+
         # Controles globales de multinivel
         controls_frame = tk.Frame(ventana_config, bg='white')
         controls_frame.pack(fill=tk.X, padx=20, pady=10)
@@ -550,12 +652,38 @@ class VisualizadorProcesos:
         entry_q.insert(0, str(self.default_rr_quantum))
         entry_q.grid(row=0, column=3, padx=(5, 20))
 
+        tk.Label(controls_frame, text="Reparto:", bg='white', fg=self.colors['text_primary']).grid(row=0, column=4, sticky='w')
+        combo_reparto = ttk.Combobox(controls_frame, values=['umbral', *ESTRATEGIAS], width=12, state='readonly')
+        combo_reparto.set(self.reparto)
+        combo_reparto.grid(row=0, column=5, padx=5)
+
+        tk.Label(controls_frame, text="Cambio de contexto (s):", bg='white', fg=self.colors['text_primary']).grid(row=1, column=0, sticky='w', pady=(8, 0))
+        entry_cambio = tk.Entry(controls_frame, width=6)
+        entry_cambio.insert(0, str(self.motor.cambio_contexto))
+        entry_cambio.grid(row=1, column=1, padx=(5, 20), pady=(8, 0))
+
+        tk.Label(controls_frame, text="Costo de migración (s):", bg='white', fg=self.colors['text_primary']).grid(row=1, column=2, sticky='w', pady=(8, 0))
+        entry_migracion = tk.Entry(controls_frame, width=6)
+        entry_migracion.insert(0, str(self.motor.costo_migracion))
+        entry_migracion.grid(row=1, column=3, padx=(5, 20), pady=(8, 0))
+
         def guardar_configs():
             try:
                 th = int(entry_thresh.get())
                 qv = float(entry_q.get())
+                cambio = max(0.0, float(entry_cambio.get()))
+                migracion = max(0.0, float(entry_migracion.get()))
                 self.priority_threshold = max(0, min(10, th))
                 self.default_rr_quantum = max(0.01, qv)
+                self.reparto = combo_reparto.get()
+                if self.reparto == 'umbral':
+                    asignador = AsignadorUmbral(self.priority_threshold, self.default_rr_quantum)
+                else:
+                    asignador = crear_despachador(self.reparto)
+                with self.sim_lock:
+                    self.asignador = self.motor.asignador = asignador
+                    self.motor.cambio_contexto = cambio
+                    self.motor.costo_migracion = migracion
                 messagebox.showinfo("Configuración", "Parámetros actualizados")
             except ValueError:
                 messagebox.showerror("Error", "Valores inválidos")
@@ -577,13 +705,37 @@ class VisualizadorProcesos:
         ).pack(pady=5)
 
     def configurar_algoritmo(self, cpu, algoritmo, quantum):
-        cpu.algorithm = algoritmo
-        cpu.quantum = quantum
-        messagebox.showinfo("Configuración", f"CPU {cpu.id} configurada con {algoritmo}")
+        """Cambiar el algoritmo de `cpu` (None: de todas las CPUs)"""
+        with self.sim_lock:
+            for destino in self.cpus if cpu is None else (cpu,):
+                destino.algorithm = algoritmo
+                destino.quantum = quantum
+                self._cpus_sucias.add(destino.id)
+        nombre = "Todas las CPUs configuradas" if cpu is None else f"CPU {cpu.id} configurada"
+        messagebox.showinfo("Configuración", f"{nombre} con {algoritmo}")
+
+    def _cambiar_topologia(self, cantidad, por_grupo):
+        """Rehacer las CPUs con otra cantidad y agrupamiento sin perder la corrida"""
+        cpus = crear_topologia(cantidad, por_grupo)
+        # cada CPU nueva toma el algoritmo de una anterior, cíclicamente (un grupo, el de su primera)
+        for cpu, previa in zip(cpus, itertools.cycle(self.cpus)):
+            if cpu.grupo is not None and cpu is not cpu.grupo.cpus[0]:
+                continue
+            if previa.algorithm == "Multinivel":
+                cola = previa.procesos
+                cpu.configurar_multinivel(cola.quanta, cola.boost, cola.envejecimiento)
+            else:
+                cpu.algorithm, cpu.quantum = previa.algorithm, previa.quantum
+        with self.sim_lock:
+            self.motor.cambiar_cpus(cpus)
+            self.cpus = cpus
+        self.metric_cpus.config(text=str(len(cpus)))
+        self._poblar_panel_cpus()
 
     def abrir_config_rr(self, cpu):
+        nombre = "todas las CPUs" if cpu is None else f"CPU {cpu.id}"
         ventana_rr = tk.Toplevel(self.root)
-        ventana_rr.title(f"Configurar Quantum - CPU {cpu.id}")
+        ventana_rr.title(f"Configurar Quantum - {nombre}")
         ventana_rr.geometry("400x250")
         ventana_rr.configure(bg='white')
 
@@ -592,7 +744,7 @@ class VisualizadorProcesos:
         header.pack_propagate(False)
         tk.Label(
             header,
-            text=f"Quantum CPU {cpu.id}",
+            text=f"Quantum {nombre}",
             font=('Segoe UI', 14, 'bold'),
             bg=self.colors['bg_header'],
             fg='white'
@@ -616,7 +768,8 @@ class VisualizadorProcesos:
             bg='#f7fafc',
             justify='center'
         )
-        entry_quantum.insert(0, str(cpu.quantum) if cpu.quantum is not None else str(self.default_rr_quantum))
+        quantum = cpu.quantum if cpu is not None else None
+        entry_quantum.insert(0, str(quantum) if quantum is not None else str(self.default_rr_quantum))
         entry_quantum.pack(fill=tk.X, ipady=10, pady=10)
 
         def guardar_rr():
@@ -640,7 +793,7 @@ class VisualizadorProcesos:
             pady=12
         ).pack(pady=15)
 
-    def abrir_simulador_en_vivo(self):
+    def abrir_simulador_en_vivo(self, conservar_gantt=False):
         if self.sim_running:
             messagebox.showinfo("Simulación", "La simulación ya está en ejecución.")
             return
@@ -673,38 +826,32 @@ class VisualizadorProcesos:
         right_frame = tk.Frame(main_container, bg='white')
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 
-        # Panel de CPUs
-        self.cpu_frames = {}
-        for cpu in self.cpus:
-            f = tk.LabelFrame(
-                left_frame,
-                text=f"💻 CPU {cpu.id}",
-                font=('Segoe UI', 11, 'bold'),
-                bg='white',
-                fg=self.colors['text_primary'],
-                padx=10,
-                pady=10
-            )
-            f.pack(fill=tk.X, padx=10, pady=8)
-
-            lbl_running = tk.Label(
-                f,
-                text="Ejecutando: -",
-                font=('Segoe UI', 10),
-                bg='white',
-                fg=self.colors['text_primary']
-            )
-            lbl_running.pack(anchor="w", pady=(0, 5))
-
-            lst_queue = tk.Listbox(
-                f,
-                height=4,
-                font=('Segoe UI', 9),
-                bg='#f7fafc',
-                relief=tk.FLAT
-            )
-            lst_queue.pack(fill=tk.X, pady=5)
-            self.cpu_frames[cpu.id] = (lbl_running, lst_queue)
+        # Panel de CPUs: una fila por CPU; en cada refresco solo se tocan las que cambiaron
+        cpus_frame = tk.LabelFrame(
+            left_frame,
+            text="💻 CPUs",
+            font=('Segoe UI', 11, 'bold'),
+            bg='white',
+            fg=self.colors['text_primary'],
+            padx=10,
+            pady=10
+        )
+        cpus_frame.pack(fill=tk.X, padx=10, pady=8)
+        scroll_cpus = ttk.Scrollbar(cpus_frame)
+        scroll_cpus.pack(side=tk.RIGHT, fill=tk.Y)
+        self.arbol_cpus = ttk.Treeview(
+            cpus_frame,
+            columns=("CPU", "Ejecutando", "Algoritmo", "Cola"),
+            show="headings",
+            height=10,
+            yscrollcommand=scroll_cpus.set
+        )
+        scroll_cpus.config(command=self.arbol_cpus.yview)
+        for col, width in (("CPU", 60), ("Ejecutando", 75), ("Algoritmo", 95), ("Cola", 120)):
+            self.arbol_cpus.heading(col, text=col)
+            self.arbol_cpus.column(col, width=width, anchor='w')
+        self.arbol_cpus.pack(fill=tk.X)
+        self._poblar_panel_cpus()
 
         # Métricas
         metrics_frame = tk.LabelFrame(
@@ -736,6 +883,15 @@ class VisualizadorProcesos:
         )
         self.completed_label.pack(anchor="w", pady=2)
 
+        self.utilizacion_label = tk.Label(
+            metrics_frame,
+            text="Utilización: 0%",
+            font=('Segoe UI', 10),
+            bg='white',
+            fg=self.colors['text_primary']
+        )
+        self.utilizacion_label.pack(anchor="w", pady=2)
+
         # Controles
         ctrl_frame = tk.Frame(left_frame, bg='white')
         ctrl_frame.pack(fill=tk.X, padx=10, pady=15)
@@ -774,17 +930,19 @@ class VisualizadorProcesos:
 
         self.gantt_canvas = tk.Canvas(right_frame, bg='white')
         self.gantt_canvas.pack(fill=tk.BOTH, expand=True)
+        self.vista_gantt = VistaGantt(self.gantt_canvas, ventana=20.0)
 
-        self.gantt_segments = []
-        self.sim_time = 0.0
+        if not conservar_gantt:
+            self.gantt_segments.limpiar()
         self.sim_tick = 0.1
 
-        self.sim_thread = threading.Thread(target=self._simulation_loop, daemon=True)
         self.sim_running = False
         self.sim_pause = True
-        self.sim_thread.start()
+        if self.sim_thread is None or not self.sim_thread.is_alive():
+            self.sim_thread = threading.Thread(target=self._simulation_loop, daemon=True)
+            self.sim_thread.start()
 
-        self._assign_new_processes()
+        self.asignar_procesos_a_cpus(silent=True)
         self._gui_update()
 
     def start_simulation(self):
@@ -803,19 +961,10 @@ class VisualizadorProcesos:
         self.sim_pause = True
         self.metric_status.config(text="Detenido")
 
-    def _assign_new_processes(self):
-        # Detectar si hay procesos en la lista que no están en el set de asignados
-        unassigned = [p for p in self.procesos if p.pid not in self.assigned_pids]
-        
-        if not unassigned:
-            return
-
-        # Llamamos a la asignación en modo SILENCIOSO para no interrumpir la simulación
-        self.asignar_procesos_a_cpus(silent=True)
-
     def _simulation_loop(self):
-        # Este hilo se encarga de la lógica----------- cualquier actualización de GUI se hace con root.after
-        last_assign_check = time.time()
+        # Este hilo solo marca el ritmo: la lógica de planificación vive en el motor
+        # y cualquier actualización de GUI se hace con root.after
+        ultimo_punto_control = time.time()
         while True:
             time.sleep(0.01)
             if not self.sim_running or self.sim_pause:
@@ -823,86 +972,14 @@ class VisualizadorProcesos:
                 continue
 
             with self.sim_lock:
-                # Chequear procesos nuevos cada 0.5s
-                if time.time() - last_assign_check > 0.5:
-                    self._assign_new_processes()
-                    last_assign_check = time.time()
-
-                # Avanzar simulación por tick
-                self.sim_time += self.sim_tick
-
-                for cpu in self.cpus:
-                    # Asegurar que la cola respete el algoritmo
-                    if cpu.algorithm == "SJF":
-                        cpu.procesos.sort(key=lambda p: p.remaining_time)
-
-                    # Obtener proceso en ejecución (head of queue)
-                    if not cpu.procesos:
-                        continue
-
-                    current = cpu.procesos[0]
-
-                    # Determinar slice (considerar RR quantum)
-                    slice_time = self.sim_tick
-                    if cpu.algorithm == "Round Robin" and cpu.quantum:
-                        if not hasattr(current, 'rr_used'):
-                            current.rr_used = 0.0
-                        remaining_quantum = cpu.quantum - current.rr_used
-                        slice_time = min(slice_time, remaining_quantum)
-
-                    # Ejecutar slice
-                    executed = min(slice_time, current.remaining_time)
-                    current.remaining_time -= executed
-                    if cpu.algorithm == "Round Robin" and cpu.quantum:
-                        current.rr_used += executed
-
-                    # Agregar segmento Gantt (apilar si el último segmento es del mismo pid y cpu)
-                    if executed > 0:
-                        self._append_gantt_segment(cpu.id, current.pid, self.sim_time - executed, executed)
-
-                    # Si el proceso terminó
-                    if current.remaining_time <= 1e-9:
-                        finish_time = self.sim_time
-                        turnaround = finish_time - current.arrival_time
-                        waiting = turnaround - current.cpu_time
-                        self.completed_info[current.pid] = {
-                            'completion': finish_time,
-                            'turnaround': turnaround,
-                            'waiting': waiting
-                        }
-                        # Guardar en archivo .txt
-                        self.guardar_en_txt(current, self.completed_info[current.pid])
-
-                        # eliminar proceso
-                        try:
-                            cpu.procesos.pop(0)
-                        except Exception:
-                            pass
-                        # limpiar rr_used si existe
-                        if hasattr(current, 'rr_used'):
-                            try:
-                                delattr(current, 'rr_used')
-                            except Exception:
-                                try:
-                                    del current.rr_used
-                                except Exception:
-                                    pass
-                        # reset assigned set to allow re-adding with same PID if user wants
-                        self.assigned_pids.discard(current.pid)
-                    else:
-                        # En RR, si quantum usado, mover al final
-                        if cpu.algorithm == "Round Robin" and cpu.quantum:
-                            if current.rr_used >= cpu.quantum - 1e-9:
-                                # reset contador rr_used para la siguiente vez
-                                try:
-                                    current.rr_used = 0.0
-                                except Exception:
-                                    pass
-                                try:
-                                    cpu.procesos.append(cpu.procesos.pop(0))
-                                except Exception:
-                                    pass
-                        # En FCFS o SJF no preemption (tal como está diseñado)
+                # Avanzar la simulación un tick: el motor toma los procesos nuevos
+                # de su cola de entrada y procesa todas las llegadas,
+                # expiraciones de quantum y finalizaciones del intervalo
+                self.motor.avanzar_hasta(self.motor.sim_time + self.sim_tick)
+
+                if time.time() - ultimo_punto_control > self.punto_control_cada:
+                    self._guardar_punto_control()
+                    ultimo_punto_control = time.time()
 
                 # Usamos un contador simple para actualizar la GUI 1 de cada 3 ticks
                 if not hasattr(self, '_frame_skip'): self._frame_skip = 0
@@ -912,63 +989,129 @@ class VisualizadorProcesos:
                     self.root.after(0, self._gui_update)
                     self._frame_skip = 0
 
-            # ritmo de la simulación
+            # ritmo de la simulación (solo visual, el motor no duerme)
             time.sleep(self.sim_tick)
 
-    def _append_gantt_segment(self, cpu_id, pid, start, duration):
-            # Generar color consistente basado en el PID (Hash visual)
-            # Esto asegura que el P1 siempre sea del mismo color, P2 de otro, etc.
-            import hashlib
-            hash_obj = hashlib.md5(str(pid).encode())
-            hex_color = '#' + hash_obj.hexdigest()[:6]
-            
-            # Intentar fusionar con el último segmento DE ESTA MISMA CPU
-            merged = False
-            # Miramos los últimos 4 segmentos (porque tienes 4 CPUs)
-            limit = min(len(self.gantt_segments), 10) 
-            
-            for i in range(1, limit + 1):
-                idx = -i
-                seg = self.gantt_segments[idx]
-                
-                if seg['cpu_id'] == cpu_id:
-                    # Es mi CPU. ¿Es mi mismo proceso y es contiguo?
-                    # Usamos una tolerancia de 0.05s para errores de flotante
-                    ends_at = seg['start'] + seg['duration']
-                    if seg['pid'] == pid and abs(ends_at - start) < 0.05:
-                        self.gantt_segments[idx]['duration'] += duration
-                        merged = True
-                    break # Encontré mi CPU, dejo de buscar
-            
-            if not merged:
-                self.gantt_segments.append({
-                    'cpu_id': cpu_id,
-                    'pid': pid,
-                    'start': start,
-                    'duration': duration,
-                    'color': hex_color # Usamos el color único generado
-                })
+    # ------------------------- puntos de control -------------------------
+    def _guardar_punto_control(self):
+        """Capturar el estado (con sim_lock tomado) y pasarlo al hilo escritor"""
+        if self.escritor_pc is None:
+            self.escritor_pc = puntos_control.EscritorPuntosControl(self.punto_control)
+        self.escritor_pc.enviar(puntos_control.capturar(
+            motor=self.motor,
+            procesos=self.procesos,
+            segmentos=self.gantt_segments,
+        ))
+
+    def abrir_punto_control(self):
+        """Restaurar un punto de control (de la GUI o de simular.py) para seguir o revisar la corrida"""
+        ruta = filedialog.askopenfilename(
+            title="Abrir punto de control",
+            filetypes=[("Punto de control", "*" + puntos_control.EXTENSION), ("Todos", "*.*")]
+        )
+        if not ruta:
+            return
+        try:
+            estado = puntos_control.cargar(ruta)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Punto de control", str(e))
+            return
 
-    def _gui_update(self):
-        # Actualizar labels y colas por CPU
+        self.stop_simulation()
+        if self.importador is not None:
+            self.importador.detener()  # entregaba al motor que se reemplaza
+        with self.sim_lock:
+            for p in self.procesos:
+                self.vista_tabla.quitar(p.pid)
+            self.motor = estado['motor']
+            self.motor.suscribir(self._on_evento_motor)
+            self.motor.suscribir(self.registro.al_evento)
+            carga = estado.get('carga')
+            if carga is not None:
+                carga.reconectar(self.motor)
+            self.cpus = self.motor.cpus
+            self.asignador = self.motor.asignador
+            self.completed_info = self.motor.completados
+            # Los de simular.py no traen la lista de la GUI: solo se revisa el Gantt
+            self.procesos = estado.get('procesos', [])
+            self.gantt_segments = estado['segmentos']
+            for p in self.procesos:
+                self.vista_tabla.agregar(p)
+
+        self.metric_cpus.config(text=str(len(self.cpus)))
+        self.actualizar_tabla()
+        try:
+            self.sim_win.destroy()
+        except Exception:
+            pass
+        self.abrir_simulador_en_vivo(conservar_gantt=True)
+
+    def _on_evento_motor(self, evento):
+        """Consumidor de eventos del motor (se llama con sim_lock tomado)"""
+        self._cpus_sucias.add(evento.cpu_id)
+        if evento.tipo == 'ejecucion':
+            self.gantt_segments.agregar(evento.cpu_id, evento.proceso.pid,
+                                        evento.tiempo - evento.duracion, evento.duracion)
+            self.vista_tabla.marcar(evento.proceso)
+        elif evento.tipo in ('llegada', 'fin', 'migracion', 'bloqueo', 'desbloqueo'):
+            self.vista_tabla.marcar(evento.proceso)
+
+    def _poblar_panel_cpus(self):
+        """Una fila por CPU (al abrir la ventana o al cambiar la topología)"""
+        arbol = getattr(self, 'arbol_cpus', None)
+        if arbol is None or not arbol.winfo_exists():
+            return
+        arbol.delete(*arbol.get_children())
+        self._cpus_panel = {cpu.id: cpu for cpu in self.cpus}
         for cpu in self.cpus:
-            lbl, lst = self.cpu_frames[cpu.id]
-            running = cpu.procesos[0].pid if cpu.procesos else '-'
-            lbl.config(text=f"Ejecutando: {running} ({cpu.algorithm})")
-            lst.delete(0, tk.END)
-            for p in cpu.procesos[1:]:
-                lst.insert(tk.END, f"P{p.pid} ({p.remaining_time:.2f}s) Pri:{getattr(p, 'priority', '-')}")
-            # también mostrar head (si existe)
-            if cpu.procesos:
-                lst_head = cpu.procesos[0]
-                # mostrar como primer elemento en la lista de la CPU (por claridad)
-                lst.insert(0, f"[HEAD] P{lst_head.pid} ({lst_head.remaining_time:.2f}s) Pri:{getattr(lst_head,'priority','-')}")
+            arbol.insert('', tk.END, iid=str(cpu.id), values=(f"CPU {cpu.id}", "-", cpu.algorithm, "0"))
+        self._cpus_sucias = set(self._cpus_panel)
+
+    def _fila_cpu(self, cpu):
+        """Valores y tags de la fila de una CPU en el panel"""
+        grupo = f" G{cpu.grupo.id}" if cpu.grupo is not None else ""
+        primeros = " ".join(f"P{p.pid}" for p in itertools.islice(cpu.procesos, self.PIDS_EN_COLA))
+        cola = f"{len(cpu.procesos)}: {primeros}" if primeros else "0"
+        if cpu.actual is None:
+            return (f"CPU {cpu.id}{grupo}", "-", cpu.algorithm, cola), ()
+        pid = cpu.actual.pid
+        # mismo color que su barra en el Gantt
+        tag = f"pid{pid}"
+        self.arbol_cpus.tag_configure(tag, background=paleta.color(pid), foreground=paleta.color_texto(pid))
+        return (f"CPU {cpu.id}{grupo}", f"P{pid}", cpu.algorithm, cola), (tag,)
+
+    def _gui_update(self):
+        # Solo las CPUs con eventos desde el último refresco (con cientos de CPUs
+        # la mayoría no cambia); en un grupo la cola es de todas sus CPUs
+        with self.sim_lock:
+            sucias, self._cpus_sucias = self._cpus_sucias, set()
+            for cpu_id in sucias:
+                cpu = self._cpus_panel.get(cpu_id)
+                if cpu is None:
+                    continue
+                for miembro in cpu.grupo.cpus if cpu.grupo is not None else (cpu,):
+                    valores, tags = self._fila_cpu(miembro)
+                    self.arbol_cpus.item(str(miembro.id), values=valores, tags=tags)
 
         # métricas
-        completed_count = len(self.completed_info)
-        avg_wait = (sum(info['waiting'] for info in self.completed_info.values()) / completed_count) if completed_count else 0.0
-        self.avg_wait_label.config(text=f"Espera promedio: {avg_wait:.2f}s")
+        # agregados incrementales del motor: coste constante por refresco
+        espera = self.motor.metricas.espera
+        completed_count = espera.n
+        texto = f"Espera promedio: {espera.media:.2f}s (p95: {espera.cuantil(0.95):.2f}s)"
+        niveles = self.motor.esperas_por_nivel()  # solo si hay CPUs en Multinivel
+        if niveles:
+            texto += "\nPor nivel: " + " / ".join(f"N{i} {a.media:.2f}s" for i, a in enumerate(niveles))
+        respuesta = self.motor.metricas.respuesta
+        texto += f"\nRespuesta promedio: {respuesta.media:.2f}s (p95: {respuesta.cuantil(0.95):.2f}s)"
+        self.avg_wait_label.config(text=texto, justify=tk.LEFT)
         self.completed_label.config(text=f"Procesos completados: {completed_count}")
+        utilizacion = self.motor.utilizacion()
+        self.utilizacion_label.config(
+            text=f"Utilización: {sum(utilizacion.values()) / len(utilizacion):.0%} "
+                 f"(desbalance {self.motor.desbalance():.0%}, migraciones {self.motor.migraciones}, "
+                 f"sobrecarga {self.motor.sobrecarga():.1%})"
+                 + "".join(f"\nE/S {nombre}: {u:.0%}" for nombre, u in sorted(self.motor.utilizacion_es().items())),
+            justify=tk.LEFT)
 
         # actualizar Gantt
         self._draw_gantt()
@@ -976,83 +1119,8 @@ class VisualizadorProcesos:
         # también actualizar la tabla principal
         self.actualizar_tabla()
     def _draw_gantt(self):
-        self.gantt_canvas.delete("all")
-        
-        # --- CONFIGURACIÓN DE ZOOM ---
-        window_size = 20.0  # <--- HE BAJADO ESTO A 20s PARA QUE SE VEA MÁS GRANDE
-        current_time = self.sim_time
-        start_visible_time = max(0.0, current_time - window_size)
-        
-        # Configuración visual
-        x_start, y_base = 60, 40
-        row_height = 50     # <--- MÁS ALTO PARA QUE RESPIRE
-        bar_height = 30     # <--- ALTURA DE LA BARRA
-        
-        canvas_width = self.gantt_canvas.winfo_width()
-        if canvas_width <= 1: canvas_width = 800 
-        scale = (canvas_width - x_start - 20) / window_size
-
-        # 1. Etiquetas CPU
-        for i, cpu in enumerate(self.cpus):
-            y_pos = y_base + i * row_height
-            # Fondo de la fila
-            self.gantt_canvas.create_rectangle(0, y_pos, canvas_width, y_pos + row_height, fill="#f8f9fa", outline="")
-            # Texto
-            self.gantt_canvas.create_text(30, y_pos + row_height/2, text=f"CPU {cpu.id}", font=('Segoe UI', 9, 'bold'))
-            # Línea divisoria
-            self.gantt_canvas.create_line(x_start, y_pos + row_height, canvas_width, y_pos + row_height, fill="#e2e8f0")
-
-        # 2. Regla de Tiempo
-        time_step = 2 # Marcas cada 2 segundos
-        first_tick = int(start_visible_time // time_step) * time_step
-        for t in range(first_tick, int(current_time) + time_step + 1, time_step):
-            if t < start_visible_time: continue
-            x_pos = x_start + (t - start_visible_time) * scale
-            if x_pos > canvas_width: break
-            
-            self.gantt_canvas.create_line(x_pos, y_base, x_pos, y_base + (len(self.cpus)*row_height), fill="#cbd5e0", dash=(2,4))
-            self.gantt_canvas.create_text(x_pos, y_base - 15, text=f"{t}s", font=('Segoe UI', 8))
-
-        # 3. Segmentos visibles
-        for seg in self.gantt_segments:
-            seg_end = seg['start'] + seg['duration']
-            if seg_end < start_visible_time: continue
-            if seg['start'] > current_time: break
-
-            draw_start = max(seg['start'], start_visible_time)
-            draw_end = min(seg_end, current_time)
-            
-            x1 = x_start + (draw_start - start_visible_time) * scale
-            x2 = x_start + (draw_end - start_visible_time) * scale
-            
-            if x2 - x1 < 1: continue
-
-            # Centrar la barra en la fila
-            y_center = y_base + (seg['cpu_id'] - 1) * row_height + (row_height/2)
-            y1 = y_center - (bar_height/2)
-            y2 = y_center + (bar_height/2)
-
-            # --- DIBUJAR CON BORDE NEGRO ---
-            self.gantt_canvas.create_rectangle(
-                x1, y1, x2, y2, 
-                fill=seg['color'], 
-                outline='black',  # <--- ESTO DA EL EFECTO DE BLOQUE SÓLIDO
-                width=1
-            )
-            
-            # Texto PID (Solo si cabe)
-            if x2 - x1 > 25:
-                # Color de texto inteligente (blanco o negro según brillo)
-                self.gantt_canvas.create_text(
-                    (x1 + x2) / 2, y_center, 
-                    text=f"P{seg['pid']}", 
-                    font=('Segoe UI', 8, 'bold'), 
-                    fill="white" # Simplificado a blanco con sombra negra si quieres
-                )
-
-        # 4. Línea "Ahora"
-        now_x = x_start + (current_time - start_visible_time) * scale
-        self.gantt_canvas.create_line(now_x, y_base - 10, now_x, y_base + (len(self.cpus)*row_height), fill="#e53e3e", width=2) 
+        # escena retenida: solo se mueven/ajustan los items que cambiaron
+        self.vista_gantt.dibujar(self.gantt_segments, self.cpus, self.motor.sim_time)
 
     # ------------------------- utilidades limpiado -------------------------
     def close(self):
@@ -1063,19 +1131,11 @@ class VisualizadorProcesos:
             self.sim_win.destroy()
         except Exception:
             pass
-
-    def guardar_en_txt(self, proceso, metrics):
-        try:
-            with open("procesos_terminados.csv", "a", encoding="utf-8") as f:
-                f.write(
-                    f"PID: {proceso.pid}, "
-                    f"Nombre: {proceso.nombre}, "
-                    f"CPU: {getattr(proceso, 'cpu_id', '-')}, "
-                    f"CPU Time: {proceso.cpu_time:.2f}, "
-                    f"Arrival: {datetime.fromtimestamp(proceso.arrival_time)}, "
-                    f"Completion: {metrics['completion']:.2f}, "
-                    f"Turnaround: {metrics['turnaround']:.2f}, "
-                    f"Waiting: {metrics['waiting']:.2f}\n"
-                )
-        except Exception as e:
-            print("Error al guardar:", e)
+        if self.importador is not None:
+            self.importador.detener()
+        if self.escritor_pc is not None:
+            with self.sim_lock:
+                self._guardar_punto_control()
+            self.escritor_pc.cerrar()
+        # escribir lo que quede en el buffer del log
+        self.registro.cerrar()